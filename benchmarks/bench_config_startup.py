@@ -0,0 +1,307 @@
+"""Benchmark the startup cost of ConfigLoader and ConfigValidator.
+
+Module imports are timed in fresh interpreters. Config reading, rule compilation, validation and a full
+ConfigLoader run are timed separately, on synthetic configs that grow with --sizes. A size of N adds
+N synthetic keys (each with its own rule) and N * 10 target projects on top of the required keys.
+
+    python benchmarks/bench_config_startup.py --sizes 0 100 1000
+    python benchmarks/bench_config_startup.py --profile benchmarks/results --tracemalloc
+    python benchmarks/bench_config_startup.py --importtime modules.config_loader
+    python benchmarks/bench_config_startup.py --compare benchmarks/results/<earlier run>.json
+"""
+import argparse
+import contextlib
+import cProfile
+import io
+import logging
+import os
+import pstats
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Any, List, Callable
+
+import yaml
+
+# Add the project root to sys.path to ensure 'modules' can be imported
+current_file_path = os.path.abspath(__file__)
+benchmarks_dir = os.path.dirname(current_file_path)
+project_root = os.path.dirname(benchmarks_dir)
+sys.path.append(project_root)
+sys.path.append(benchmarks_dir)
+
+from bench_utils import environment_info, percent_change, read_results, write_results
+
+IMPORT_TARGETS = [
+    "yaml",
+    "pandas",
+    "aiohttp",
+    "modules.yaml_loader",
+    "modules.prepare_logger",
+    "modules.config_loader",
+    "modules.request_handler.async_request_handler",
+]
+
+VALID_TOKEN = "Bearer 9bbf04fd-aed2-4e05-8428-7fc5ecff7bb8"
+
+def time_import(module_name: str, repeat: int) -> Dict[str, Any]:
+    """Time importing module_name in fresh interpreters and return the median and minimum in seconds."""
+    script = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]); started = time.perf_counter(); "
+        f"import {module_name}; print(time.perf_counter() - started)"
+    )
+    samples = []
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-c", script, project_root], capture_output=True, text=True)
+        if completed.returncode != 0:
+            return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else f"exit code {completed.returncode}"}
+        samples.append(float(completed.stdout.strip()))
+    return {"median": round(statistics.median(samples), 5), "min": round(min(samples), 5)}
+
+def import_breakdown(module_name: str, top: int) -> List[str]:
+    """Return the slowest imports (by cumulative time) pulled in by module_name, using -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys; sys.path.insert(0, sys.argv[1]); import {module_name}", project_root],
+        capture_output=True, text=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    rows.sort(reverse=True)
+    return [f"{cumulative / 1000:>9.1f} ms cumulative {self_time / 1000:>8.1f} ms self  {name}" for cumulative, self_time, name in rows[:top]]
+
+def write_synthetic_config(work_dir: Path, size: int) -> Dict[str, Path]:
+    """Write a rules directory, auth file and config with size synthetic keys and size * 10 target projects."""
+    rules_dir = work_dir / "validation"
+    rules_dir.mkdir(parents=True, exist_ok=True)
+    source_rules_dir = Path(project_root) / "configs" / "validation"
+
+    synthetic_rules = {}
+    synthetic_values = {}
+    for index in range(size):
+        key = f"synthetic_key_{index}"
+        kind = index % 4
+        if kind == 0:
+            synthetic_rules[key] = {"required": False, "validation": [{"validate_int_range": {"min_value": 0, "max_value": 1000000}}]}
+            synthetic_values[key] = index
+        elif kind == 1:
+            synthetic_rules[key] = {"required": False, "validation": [{"validate_option": {"allowed_values": ["low", "medium", "high"]}}]}
+            synthetic_values[key] = "medium"
+        elif kind == 2:
+            synthetic_rules[key] = {"required": False, "validation": ["validate_non_empty_string"]}
+            synthetic_values[key] = f"value {index}"
+        else:
+            synthetic_rules[key] = {"required": False, "validation": ["validate_int_list"]}
+            synthetic_values[key] = [index, index + 1, index + 2]
+
+    config_rules_text = (source_rules_dir / "config_rules.yaml").read_text()
+    if synthetic_rules:
+        config_rules_text += "\n\n" + yaml.safe_dump(synthetic_rules, sort_keys=False)
+    (rules_dir / "config_rules.yaml").write_text(config_rules_text)
+    (rules_dir / "auth_rules.yaml").write_text((source_rules_dir / "auth_rules.yaml").read_text())
+
+    auth_path = work_dir / "auth.yaml"
+    auth_path.write_text(yaml.safe_dump({"qTest_bearer_token": VALID_TOKEN}))
+
+    config = {
+        "qTest Domain": "https://example.qtestnet.com/",
+        "Authentication Path": str(auth_path),
+        "Target Projects": [100000 + index for index in range(max(size * 10, 1))],
+        "Max Concurrent Requests": 10,
+        "output_filetype": "sqlite",
+        **synthetic_values,
+    }
+    config_path = work_dir / "config.yaml"
+    config_path.write_text(yaml.safe_dump(config, sort_keys=False))
+    return {"config_path": config_path, "rules_dir": rules_dir, "rules_path": rules_dir / "config_rules.yaml"}
+
+def clear_caches() -> None:
+    """Drop the parsed YAML and compiled rule caches so the next load starts cold."""
+    from modules import config_loader, yaml_loader
+    yaml_loader.clear_cache()
+    config_loader._PLAN_CACHE.clear()
+
+def reset_logger() -> None:
+    """Close and remove the handlers prepare_logger attached so the next ConfigLoader creates them again."""
+    logger = logging.getLogger("modules.prepare_logger")
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+def measure(function: Callable[[], Any], repeat: int, before: Callable[[], None] = None) -> Dict[str, float]:
+    """Call function repeat times, running before ahead of each untimed, and return the median and minimum in seconds."""
+    samples = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return {"median": round(statistics.median(samples), 5), "min": round(min(samples), 5)}
+
+def run_size(size: int, repeat: int, work_dir: Path) -> Dict[str, Any]:
+    """Time each startup phase for one synthetic config size."""
+    from modules.config_loader import ConfigLoader, load_validation_plan, read_yaml_config
+
+    paths = write_synthetic_config(work_dir, size)
+    config = read_yaml_config(paths["config_path"])
+    plan = load_validation_plan(paths["rules_path"])
+    errors = plan.run(config)
+    if errors:
+        raise ValueError(f"Synthetic config of size {size} does not validate: {errors}")
+
+    def cold() -> None:
+        clear_caches()
+        reset_logger()
+
+    def load_config() -> None:
+        ConfigLoader(paths["config_path"], paths["rules_dir"])
+
+    # The console handler writes to sys.stdout, so keep the config dump out of the benchmark output
+    with contextlib.redirect_stdout(io.StringIO()):
+        phases = {
+            "read_config": measure(lambda: read_yaml_config(paths["config_path"]), repeat, clear_caches),
+            "compile_rules": measure(lambda: load_validation_plan(paths["rules_path"]), repeat, clear_caches),
+            "validate": measure(lambda: plan.run(config), repeat),
+            "config_loader_cold": measure(load_config, repeat, cold),
+            "config_loader_warm": measure(load_config, repeat, reset_logger),
+        }
+    reset_logger()
+
+    return {
+        "case": f"size-{size}",
+        "size": size,
+        "config_keys": len(config),
+        "target_projects": len(config["target_projects"]),
+        "rules": len(plan.rules),
+        "config_bytes": paths["config_path"].stat().st_size,
+        "rules_bytes": paths["rules_path"].stat().st_size,
+        "phases_seconds": phases,
+    }
+
+def profile_size(size: int, work_dir: Path, profile_dir: Path, top: int) -> Path:
+    """Run one cold ConfigLoader under cProfile, save the stats file and print the top functions by cumulative time."""
+    from modules.config_loader import ConfigLoader
+
+    paths = write_synthetic_config(work_dir, size)
+    clear_caches()
+    reset_logger()
+    profiler = cProfile.Profile()
+    with contextlib.redirect_stdout(io.StringIO()):
+        profiler.runcall(ConfigLoader, paths["config_path"], paths["rules_dir"])
+    reset_logger()
+
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    profile_path = profile_dir / f"config_startup-size-{size}.prof"
+    profiler.dump_stats(str(profile_path))
+    stats_output = io.StringIO()
+    pstats.Stats(profiler, stream=stats_output).sort_stats("cumulative").print_stats(top)
+    print(stats_output.getvalue())
+    return profile_path
+
+def trace_allocations(size: int, work_dir: Path, top: int) -> Dict[str, Any]:
+    """Run one cold ConfigLoader under tracemalloc and return the peak and the largest allocation sites."""
+    from modules.config_loader import ConfigLoader
+
+    paths = write_synthetic_config(work_dir, size)
+    clear_caches()
+    reset_logger()
+    tracemalloc.start(10)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            ConfigLoader(paths["config_path"], paths["rules_dir"])
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        reset_logger()
+
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    top_sites = [
+        {"site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", "kib": round(stat.size / 1024, 1), "blocks": stat.count}
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+    return {"size": size, "peak_kib": round(peak / 1024, 1), "top_sites": top_sites}
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Return one line per case and phase present in both documents with the median time change."""
+    baseline_cases = {case["case"]: case for case in baseline["cases"]}
+    lines = [f"Compared with {baseline.get('git_revision')} ({baseline.get('created')}):"]
+    for module_name, timing in current["imports_seconds"].items():
+        old = baseline.get("imports_seconds", {}).get(module_name, {})
+        lines.append(f"{'import ' + module_name:>55}: {percent_change(timing.get('median'), old.get('median')):>8}")
+    for case in current["cases"]:
+        old = baseline_cases.get(case["case"])
+        if old is None:
+            continue
+        for phase, timing in case["phases_seconds"].items():
+            lines.append(f"{case['case'] + ' ' + phase:>55}: {percent_change(timing['median'], old['phases_seconds'].get(phase, {}).get('median')):>8}")
+    return lines
+
+def main() -> int:
+    """Run the config startup benchmark and save the results as JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark ConfigLoader and ConfigValidator startup cost.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 100, 1000], help="Synthetic config sizes (default: 0 100 1000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per phase; the median and minimum are reported (default: 5)")
+    parser.add_argument("--import-repeat", type=int, default=3, help="Fresh interpreters per import timing (default: 3)")
+    parser.add_argument("--skip-imports", action="store_true", help="Do not time module imports")
+    parser.add_argument("--importtime", metavar="MODULE", default=None, help="Print the slowest imports pulled in by MODULE")
+    parser.add_argument("--profile", metavar="DIR", default=None, help="Save a cProfile stats file for the largest size to DIR and print the hot spots")
+    parser.add_argument("--tracemalloc", action="store_true", help="Record peak memory and the largest allocation sites for the largest size")
+    parser.add_argument("--top", type=int, default=20, help="Number of entries to show for --importtime, --profile and --tracemalloc")
+    parser.add_argument("--output", default=None, help="Results file (default: benchmarks/results/config_startup-<revision>-<timestamp>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    results = {"benchmark": "config_startup", **environment_info(), "imports_seconds": {}, "cases": []}
+
+    if not args.skip_imports:
+        for module_name in IMPORT_TARGETS:
+            results["imports_seconds"][module_name] = time_import(module_name, args.import_repeat)
+            print(f"{'import ' + module_name:>55}: {results['imports_seconds'][module_name]}", flush=True)
+
+    if args.importtime:
+        print("\n".join(import_breakdown(args.importtime, args.top)))
+
+    profile_dir = Path(args.profile).resolve() if args.profile else None
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="config_startup_") as temp_dir:
+        # ConfigLoader writes its log files under ./logs, so run inside the scratch directory
+        os.chdir(temp_dir)
+        try:
+            for size in args.sizes:
+                case = run_size(size, args.repeat, Path(temp_dir) / f"size_{size}")
+                results["cases"].append(case)
+                phases = "  ".join(f"{phase} {timing['median'] * 1000:.2f}ms" for phase, timing in case["phases_seconds"].items())
+                print(f"{case['case']:>12}: {phases}", flush=True)
+
+            largest = max(args.sizes)
+            if profile_dir is not None:
+                profile_path = profile_size(largest, Path(temp_dir) / "profile", profile_dir, args.top)
+                results["profile_path"] = str(profile_path)
+                print(f"cProfile stats written to '{profile_path}'")
+            if args.tracemalloc:
+                results["tracemalloc"] = trace_allocations(largest, Path(temp_dir) / "tracemalloc", args.top)
+                print(f"Peak traced memory for size {largest}: {results['tracemalloc']['peak_kib']} KiB")
+                for site in results["tracemalloc"]["top_sites"]:
+                    print(f"{site['kib']:>10} KiB {site['blocks']:>7} blocks  {site['site']}")
+        finally:
+            os.chdir(original_cwd)
+
+    output_path = write_results(results, args.output)
+    print(f"Results written to '{output_path}'")
+
+    if args.compare:
+        print("\n".join(compare(results, read_results(args.compare))))
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""Benchmark HttpRequestProcessor.make_requests against the local mock qTest server.
+
+Every case runs in a fresh process so peak RSS and CPU time belong to that case alone.
+The mock server runs in its own process and is excluded from the measurements.
+
+    python benchmarks/bench_request_handler.py --concurrency 5 20 50 --bundle-sizes 100 1000
+    python benchmarks/bench_request_handler.py --error-rate 0.02 --burst-every 200 --burst-length 10
+    python benchmarks/bench_request_handler.py --compare benchmarks/results/<earlier run>.json
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+
+# Add the project root to sys.path to ensure 'modules' can be imported
+current_file_path = os.path.abspath(__file__)
+benchmarks_dir = os.path.dirname(current_file_path)
+project_root = os.path.dirname(benchmarks_dir)
+sys.path.append(project_root)
+sys.path.append(benchmarks_dir)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from bench_utils import environment_info, percent_change, read_results, write_results
+from mock_qtest_server import MockQtestSettings, serve_forever
+
+def flatten_test_cases(config, response) -> List[Dict]:
+    """Flatten each test case's property list into columns, like the export data processors do."""
+    records = []
+    for test_case in response:
+        record = {key: value for key, value in test_case.items() if key not in ("properties", "links")}
+        for test_case_property in test_case.get("properties", []):
+            record[test_case_property["field_name"]] = test_case_property.get("field_value_name") or test_case_property.get("field_value")
+        records.append(record)
+    return records
+
+def _resource_usage() -> Dict[str, Optional[float]]:
+    """Return the CPU seconds and peak RSS in MB of the current process, or None where unsupported."""
+    if resource is None:
+        return {"cpu_seconds": time.process_time(), "peak_rss_mb": None}
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    rss_divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {"cpu_seconds": usage.ru_utime + usage.ru_stime, "peak_rss_mb": round(usage.ru_maxrss / rss_divisor, 1)}
+
+def run_case(base_url: str, concurrency: int, bundle_size: int, projects: int, retry_attempts: int, backoff_base: float, processing_mode: str, result_format: str) -> Dict[str, Any]:
+    """Run one make_requests call in the current process and return its measurements; used as a worker process target."""
+    from modules.request_handler.async_request_handler import HttpRequestProcessor
+    from modules.request_handler.metrics import RequestMetrics
+    from modules.request_handler.retry import RetryPolicy
+
+    logger = logging.getLogger("benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    config = {
+        "logger": logger,
+        "max_concurrent_requests": concurrency,
+        "connection_limit": concurrency,
+        "connection_limit_per_host": concurrency,
+        "processing_mode": processing_mode,
+        "log_progress_interval": 0,
+    }
+    request_bundle = [f"{base_url}/api/v3/projects/{index % projects + 1}/test-cases?page={index // projects + 1}" for index in range(bundle_size)]
+    metrics = RequestMetrics()
+    processor = HttpRequestProcessor(
+        config, request_bundle, {"Authorization": "Bearer benchmark"}, flatten_test_cases,
+        retry_policy=RetryPolicy(retry_attempts=retry_attempts, backoff_base=backoff_base),
+        metrics=metrics,
+    )
+
+    usage_before = _resource_usage()
+    started = time.perf_counter()
+    result = asyncio.run(processor.make_requests(config, collect_failures=True, result_format=result_format))
+    wall_seconds = time.perf_counter() - started
+    usage_after = _resource_usage()
+
+    summary = metrics.summary()
+    return {
+        "wall_seconds": round(wall_seconds, 4),
+        "requests_per_second": round(bundle_size / wall_seconds, 2),
+        "attempts_per_second": summary["requests_per_second"],
+        "attempts": summary["requests"],
+        "statuses": summary["statuses"],
+        "latency_seconds": summary["latency_seconds"],
+        "retries": summary["counters"].get("retries", 0),
+        "failed_requests": len(processor.failed_requests),
+        "rows": result.num_rows if result_format == "arrow" else len(result),
+        "cpu_seconds": round(usage_after["cpu_seconds"] - usage_before["cpu_seconds"], 4),
+        "peak_rss_mb": usage_after["peak_rss_mb"],
+        "timers_seconds": summary["timers_seconds"],
+    }
+
+def _median_run(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the run with the median throughput so the reported numbers come from one real run."""
+    ranked = sorted(runs, key=lambda run: run["requests_per_second"])
+    return ranked[len(ranked) // 2]
+
+def start_server(settings: MockQtestSettings):
+    """Start the mock server in a separate process and return the process and its base URL."""
+    context = multiprocessing.get_context("spawn")
+    port_queue = context.Queue()
+    server_process = context.Process(target=serve_forever, args=(settings.to_dict(), port_queue), daemon=True)
+    server_process.start()
+    port = port_queue.get(timeout=30)
+    return server_process, f"http://127.0.0.1:{port}"
+
+def run_matrix(settings: MockQtestSettings, concurrency_levels: List[int], bundle_sizes: List[int], repeat: int, projects: int,
+               retry_attempts: int, backoff_base: float, processing_mode: str, result_format: str) -> Dict[str, Any]:
+    """Run every concurrency/bundle size combination and return the results document."""
+    server_process, base_url = start_server(settings)
+    context = multiprocessing.get_context("spawn")
+    cases = []
+    try:
+        for bundle_size in bundle_sizes:
+            for concurrency in concurrency_levels:
+                runs = []
+                for _ in range(repeat):
+                    # One process per run so peak RSS is not inherited from earlier cases
+                    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                        runs.append(executor.submit(run_case, base_url, concurrency, bundle_size, projects, retry_attempts, backoff_base, processing_mode, result_format).result())
+                result = _median_run(runs)
+                cases.append({
+                    "case": f"c{concurrency}-n{bundle_size}",
+                    "concurrency": concurrency,
+                    "bundle_size": bundle_size,
+                    "repeat": repeat,
+                    "requests_per_second_runs": [run["requests_per_second"] for run in runs],
+                    **result,
+                })
+                print(f"{cases[-1]['case']:>14}: {result['requests_per_second']:>9.1f} req/s  "
+                      f"p50 {result['latency_seconds']['p50']}s  p99 {result['latency_seconds']['p99']}s  "
+                      f"cpu {result['cpu_seconds']}s  rss {result['peak_rss_mb']} MB  failed {result['failed_requests']}", flush=True)
+    finally:
+        server_process.terminate()
+        server_process.join()
+
+    return {
+        "benchmark": "request_handler",
+        **environment_info(),
+        "server": settings.to_dict(),
+        "options": {"projects": projects, "retry_attempts": retry_attempts, "backoff_base": backoff_base, "processing_mode": processing_mode, "result_format": result_format},
+        "cases": cases,
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Return one line per case present in both documents with the throughput, p99 latency, CPU and RSS change."""
+    baseline_cases = {case["case"]: case for case in baseline["cases"]}
+    lines = [f"Compared with {baseline.get('git_revision')} ({baseline.get('created')}):"]
+    for case in current["cases"]:
+        old = baseline_cases.get(case["case"])
+        if old is None:
+            continue
+        lines.append(
+            f"{case['case']:>14}: req/s {percent_change(case['requests_per_second'], old['requests_per_second']):>8}  "
+            f"p99 {percent_change(case['latency_seconds']['p99'], old['latency_seconds']['p99']):>8}  "
+            f"cpu {percent_change(case['cpu_seconds'], old['cpu_seconds']):>8}  "
+            f"rss {percent_change(case['peak_rss_mb'], old['peak_rss_mb']):>8}"
+        )
+    return lines
+
+def main() -> int:
+    """Run the request handler benchmark matrix and save the results as JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark HttpRequestProcessor against a local mock qTest server.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50], help="Concurrency levels to run (default: 1 10 50)")
+    parser.add_argument("--bundle-sizes", type=int, nargs="+", default=[100, 1000], help="Number of requests per run (default: 100 1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the median run is reported (default: 3)")
+    parser.add_argument("--projects", type=int, default=10, help="Number of distinct projects the requests are spread over")
+    parser.add_argument("--retry-attempts", type=int, default=3)
+    parser.add_argument("--backoff-base", type=float, default=0.05)
+    parser.add_argument("--processing-mode", default="inline", choices=["inline", "thread", "process"])
+    parser.add_argument("--result-format", default="dataframe", choices=["dataframe", "records", "arrow"])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=5.0)
+    parser.add_argument("--items-per-response", type=int, default=50)
+    parser.add_argument("--description-bytes", type=int, default=256)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--burst-every", type=int, default=0, help="Start a 429 burst every N requests (0 disables bursts)")
+    parser.add_argument("--burst-length", type=int, default=0, help="Number of consecutive 429 responses per burst")
+    parser.add_argument("--retry-after", type=int, default=0, help="Retry-After seconds sent with 429 responses")
+    parser.add_argument("--output", default=None, help="Results file (default: benchmarks/results/request_handler-<revision>-<timestamp>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    settings = MockQtestSettings(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        items_per_response=args.items_per_response,
+        description_bytes=args.description_bytes,
+        error_rate=args.error_rate,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        retry_after=args.retry_after,
+    )
+    results = run_matrix(settings, args.concurrency, args.bundle_sizes, args.repeat, args.projects,
+                         args.retry_attempts, args.backoff_base, args.processing_mode, args.result_format)
+
+    output_path = write_results(results, args.output)
+    print(f"Results written to '{output_path}'")
+
+    if args.compare:
+        baseline = read_results(args.compare)
+        print("\n".join(compare(results, baseline)))
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+import json
+import os
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BENCHMARKS_DIR.parent
+DEFAULT_RESULTS_DIR = BENCHMARKS_DIR / "results"
+
+def git_revision() -> Optional[str]:
+    """Return the current git commit of the project, or None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def environment_info() -> Dict[str, Any]:
+    """Return the run metadata stored alongside every benchmark result."""
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def write_results(results: Dict[str, Any], output: Optional[Union[str, Path]] = None) -> Path:
+    """Write results as JSON to output, or to benchmarks/results/<benchmark>-<revision>-<timestamp>.json, and return the path."""
+    if output:
+        output_path = Path(output)
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = DEFAULT_RESULTS_DIR / f"{results['benchmark']}-{results.get('git_revision') or 'nogit'}-{timestamp}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=4))
+    return output_path
+
+def read_results(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a results file written by write_results."""
+    return json.loads(Path(path).read_text())
+
+def percent_change(new: Optional[float], old: Optional[float]) -> str:
+    """Format the relative change from old to new, or 'n/a' when it cannot be computed."""
+    if new is None or old in (None, 0):
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
@@ -0,0 +1,174 @@
+import argparse
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+
+from aiohttp import web
+
+class MockQtestSettings:
+    """Response shaping knobs for the mock qTest server."""
+
+    def __init__(self, latency_ms: float = 20.0, latency_jitter_ms: float = 5.0, items_per_response: int = 50,
+                 description_bytes: int = 256, properties_per_item: int = 8, error_rate: float = 0.0,
+                 burst_every: int = 0, burst_length: int = 0, retry_after: int = 0, seed: int = 1234):
+        """Initialize the settings; a burst_every of 0 disables 429 bursts."""
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.items_per_response = items_per_response
+        self.description_bytes = description_bytes
+        self.properties_per_item = properties_per_item
+        self.error_rate = error_rate
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.retry_after = retry_after
+        self.seed = seed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the settings as a plain dict for benchmark result files."""
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "MockQtestSettings":
+        """Build settings from a dict produced by to_dict."""
+        return cls(**values)
+
+
+class MockQtestServer:
+    """Local aiohttp server that serves qTest-shaped test case JSON with configurable latency, payload size, errors and 429 bursts."""
+
+    def __init__(self, settings: Optional[MockQtestSettings] = None):
+        """Initialize the server with the given settings; call start() to begin listening."""
+        self.settings = settings or MockQtestSettings()
+        self.random = random.Random(self.settings.seed)
+        self.request_count = 0
+        self.status_counts: Dict[int, int] = {}
+        self.runner: Optional[web.AppRunner] = None
+        self.port: Optional[int] = None
+
+    def build_app(self) -> web.Application:
+        """Create the aiohttp application with the qTest routes and a stats endpoint."""
+        app = web.Application()
+        app.router.add_get("/api/v3/projects/{project_id}/test-cases", self.handle_test_cases)
+        app.router.add_get("/_stats", self.handle_stats)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start listening and return the bound port; port 0 picks a free one."""
+        self.runner = web.AppRunner(self.build_app(), access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self) -> None:
+        """Stop the server and release the port."""
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+    def _next_status(self) -> int:
+        """Decide the status for the next request from the burst schedule and error rate."""
+        self.request_count += 1
+        settings = self.settings
+        if settings.burst_every and (self.request_count % settings.burst_every) < settings.burst_length:
+            return 429
+        if settings.error_rate and self.random.random() < settings.error_rate:
+            return 500
+        return 200
+
+    def _test_case(self, project_id: int, case_id: int) -> Dict[str, Any]:
+        """Build one test case record in the shape returned by the qTest test-cases API."""
+        modified = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=case_id)
+        return {
+            "id": case_id,
+            "pid": f"TC-{case_id}",
+            "name": f"Test case {case_id}",
+            "order": case_id,
+            "project_id": project_id,
+            "parent_id": case_id // 100,
+            "description": "x" * self.settings.description_bytes,
+            "precondition": "",
+            "version": "1.0",
+            "test_case_version_id": case_id * 10,
+            "creator_id": 1,
+            "created_date": "2024-01-01T00:00:00.000+00:00",
+            "last_modified_date": modified.isoformat(timespec="milliseconds"),
+            "properties": [
+                {
+                    "field_id": 1000 + index,
+                    "field_name": f"Field {index}",
+                    "field_value": str(index),
+                    "field_value_name": f"Value {index}",
+                }
+                for index in range(self.settings.properties_per_item)
+            ],
+            "links": [{"rel": "self", "href": f"/api/v3/projects/{project_id}/test-cases/{case_id}"}],
+        }
+
+    async def handle_test_cases(self, request: web.Request) -> web.Response:
+        """Serve one page of test cases after the configured latency, or an error status."""
+        settings = self.settings
+        delay = settings.latency_ms + self.random.uniform(-settings.latency_jitter_ms, settings.latency_jitter_ms)
+        await asyncio.sleep(max(delay, 0) / 1000)
+
+        status = self._next_status()
+        self.status_counts[status] = self.status_counts.get(status, 0) + 1
+        if status == 429:
+            return web.json_response({"message": "Too many requests"}, status=429, headers={"Retry-After": str(settings.retry_after)})
+        if status != 200:
+            return web.json_response({"message": "Internal server error"}, status=status)
+
+        project_id = int(request.match_info["project_id"])
+        page = int(request.query.get("page", 1))
+        size = int(request.query.get("size", settings.items_per_response))
+        first_id = project_id * 1_000_000 + (page - 1) * size
+        items = [self._test_case(project_id, first_id + offset) for offset in range(size)]
+        return web.Response(text=json.dumps(items), content_type="application/json")
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        """Report how many requests were served with each status."""
+        return web.json_response({"requests": self.request_count, "statuses": {str(status): count for status, count in self.status_counts.items()}})
+
+
+def serve_forever(settings: Dict[str, Any], port_queue, host: str = "127.0.0.1", port: int = 0) -> None:
+    """Run the server until the process is terminated, reporting the bound port on port_queue; used as a process target."""
+    async def run() -> None:
+        server = MockQtestServer(MockQtestSettings.from_dict(settings))
+        port_queue.put(await server.start(host, port))
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+def main() -> None:
+    """Run the mock server from the command line."""
+    parser = argparse.ArgumentParser(description="Serve qTest-shaped JSON for request handler benchmarks.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=5.0)
+    parser.add_argument("--items-per-response", type=int, default=50)
+    parser.add_argument("--description-bytes", type=int, default=256)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--burst-every", type=int, default=0, help="Start a 429 burst every N requests (0 disables bursts)")
+    parser.add_argument("--burst-length", type=int, default=0, help="Number of consecutive 429 responses per burst")
+    parser.add_argument("--retry-after", type=int, default=0, help="Retry-After seconds sent with 429 responses")
+    args = parser.parse_args()
+
+    settings = MockQtestSettings(
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        items_per_response=args.items_per_response,
+        description_bytes=args.description_bytes,
+        error_rate=args.error_rate,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        retry_after=args.retry_after,
+    )
+    web.run_app(MockQtestServer(settings).build_app(), host=args.host, port=args.port, access_log=None)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+def path_signature(path: str) -> Optional[Hashable]:
+    """Return (mtime_ns, size) for a file or directory, or None if it does not exist.
+
+    A directory's mtime changes whenever an entry is added, removed or renamed.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class CachedJsonResponse:
+    """Pre-serialized JSON response for a disk-backed resource, rebuilt only when its signature changes.
+
+    Each request costs one signature check (a stat) instead of re-reading the source. The body
+    is served with a strong ETag and Cache-Control, so clients that send If-None-Match get a 304.
+    """
+
+    def __init__(self, build: Callable[[], Any], signature: Callable[[], Optional[Hashable]], cache_control: str = "no-cache"):
+        """Initialize the cache with the content builder, the signature function and the Cache-Control header to send."""
+        self.build = build
+        self.signature = signature
+        self.cache_control = cache_control
+        self._lock = threading.Lock()
+        self._signature = None
+        self._body: Optional[bytes] = None
+        self._etag: Optional[str] = None
+
+    def current(self):
+        """Return the serialized body and its ETag, rebuilding them if the source changed."""
+        signature = self.signature()
+        with self._lock:
+            if self._body is None or signature != self._signature:
+                self._body = json.dumps(self.build(), separators=(",", ":")).encode("utf-8")
+                self._etag = f'"{hashlib.sha1(self._body).hexdigest()}"'
+                self._signature = signature
+            return self._body, self._etag
+
+    def invalidate(self) -> None:
+        """Drop the cached body so the next request rebuilds it."""
+        with self._lock:
+            self._body = None
+
+    def response(self, request: Request) -> Response:
+        """Return a 304 when the client's If-None-Match matches the current ETag, otherwise the cached JSON body."""
+        body, etag = self.current()
+        headers = {"ETag": etag, "Cache-Control": self.cache_control}
+        if_none_match = request.headers.get("if-none-match", "")
+        if if_none_match.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
@@ -1,55 +1,85 @@
 from fastapi import FastAPI, Request
 from fastapi.templating import Jinja2Templates
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
-from typing import Any, Dict
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Any, Dict, List
 
-import yaml
+import asyncio
+import json
 import os
+import time
 
-from modules.config_tools.config_validator import ConfigValidator
+from modules.config_loader import ConfigLoader, ConfigValidator, load_validation_plan
+from modules.request_handler.export_job import FINISHED_STATES, JobRunner
+from modules.yaml_loader import load_yaml_file
+from modules.UI.json_cache import CachedJsonResponse, path_signature
+from modules.UI.static_assets import HashedStaticFiles, StaticAssetHasher
+
+# Set by scripts/launch_UI.py so every worker process picks the same mode
+UI_MODE_ENV = "QTEST_UI_MODE"
+UI_MODE = os.environ.get(UI_MODE_ENV, "development")
+STARTED_AT = time.time()
+
+STATIC_DIR = "modules/UI/static"
 
 # Initialize the FastAPI app
 app = FastAPI()
 
-# Serve the static files (JS, CSS, images)
-app.mount("/static", StaticFiles(directory="modules/UI/static"), name="static")
+if UI_MODE == "production":
+    # Compress the JS, CSS and JSON responses; small bodies are not worth the CPU
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Serve the static files (JS, CSS, images); content-hashed URLs are cached long-term
+static_hasher = StaticAssetHasher(STATIC_DIR)
+app.mount("/static", HashedStaticFiles(directory=STATIC_DIR, hasher=static_hasher), name="static")
 
 # Set up the templates directory for rendering HTML
 templates = Jinja2Templates(directory="modules/UI/templates")
+templates.env.globals["static_url"] = static_hasher.url
+
+# Route for load balancers and process supervisors to check that a worker is serving
+@app.get("/health")
+async def health():
+    return {"status": "ok", "mode": UI_MODE, "pid": os.getpid(), "uptime_seconds": round(time.time() - STARTED_AT, 1)}
 
 # Route to serve the main menu
 @app.get("/main_menu")
 async def main_menu(request: Request):
     return templates.TemplateResponse("main_menu.html", {"request": request})
 
+CONFIG_RULES_PATH = os.path.join("configs", "validation", "config_rules.yaml")
+
 # Function to load configuration rules from the YAML file
 def load_config_rules():
-    config_rules_path = os.path.join("configs", "validation", "config_rules.yaml")
-    with open(config_rules_path, "r") as file:
-        return yaml.safe_load(file)
+    return load_yaml_file(CONFIG_RULES_PATH)  # Parsed once and reused until the file changes
+
+def get_auth_dir() -> str:
+    return os.path.join(os.getcwd(), "auth")
+
+def list_auth_files():
+    """Return the names of the files in the auth directory; entry types come from the directory listing, not a stat per file."""
+    with os.scandir(get_auth_dir()) as entries:
+        return sorted(entry.name for entry in entries if entry.is_file())
+
+# Serialized once and rebuilt only when the rules file or the auth directory changes
+config_rules_response = CachedJsonResponse(load_config_rules, lambda: path_signature(CONFIG_RULES_PATH))
+auth_files_response = CachedJsonResponse(list_auth_files, lambda: path_signature(get_auth_dir()))
 
 # Route to serve the config rules as JSON
 @app.get("/config_rules")
 async def get_config_rules(request: Request):
-    config_rules = load_config_rules()  # Load the config rules from YAML
-    return JSONResponse(content=config_rules)
+    return config_rules_response.response(request)
 
 # Route to create a new configuration
 @app.get("/new_config")
 async def new_config(request: Request):
-    config_rules = load_config_rules()  # Load the config rules
     return templates.TemplateResponse("new_config.html", {"request": request})
 
 @app.get("/auth_files")
-async def get_auth_files():
-    auth_dir = os.path.join(os.getcwd(), "auth")
-    try:
-        # List all files in the /auth directory
-        files = [f for f in os.listdir(auth_dir) if os.path.isfile(os.path.join(auth_dir, f))]
-        return JSONResponse(content=files)
-    except FileNotFoundError:
+async def get_auth_files(request: Request):
+    if not os.path.isdir(get_auth_dir()):
         return JSONResponse(content=[], status_code=404)
+    return auth_files_response.response(request)
 
 # Route to edit an existing configuration
 @app.get("/edit_config")
@@ -64,7 +94,75 @@ async def view_configs(request: Request):
 # Route to execute a configuration
 @app.get("/execute_config")
 async def execute_config(request: Request):
-    return templates.TemplateResponse("execute_config.html", {"request": request})
+    return templates.TemplateResponse("execute_config.html", {"request": request, "config_files": list_config_files()})
+
+CONFIGS_DIR = "configs"
+# Requests in flight across every running job of this process; set by scripts/launch_UI.py.
+# Jobs and their events are kept in this process, so the UI must run a single worker.
+JOB_REQUEST_BUDGET_ENV = "QTEST_UI_JOB_REQUEST_BUDGET"
+
+job_runner = JobRunner(int(os.environ.get(JOB_REQUEST_BUDGET_ENV, 20)))
+
+def list_config_files() -> List[str]:
+    """Return the names of the YAML config files in the configs directory."""
+    if not os.path.isdir(CONFIGS_DIR):
+        return []
+    with os.scandir(CONFIGS_DIR) as entries:
+        return sorted(entry.name for entry in entries if entry.is_file() and entry.name.endswith(".yaml"))
+
+# Route to start exporting a config in the background
+@app.post("/jobs")
+async def submit_job(request: Request):
+    """
+    This route receives {"config": "<file name in configs/>"}, loads and validates the config
+    and starts its export as a background job. It returns the job's first progress snapshot.
+    """
+    data = await request.json()
+    config_file = data.get("config") if isinstance(data, dict) else None
+    if config_file not in list_config_files():
+        return JSONResponse(content={"error": f"Unknown config file: '{config_file}'"}, status_code=404)
+
+    name = os.path.splitext(config_file)[0]
+    try:
+        # ConfigLoader reads files and sets up logging, so keep it off the event loop.
+        # Each config gets a logger of its own so concurrent jobs do not share log files.
+        loader = await asyncio.to_thread(ConfigLoader, os.path.join(CONFIGS_DIR, config_file), logger_name=f"{__name__}.{name}")
+    except (FileNotFoundError, IsADirectoryError, ValueError) as e:
+        return JSONResponse(content={"error": str(e)}, status_code=400)
+
+    job = job_runner.submit(loader.config, name)
+    return JSONResponse(content=job.progress(), status_code=202)
+
+@app.get("/jobs")
+async def list_jobs():
+    return [job.progress() for job in job_runner.jobs()]
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = job_runner.get(job_id)
+    if job is None:
+        return JSONResponse(content={"error": f"Unknown job: '{job_id}'"}, status_code=404)
+    return job.progress()
+
+@app.post("/jobs/{job_id}/cancel")
+async def cancel_job(job_id: str):
+    if not job_runner.cancel(job_id):
+        return JSONResponse(content={"error": f"Job '{job_id}' does not exist or has already finished"}, status_code=409)
+    return {"cancelled": True}
+
+# Route to stream a job's progress to the browser as Server-Sent Events
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    if job_runner.get(job_id) is None:
+        return JSONResponse(content={"error": f"Unknown job: '{job_id}'"}, status_code=404)
+
+    async def event_stream():
+        async for snapshot in job_runner.events(job_id):
+            event = "done" if snapshot["state"] in FINISHED_STATES else "progress"
+            yield f"event: {event}\ndata: {json.dumps(snapshot)}\n\n"
+
+    # no-transform keeps compression proxies from buffering the stream
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache, no-transform", "X-Accel-Buffering": "no"})
 
 
 # Route to perform validation
@@ -134,3 +232,93 @@ async def validate_input(request: Request):
     except Exception as e:
         # Catch any other errors
         return JSONResponse(content={"error": f"Unexpected error: {str(e)}"}, status_code=500)
+
+
+def _validation_names(validations: List[Any]) -> Dict[str, Dict]:
+    """Return each validation method name in a rule's validation list mapped to its parameters."""
+    names = {}
+    for validation in validations or []:
+        if isinstance(validation, str):
+            names[validation] = {}
+        elif isinstance(validation, dict):
+            names.update({name: params or {} for name, params in validation.items()})
+    return names
+
+def _coerce_scalar(value: Any, validation_names: Dict[str, Dict]) -> Any:
+    """Convert one form string to the type its validations expect: an allowed option, or an integer."""
+    if not isinstance(value, str):
+        return value
+    value = value.strip()
+    # Form controls submit option values as text, so match them against the allowed values by their text
+    allowed_values = validation_names.get("validate_option", {}).get("allowed_values") or []
+    for allowed_value in allowed_values:
+        if str(allowed_value).lower() == value.lower():
+            return allowed_value
+    if value.lstrip("-").isdigit():
+        return int(value)
+    return value
+
+def is_blank_form_value(value: Any) -> bool:
+    """Return True for form values that mean the field was left empty."""
+    if isinstance(value, list):
+        return all(is_blank_form_value(item) for item in value)
+    return value is None or (isinstance(value, str) and not value.strip())
+
+def coerce_form_value(value: Any, validations: List[Any]) -> Any:
+    """Convert a submitted form value to the type the field's validations expect.
+
+    Comma-separated text and multi-value inputs become integer lists for list validations,
+    and option values and digit strings are converted as in the per-field /validate route.
+    """
+    validation_names = _validation_names(validations)
+    expects_list = "validate_int_list" in validation_names or "validate_int_list_digits" in validation_names
+
+    if expects_list and not isinstance(value, list):
+        value = [value]
+    if isinstance(value, list):
+        if expects_list:
+            value = [item for entry in value for item in (entry.split(",") if isinstance(entry, str) else [entry])]
+        value = [_coerce_scalar(item, validation_names) for item in value if not is_blank_form_value(item)]
+        return value if expects_list or len(value) != 1 else value[0]
+    return _coerce_scalar(value, validation_names)
+
+def form_to_config(values: Dict[str, Any], plan) -> Dict[str, Any]:
+    """Build the config a form describes: coerce every filled-in field and apply rules-file defaults to empty optional ones."""
+    config = {}
+    for field, value in values.items():
+        if is_blank_form_value(value):
+            continue
+        rule = plan.rules.get(field) or {}
+        value = coerce_form_value(value, rule.get("validation"))
+        # The auth dropdown lists file names from the auth directory
+        if "authentication_file_lookup" in (rule.get("tags") or []) and isinstance(value, str) and not os.path.dirname(value):
+            value = os.path.join("auth", value)
+        config[field] = value
+
+    for field, default in plan.defaults.items():
+        if field not in config and not is_blank_form_value(default):
+            config[field] = coerce_form_value(default, (plan.rules.get(field) or {}).get("validation"))
+    return config
+
+# Route to validate a whole config form at once
+@app.post("/validate_form")
+async def validate_form(request: Request):
+    """
+    This route receives every form value as {"values": {field: value}}, applies the
+    rules-file defaults and runs all field and cross-field validations in one pass.
+    It returns the errors keyed by field together with the effective config.
+    """
+    try:
+        data = await request.json()
+        values = data.get("values") if isinstance(data, dict) else None
+        if not isinstance(values, dict):
+            return JSONResponse(content={"error": "Invalid request: expected an object of field values under 'values'."}, status_code=400)
+
+        plan = load_validation_plan(CONFIG_RULES_PATH)
+        config = form_to_config(values, plan)
+        errors = plan.errors_by_key(config)
+        return JSONResponse(content={"valid": not errors, "errors": errors, "config": config})
+    except ValueError as e:
+        return JSONResponse(content={"error": str(e)}, status_code=400)
+    except Exception as e:
+        return JSONResponse(content={"error": f"Unexpected error: {str(e)}"}, status_code=500)
@@ -0,0 +1,120 @@
+// Open progress streams, keyed by job id, so a job is never subscribed to twice
+const jobStreams = {};
+
+// Format a number of seconds as "1m 05s"
+function formatDuration(seconds) {
+    if (seconds === null || seconds === undefined) {
+        return '—';
+    }
+    const minutes = Math.floor(seconds / 60);
+    const remainder = Math.round(seconds % 60);
+    return minutes ? `${minutes}m ${String(remainder).padStart(2, '0')}s` : `${remainder}s`;
+}
+
+// Create the progress panel of a job, or return the existing one
+function jobPanel(jobId) {
+    let panel = document.getElementById(`job-${jobId}`);
+    if (!panel) {
+        panel = document.createElement('div');
+        panel.setAttribute('id', `job-${jobId}`);
+        panel.classList.add('section-container', 'job-panel');
+        panel.innerHTML = `
+            <h2 class="job-title"></h2>
+            <progress class="job-progress" max="1" value="0"></progress>
+            <div class="job-stats"></div>
+            <div class="job-errors validation-error"></div>
+            <button type="button" class="job-cancel">Cancel</button>`;
+        panel.querySelector('.job-cancel').addEventListener('click', () => {
+            fetch(`/jobs/${jobId}/cancel`, { method: 'POST' });
+        });
+        document.getElementById('jobs').prepend(panel);
+    }
+    return panel;
+}
+
+// Render one progress snapshot into the job's panel
+function renderJob(job) {
+    const panel = jobPanel(job.job_id);
+    const total = job.requests_total ? ` / ~${job.requests_total}` : '';
+
+    panel.querySelector('.job-title').textContent = `${job.name} (${job.state})`;
+    panel.querySelector('.job-progress').value = job.projects_total ? job.projects_done / job.projects_total : 0;
+    panel.querySelector('.job-stats').textContent =
+        `Projects ${job.projects_done} / ${job.projects_total} · ` +
+        `Requests ${job.requests_done}${total} · ` +
+        `${job.requests_per_second} req/s · ` +
+        `Records ${job.records_written} · ` +
+        `Errors ${job.errors} · ` +
+        `Elapsed ${formatDuration(job.elapsed_seconds)} · ETA ${formatDuration(job.eta_seconds)}`;
+    panel.querySelector('.job-errors').textContent = job.error_details
+        .map(detail => detail.project ? `Project ${detail.project}: ${detail.error}` : detail.error)
+        .join('\n');
+    panel.querySelector('.job-cancel').hidden = !['queued', 'running'].includes(job.state);
+}
+
+// Follow a job's progress over Server-Sent Events until it finishes
+function followJob(jobId) {
+    if (jobStreams[jobId]) {
+        return;
+    }
+    const source = new EventSource(`/jobs/${jobId}/events`);
+    jobStreams[jobId] = source;
+
+    source.addEventListener('progress', event => renderJob(JSON.parse(event.data)));
+    source.addEventListener('done', event => {
+        renderJob(JSON.parse(event.data));
+        source.close();
+        delete jobStreams[jobId];
+    });
+    source.onerror = () => {
+        // The job is gone, for example after a server restart; stop reconnecting
+        source.close();
+        delete jobStreams[jobId];
+    };
+}
+
+// Submit the selected config as a new background job
+async function submitJob(event) {
+    event.preventDefault();
+    const config = document.getElementById('config').value;
+
+    try {
+        const response = await fetch('/jobs', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ config })
+        });
+        const result = await response.json();
+
+        if (!response.ok) {
+            alert(`Could not start '${config}': ${result.error}`);
+            return;
+        }
+        renderJob(result);
+        followJob(result.job_id);
+    } catch (error) {
+        console.error(`Error starting job: ${error}`);
+        alert(`Error starting job: ${error.message}`);
+    }
+}
+
+// Show the jobs that already exist and keep following the unfinished ones
+async function loadJobs() {
+    const response = await fetch('/jobs');
+    const jobs = await response.json();
+
+    // Oldest first, since each panel is prepended
+    jobs.reverse().forEach(job => {
+        renderJob(job);
+        if (['queued', 'running'].includes(job.state)) {
+            followJob(job.job_id);
+        }
+    });
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    document.getElementById('execute-form').addEventListener('submit', submitJob);
+    loadJobs();
+});
@@ -1,3 +1,13 @@
+// The auth file list is fetched once per page load and shared by every field that needs it
+let authFilesPromise = null;
+
+function fetchAuthFiles() {
+    if (!authFilesPromise) {
+        authFilesPromise = fetch('/auth_files').then(response => response.json());
+    }
+    return authFilesPromise;
+}
+
 async function populateConfigTemplate() {
     // Fetch the config rules from the API endpoint
     const response = await fetch('/config_rules');
@@ -57,8 +67,7 @@ async function populateConfigTemplate() {
                 inputElement.setAttribute('name', field);
 
                 try {
-                    const authFilesResponse = await fetch('/auth_files');
-                    const authFiles = await authFilesResponse.json();
+                    const authFiles = await fetchAuthFiles();
 
                     authFiles.forEach(file => {
                         const option = document.createElement('option');
@@ -120,11 +129,6 @@ async function populateConfigTemplate() {
                 if (rules.validation) {
                     inputElement.setAttribute('data-validations', JSON.stringify(rules.validation));
                 }
-
-                // Attach the input change listener for validation
-                inputElement.addEventListener('change', (event) => {
-                    validateInput(field, inputElement.value, rules.validation);
-                });
             }
 
             // Add 'required' attribute if the field is marked as required
@@ -150,11 +154,6 @@ async function populateConfigTemplate() {
                     newInputElement.value = '';  // Clear the value for the new input
                     newInputElement.setAttribute('name', `${field}[]`);  // Set name as an array for multiple values
                     fieldContainer.insertBefore(newInputElement, addButton);
-
-                    // Attach validation event to the new input
-                    newInputElement.addEventListener('change', (event) => {
-                        validateInput(field, newInputElement.value, rules.validation);
-                    });
                 });
             }
 
@@ -173,6 +172,9 @@ async function populateConfigTemplate() {
     saveButton.textContent = 'Save Config';
     saveButton.classList.add('save-config-button');
     form.appendChild(saveButton);
+
+    // Show the errors of the rendered defaults; later edits are validated by the form's listeners
+    scheduleFormValidation();
 }
 
 // Helper function to capitalize text
@@ -1,58 +1,99 @@
-// Function to validate inputs
-async function validateInput(fieldName, fieldValue, validations) {
-    try {
-        // Handle multiple values, if the input expects a list of values (e.g., comma-separated)
-        if (fieldValue.includes(",")) {
-            fieldValue = fieldValue.split(",").map(value => value.trim());
+// Whole-form validation: edits are debounced and the full form is validated in one request
+const VALIDATION_DEBOUNCE_MS = 300;
+let validationTimer = null;
+let validationController = null;
+
+// Collect every named form control; extra inputs of multi-value fields are named "<field>[]"
+function collectFormValues(form) {
+    const values = {};
+    form.querySelectorAll('input[name], select[name]').forEach(element => {
+        const name = element.getAttribute('name');
+        const field = name.endsWith('[]') ? name.slice(0, -2) : name;
+        if (field in values) {
+            values[field] = [].concat(values[field], element.value);
+        } else {
+            values[field] = element.value;
+        }
+    });
+    return values;
+}
+
+// Show each field's errors under its container, and clear the errors of fields that are now valid
+function showValidationErrors(form, errors) {
+    form.querySelectorAll('.field-container').forEach(fieldContainer => {
+        const control = fieldContainer.querySelector('input[name], select[name]');
+        if (!control) {
+            return;
         }
+        const messages = errors[control.getAttribute('name')] || [];
+        let messageElement = fieldContainer.querySelector('.validation-error');
 
-        // Prepare the payload for the API
-        const payload = {
-            field: fieldName,
-            value: fieldValue,
-            validations: validations
-        };
+        fieldContainer.querySelectorAll('input, select').forEach(element => {
+            element.classList.toggle('invalid', messages.length > 0);
+        });
+
+        if (messages.length === 0) {
+            if (messageElement) {
+                messageElement.remove();
+            }
+            return;
+        }
+        if (!messageElement) {
+            messageElement = document.createElement('div');
+            messageElement.classList.add('validation-error');
+            fieldContainer.appendChild(messageElement);
+        }
+        messageElement.textContent = messages.join('\n');
+    });
+}
 
-        // Send a POST request to the validation route
-        const response = await fetch('/validate', {
+// Validate the whole form with a single request to the bulk validation route
+async function validateForm() {
+    const form = document.getElementById('config-form');
+
+    // Only the latest edit matters, so cancel a request that is still in flight
+    if (validationController) {
+        validationController.abort();
+    }
+    validationController = new AbortController();
+
+    try {
+        const response = await fetch('/validate_form', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
             },
-            body: JSON.stringify(payload)
+            body: JSON.stringify({ values: collectFormValues(form) }),
+            signal: validationController.signal
         });
 
         const result = await response.json();
 
-        if (result.success) {
-            console.log(`${fieldName} is valid.`);
-        } else {
-            console.error(`Validation failed for ${fieldName}: ${result.error}`);
-            alert(`Validation Error: ${result.error}`);
+        if (result.error) {
+            console.error(`Validation request failed: ${result.error}`);
+            return;
         }
+        showValidationErrors(form, result.errors);
+        return result;
     } catch (error) {
-        console.error(`Error during validation: ${error}`);
-        alert(`Validation Error: ${error.message}`);
+        if (error.name !== 'AbortError') {
+            console.error(`Error during validation: ${error}`);
+        }
     }
 }
 
+// Validate the form once the user has stopped editing for VALIDATION_DEBOUNCE_MS
+function scheduleFormValidation() {
+    clearTimeout(validationTimer);
+    validationTimer = setTimeout(validateForm, VALIDATION_DEBOUNCE_MS);
+}
 
-
-// Attach event listeners to all input fields
+// Listen on the form itself so fields rendered or added later are covered too
 function attachValidationListeners() {
     const form = document.getElementById('config-form');
 
-    // Loop through all input elements
-    const inputElements = form.querySelectorAll('input, select');
-    inputElements.forEach(inputElement => {
-        const fieldName = inputElement.getAttribute('name');
-        const validations = inputElement.dataset.validations ? JSON.parse(inputElement.dataset.validations) : [];
-
-        // Attach an event listener to trigger validation on change
-        inputElement.addEventListener('change', () => {
-            validateInput(fieldName, inputElement.value, validations);
-        });
-    });
+    form.addEventListener('input', scheduleFormValidation);
+    form.addEventListener('change', scheduleFormValidation);
 }
 
 // Ensure the listeners are attached when the DOM is ready
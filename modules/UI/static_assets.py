@@ -0,0 +1,67 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Hashable, Optional, Tuple
+from urllib.parse import parse_qs
+
+from fastapi.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from modules.UI.json_cache import path_signature
+
+# Versioned URLs change whenever the file content changes, so browsers may keep them for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Unversioned URLs are revalidated with the ETag on every use
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+class StaticAssetHasher:
+    """Content hashes of the files under a static directory, recomputed only when a file's signature changes."""
+
+    def __init__(self, directory: str, length: int = 12):
+        """Initialize the hasher with the static directory and the number of hex digits to keep."""
+        self.directory = directory
+        self.length = length
+        self._lock = threading.Lock()
+        self._hashes: Dict[str, Tuple[Optional[Hashable], Optional[str]]] = {}
+
+    def content_hash(self, path: str) -> Optional[str]:
+        """Return the short SHA-256 of a static file, or None if it does not exist."""
+        full_path = os.path.join(self.directory, path)
+        signature = path_signature(full_path)
+        with self._lock:
+            cached = self._hashes.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+        digest = None
+        if signature is not None:
+            with open(full_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()[:self.length]
+        with self._lock:
+            self._hashes[path] = (signature, digest)
+        return digest
+
+    def url(self, path: str, mount_path: str = "/static") -> str:
+        """Return the URL of a static file with its content hash as the 'v' query parameter."""
+        digest = self.content_hash(path)
+        url = f"{mount_path}/{path.lstrip('/')}"
+        return f"{url}?v={digest}" if digest else url
+
+
+class HashedStaticFiles(StaticFiles):
+    """StaticFiles that marks content-hashed URLs as immutable and revalidates every other request."""
+
+    def __init__(self, *args, hasher: StaticAssetHasher, **kwargs):
+        """Initialize the static files app with the hasher whose versions it trusts."""
+        super().__init__(*args, **kwargs)
+        self.hasher = hasher
+
+    def file_response(self, full_path, stat_result, scope: Scope, status_code: int = 200):
+        """Return the file response with a Cache-Control header matching the requested version."""
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        version = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("v", [None])[0]
+        path = self.get_path(scope)
+        # A stale version keeps the short-lived header, so an old page never pins new content under its URL
+        is_current = version is not None and version == self.hasher.content_hash(path)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL if is_current else REVALIDATE_CACHE_CONTROL
+        return response
@@ -0,0 +1,94 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+from .config_loader import ValidationPlan, load_validation_plan, read_yaml_config
+
+DEFAULT_RULES_DIR = Path("configs/validation")
+
+_worker_plans: Dict[str, Optional[ValidationPlan]] = {}
+
+def load_rule_plans(rules_dir: Union[str, Path] = DEFAULT_RULES_DIR) -> Dict[str, Optional[ValidationPlan]]:
+    """Compile config_rules.yaml and auth_rules.yaml from rules_dir, leaving out whichever file is missing."""
+    rules_dir = Path(rules_dir)
+    plans = {}
+    for name in ("config", "auth"):
+        rules_path = rules_dir / f"{name}_rules.yaml"
+        plans[name] = load_validation_plan(rules_path) if rules_path.is_file() else None
+    return plans
+
+def _run_plan(plan: Optional[ValidationPlan], config: Dict[str, Any], label: str) -> List[str]:
+    """Run a plan and return its errors, reporting a missing rules file as an error."""
+    if plan is None:
+        return [f"No {label} validation rules found."]
+    try:
+        return plan.run(config)
+    except ValueError as e:
+        return [str(e)]
+    except Exception as e:
+        # A validator tripping over an unexpected value type must not abort the other files
+        return [f"Unexpected error while running the {label} rules: {type(e).__name__}: {e}"]
+
+def validate_config_file(config_path: Union[str, Path], plans: Dict[str, Optional[ValidationPlan]]) -> Dict[str, Any]:
+    """Validate one config file and the authentication file it points to, reporting any error in the file's result instead of raising."""
+    try:
+        return _validate_config_file(config_path, plans)
+    except Exception as e:
+        return {"config": str(config_path), "valid": False, "errors": [f"Unexpected error while validating: {type(e).__name__}: {e}"], "auth_errors": []}
+
+def _validate_config_file(config_path: Union[str, Path], plans: Dict[str, Optional[ValidationPlan]]) -> Dict[str, Any]:
+    """Validate one config file and the authentication file it points to, without creating a logger."""
+    result = {"config": str(config_path), "valid": False, "errors": [], "auth_errors": []}
+    try:
+        config = read_yaml_config(config_path)
+    except (OSError, ValueError) as e:
+        result["errors"].append(str(e))
+        return result
+
+    result["errors"] = _run_plan(plans.get("config"), config, "config")
+
+    auth_path = config.get("authentication_path")
+    if auth_path:
+        auth_path = Path(auth_path)
+        if auth_path.is_file():
+            try:
+                result["auth_errors"] = _run_plan(plans.get("auth"), read_yaml_config(auth_path), "auth")
+            except (OSError, ValueError) as e:
+                result["auth_errors"].append(str(e))
+        else:
+            result["auth_errors"].append(f"Authentication path '{auth_path}' does not exist or is not a valid file.")
+
+    result["valid"] = not result["errors"] and not result["auth_errors"]
+    return result
+
+def _init_worker(rules_dir: str) -> None:
+    """Compile the rule plans once per worker process."""
+    global _worker_plans
+    _worker_plans = load_rule_plans(rules_dir)
+
+def _validate_in_worker(config_path: str) -> Dict[str, Any]:
+    return validate_config_file(config_path, _worker_plans)
+
+def validate_config_files(config_paths: List[Union[str, Path]], rules_dir: Union[str, Path] = DEFAULT_RULES_DIR, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Validate many config files against rules compiled once, spreading the work over a process pool.
+
+    Results are returned in the order of config_paths. With workers=1, or a single file,
+    validation runs in the current process.
+    """
+    config_paths = [str(path) for path in config_paths]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(config_paths) <= 1:
+        plans = load_rule_plans(rules_dir)
+        return [validate_config_file(path, plans) for path in config_paths]
+
+    workers = min(workers, len(config_paths))
+    chunksize = max(1, len(config_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(str(rules_dir),)) as executor:
+        return list(executor.map(_validate_in_worker, config_paths, chunksize=chunksize))
+
+def validate_config_directory(config_dir: Union[str, Path], rules_dir: Union[str, Path] = DEFAULT_RULES_DIR, pattern: str = "*.yaml", workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Validate every config file in config_dir matching pattern (not recursing into subdirectories)."""
+    config_paths = sorted(path for path in Path(config_dir).glob(pattern) if path.is_file())
+    return validate_config_files(config_paths, rules_dir, workers)
@@ -1,12 +1,20 @@
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List, Tuple
+from typing import Dict, Any, Optional, Union, List, Tuple, Callable
 import yaml
 import json
 import logging
 from datetime import date, datetime
+from functools import partial
+import inspect
 import re
 
 from .prepare_logger import prepare_logger
+from .yaml_loader import load_yaml_file
+
+BEARER_TOKEN_PATTERN = re.compile(r'^Bearer [a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$')
+
+# Keys that are added to a loaded config and are never checked against the rules
+IGNORED_CONFIG_KEYS = frozenset({"config_validation_rules", "auth_validation_rules", "logger"})
 
 class SensitiveDict:
     """Custom dictionary-like class for handling sensitive data."""
@@ -49,11 +57,26 @@ def normalize_key(key: str) -> str:
     return "_".join(normalized_parts)
 
 
+def read_yaml_config(path: Union[str, Path]) -> Dict:
+    """Read a YAML config file and normalize its keys."""
+    try:
+        config_data = load_yaml_file(path)
+
+        if not isinstance(config_data, dict):
+            raise ValueError("YAML file content is not a valid dictionary.")
+
+        # Normalize each key using the utility function
+        return {normalize_key(key): value for key, value in config_data.items()}
+
+    except yaml.YAMLError as e:
+        raise ValueError(f"Error parsing YAML file: {e}")
+
+
 class ConfigLoader:
     """Class to load and validate configuration from YAML files."""
     
-    def __init__(self, config_path: Union[str, Path], rules_dir: Optional[Union[str, Path]] = None):
-        """Initialize ConfigLoader, load and validate the configuration."""
+    def __init__(self, config_path: Union[str, Path], rules_dir: Optional[Union[str, Path]] = None, logger_name: Optional[str] = None):
+        """Initialize ConfigLoader, load and validate the configuration; logger_name gives the config a logger of its own."""
         try:
             self.config_path: Path = self.ensure_path_object(config_path)
             self.validate_yaml_path(self.config_path)
@@ -70,7 +93,15 @@ class ConfigLoader:
 
             log_path = self.get_log_path()
             log_name_prefix = self.get_log_name_prefix()
-            self.logger = prepare_logger(log_path, log_name_prefix)
+            self.logger = prepare_logger(
+                log_path,
+                log_name_prefix,
+                use_queue=bool(self.config.get('log_queue', False)),
+                queue_size=self.config.get('log_queue_size', 10000),
+                queue_policy=self.config.get('log_queue_policy', 'block'),
+                json_lines=self.config.get('log_format', 'text') == 'json',
+                logger_name=logger_name,
+            )
             self.logger.info(f"Logger initialized with log output directory: '{log_path}'")
 
             self.config["logger"] = self.logger
@@ -98,6 +129,8 @@ class ConfigLoader:
         """Load both config_rules and auth_rules from the specified directory, defaults to 'configs/validation/'."""
         config_rules = {}
         auth_rules = {}
+        self.config_plan = None
+        self.auth_plan = None
 
         # Set default rules directory if none is provided
         if rules_dir is None:
@@ -108,6 +141,7 @@ class ConfigLoader:
         if config_rules_path.exists():
             validator = ConfigValidator({}, config_rules_path)
             config_rules = validator.rules
+            self.config_plan = validator.plan
         else:
             self.logger.warning(f"config_rules.yaml not found at {config_rules_path}")
         
@@ -116,6 +150,7 @@ class ConfigLoader:
         if auth_rules_path.exists():
             validator = ConfigValidator({}, auth_rules_path)
             auth_rules = validator.rules
+            self.auth_plan = validator.plan
         else:
             self.logger.warning(f"auth_rules.yaml not found at {auth_rules_path}")
         
@@ -160,24 +195,12 @@ class ConfigLoader:
                 
     def extract_config_from_yaml(self, path: Path) -> Optional[Dict]:
         """Extract and normalize configuration from a YAML file."""
-        try:
-            with open(path, 'r') as file:
-                config_data = yaml.safe_load(file)
-
-                if not isinstance(config_data, dict):
-                    raise ValueError("YAML file content is not a valid dictionary.")
-
-                # Normalize each key using the utility function
-                return {normalize_key(key): value for key, value in config_data.items()}
-
-        except yaml.YAMLError as e:
-            raise ValueError(f"Error parsing YAML file: {e}")
+        return read_yaml_config(path)
 
     def validate_config(self, config: Dict) -> None:
         """Validate the config using the provided config_rules."""
         try:
-            validator = ConfigValidator(config, None)
-            validator.rules = self.config_rules
+            validator = ConfigValidator(config, None, plan=self.config_plan)
             validator.validate()
         except ValueError as e:
             self.logger.error(f"Config validation error: {e}")
@@ -194,8 +217,7 @@ class ConfigLoader:
             self.config["auth"] = SensitiveDict(auth_config)
             self.logger.info("Authentication data loaded into config")
 
-        validator = ConfigValidator(self.config['auth'].get_data(), None)
-        validator.rules = self.auth_rules
+        validator = ConfigValidator(self.config['auth'].get_data(), None, plan=self.auth_plan)
         validator.validate()
         self.logger.info("Authentication data validated successfully")
 
@@ -203,28 +225,33 @@ class ConfigLoader:
 class ConfigValidator:
     """Class to validate configuration against a set of rules."""
     
-    def __init__(self, config: Dict[str, Any], rules_file: Optional[Union[str, Path]] = None):
-        """Initialize the validator with config and load rules from YAML if provided."""
+    def __init__(self, config: Dict[str, Any], rules_file: Optional[Union[str, Path]] = None, plan: Optional["ValidationPlan"] = None):
+        """Initialize the validator with config and load rules from YAML or a compiled plan if provided."""
         self.config = config
         self.errors = []
         self.rules = {}
 
-        if rules_file:
+        if plan is not None:
+            self.rules = plan.rules
+            self.plan = plan
+        elif rules_file:
             self.load_rules_from_path(Path(rules_file))
 
+    @property
+    def rules(self) -> Dict:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: Dict) -> None:
+        """Replace the rules and drop any plan compiled from the previous ones."""
+        self._rules = rules
+        self.plan = None
+
     def load_rules_from_path(self, rules_path: Path) -> None:
-        """Load validation rules from a YAML file using a Path object."""
-        if not rules_path.is_file():
-            raise ValueError(f"Rules file {rules_path} does not exist or is not a file.")
-        
-        with rules_path.open('r') as f:
-            self.rules = yaml.safe_load(f)
-        
-        if not isinstance(self.rules, dict):
-            raise ValueError(f"Rules file {rules_path} must contain a valid dictionary of rules.")
-        
-        # Normalize the keys for consistency
-        self.rules = {normalize_key(key): value for key, value in self.rules.items()}
+        """Load validation rules from a YAML file using a Path object, reusing the cached compiled plan when the file is unchanged."""
+        plan = load_validation_plan(rules_path)
+        self.rules = plan.rules
+        self.plan = plan
 
     def dump_config_to_yaml(self, output_path: Path) -> None:
         """Dump the config dictionary as a nicely formatted YAML file."""
@@ -236,49 +263,10 @@ class ConfigValidator:
         if not self.rules:
             raise ValueError("No validation rules found. Please load rules from a file or pass them directly.")
 
-        # Define keys that should be ignored during validation
-        ignored_keys = {"config_validation_rules", "auth_validation_rules", "logger"}
+        if self.plan is None:
+            self.plan = ValidationPlan(self.rules)
 
-        # Check for any unexpected keys in the config that are not present in the rules, excluding ignored keys
-        extra_keys = set(self.config.keys()) - set(self.rules.keys()) - ignored_keys
-        if extra_keys:
-            raise ValueError(f"Config validation error: Unexpected config keys found: {', '.join(extra_keys)}")
-
-        for key, rule in self.rules.items():
-            value = self.config.get(key)
-
-            # Check if the field is required and missing
-            if rule.get('required', False) and value is None:
-                self.errors.append(f"Missing required config key: '{key}'")
-                continue  # Skip further validation if missing
-
-            # Skip keys that don't have validation rules
-            validators = rule.get('validation', None)
-            if not validators:
-                continue  # No validation rules, skip this key
-
-            # Run each validation rule if the field exists
-            if value is not None:
-                for validation in validators:
-                    if isinstance(validation, str):  # Direct function call without parameters
-                        validator = getattr(self, validation, None)
-                        if validator:
-                            try:
-                                validator(key, value)
-                            except ValueError as e:
-                                self.errors.append(str(e))
-                        else:
-                            raise ValueError(f"Validation method '{validation}' not found for key: '{key}'")
-                    elif isinstance(validation, dict):  # Validation with parameters
-                        for validator_name, params in validation.items():
-                            validator = getattr(self, validator_name, None)
-                            if validator:
-                                try:
-                                    validator(key, value, **params)  # Pass parameters to the validator
-                                except ValueError as e:
-                                    self.errors.append(str(e))
-                            else:
-                                raise ValueError(f"Validation method '{validator_name}' not found for key: '{key}'")
+        self.errors.extend(self.plan.run(self.config))
 
         if self.errors:
             raise ValueError("\n".join(self.errors))
@@ -317,12 +305,11 @@ class ConfigValidator:
         if not isinstance(value, str) or not value.strip():
             raise ValueError(f"Config key '{key}' must be a non-empty string. Found: '{value}'")
         
-        bearer_token_pattern = re.compile(r'^Bearer [a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$')
-        if not bearer_token_pattern.fullmatch(value):
+        if not BEARER_TOKEN_PATTERN.fullmatch(value):
             raise ValueError(f"Auth Config key '{key}' must be a Bearer Token in the format 'Bearer <UUID>'. Found: '{value}'")
 
     @staticmethod
-    def validate_date(key: str, value: Union[str, date], min_date: Optional[str] = None) -> None:
+    def validate_date(key: str, value: Union[str, date], min_date: Optional[Union[str, date]] = None) -> None:
         """Validate that the date is on or after the minimum date."""
         try:
             if isinstance(value, str):
@@ -335,7 +322,7 @@ class ConfigValidator:
             raise ValueError(f"Config key '{key}' must be a valid date in the format YYYY-MM-DD. Found: '{value}'")
         
         if min_date:
-            min_date_obj = datetime.strptime(min_date, "%Y-%m-%d").date()
+            min_date_obj = parse_min_date(min_date)
             if value_date < min_date_obj:
                 raise ValueError(f"Config key '{key}' must be on or after {min_date}. Found: {value_date}")
 
@@ -400,3 +387,157 @@ class ConfigValidator:
         if non_matching_digits:
             raise ValueError(f"Config key '{key}' must contain items with exactly {digits} digits. "
                             f"Found items not matching: {non_matching_digits}")
+
+
+def parse_min_date(min_date: Union[str, date]) -> date:
+    """Return min_date as a date, parsing 'YYYY-MM-DD' strings."""
+    if isinstance(min_date, date):
+        return min_date
+    return datetime.strptime(min_date, "%Y-%m-%d").date()
+
+
+# Parameter preparation done once at compile time rather than on every validation call
+PARAM_PREPARERS = {
+    "validate_date": lambda params: {**params, "min_date": parse_min_date(params["min_date"])} if params.get("min_date") else params,
+}
+
+
+def check_adaptive_concurrency_bounds(config: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """Check that adaptive_concurrency_min does not exceed the adaptive maximum when adaptive concurrency is enabled."""
+    if config.get("adaptive_concurrency") is not True:
+        return None
+    min_limit = config.get("adaptive_concurrency_min", 1)
+    max_limit = config.get("adaptive_concurrency_max", config.get("max_concurrent_requests", 1))
+    if isinstance(min_limit, int) and isinstance(max_limit, int) and min_limit > max_limit:
+        return "adaptive_concurrency_min", f"Config key 'adaptive_concurrency_min' must be less than or equal to 'adaptive_concurrency_max'. Found: {min_limit} > {max_limit}"
+    return None
+
+
+def check_incremental_export_filetype(config: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """Check that incremental exports write to an output that supports upserts."""
+    output_filetype = config.get("output_filetype")
+    if config.get("incremental_export") is True and output_filetype is not None and output_filetype != "sqlite":
+        return "incremental_export", f"Config key 'incremental_export' requires output_filetype 'sqlite'. Found: '{output_filetype}'"
+    return None
+
+
+# Checks that span several keys; each returns the key to report the error under and the message, or None
+CROSS_FIELD_CHECKS: Tuple[Callable[[Dict[str, Any]], Optional[Tuple[str, str]]], ...] = (
+    check_adaptive_concurrency_bounds,
+    check_incremental_export_filetype,
+)
+
+
+class ValidationPlan:
+    """Validation rules compiled once into bound validator callables.
+
+    Unknown validator names and parameters that do not match the validator signature are
+    reported when the plan is compiled, not when a config is validated.
+    """
+
+    def __init__(self, rules: Dict[str, Any], source: Optional[Path] = None):
+        """Compile the rules dictionary into an immutable plan."""
+        self.rules = rules
+        self.source = source
+        self.known_keys = frozenset(rules.keys()) | IGNORED_CONFIG_KEYS
+        self.defaults = {
+            key: rule['default'] for key, rule in rules.items()
+            if isinstance(rule, dict) and 'default' in rule and not rule.get('required', False)
+        }
+        self.entries: Tuple[Tuple[str, bool, Tuple[Callable, ...]], ...] = tuple(
+            (key, bool((rule or {}).get('required', False)), self._compile_checks(key, (rule or {}).get('validation') or []))
+            for key, rule in rules.items()
+        )
+
+    @staticmethod
+    def _compile_checks(key: str, validations: List[Any]) -> Tuple[Callable, ...]:
+        """Resolve each validator once and bind its pre-parsed parameters."""
+        checks = []
+        for validation in validations:
+            if isinstance(validation, str):
+                named_params = [(validation, {})]
+            elif isinstance(validation, dict):
+                named_params = [(name, params or {}) for name, params in validation.items()]
+            else:
+                raise ValueError(f"Invalid validation entry for key '{key}': {validation!r}")
+
+            for validator_name, params in named_params:
+                validator = getattr(ConfigValidator, validator_name, None) if validator_name.startswith("validate_") else None
+                if validator is None:
+                    raise ValueError(f"Validation method '{validator_name}' not found for key: '{key}'")
+                try:
+                    inspect.signature(validator).bind(key, None, **params)
+                except TypeError as e:
+                    raise ValueError(f"Invalid parameters for validation method '{validator_name}' on key '{key}': {e}")
+
+                preparer = PARAM_PREPARERS.get(validator_name)
+                checks.append(partial(validator, **(preparer(params) if preparer else params)))
+        return tuple(checks)
+
+    def run(self, config: Dict[str, Any]) -> List[str]:
+        """Validate config against the plan and return the list of error messages."""
+        # Check for any unexpected keys in the config that are not present in the rules, excluding ignored keys
+        extra_keys = [key for key in config if key not in self.known_keys]
+        if extra_keys:
+            raise ValueError(f"Config validation error: Unexpected config keys found: {', '.join(extra_keys)}")
+
+        return [message for messages in self.errors_by_key(config).values() for message in messages]
+
+    def errors_by_key(self, config: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Validate config against the plan, including cross-field checks, and return the error messages grouped by key.
+
+        Unexpected keys are reported under their own key instead of raising, so every problem is found in one pass.
+        """
+        errors: Dict[str, List[str]] = {}
+        for key in config:
+            if key not in self.known_keys:
+                errors.setdefault(key, []).append(f"Unexpected config key: '{key}'")
+
+        for key, required, checks in self.entries:
+            value = config.get(key)
+            if value is None:
+                if required:
+                    errors.setdefault(key, []).append(f"Missing required config key: '{key}'")
+                continue
+
+            for check in checks:
+                try:
+                    check(key, value)
+                except ValueError as e:
+                    errors.setdefault(key, []).append(str(e))
+                except Exception as e:
+                    # Validators assume the value has the right type, e.g. validate_int_range gets a string
+                    errors.setdefault(key, []).append(f"Config key '{key}' has an invalid value for {check.func.__name__}: {value!r} ({type(e).__name__}: {e})")
+
+        for cross_field_check in CROSS_FIELD_CHECKS:
+            result = cross_field_check(config)
+            if result is not None:
+                key, message = result
+                errors.setdefault(key, []).append(message)
+        return errors
+
+
+_PLAN_CACHE: Dict[Path, Tuple[Tuple[int, int], ValidationPlan]] = {}
+
+def load_validation_plan(rules_path: Union[str, Path]) -> ValidationPlan:
+    """Load and compile a rules file, returning the cached plan while the file's mtime and size are unchanged."""
+    rules_path = Path(rules_path)
+    if not rules_path.is_file():
+        raise ValueError(f"Rules file {rules_path} does not exist or is not a file.")
+
+    resolved = rules_path.resolve()
+    stat = resolved.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _PLAN_CACHE.get(resolved)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    rules = load_yaml_file(resolved)
+
+    if not isinstance(rules, dict):
+        raise ValueError(f"Rules file {rules_path} must contain a valid dictionary of rules.")
+
+    # Normalize the keys for consistency
+    plan = ValidationPlan({normalize_key(key): value for key, value in rules.items()}, resolved)
+    _PLAN_CACHE[resolved] = (signature, plan)
+    return plan
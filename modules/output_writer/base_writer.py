@@ -0,0 +1,96 @@
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union, Tuple
+
+def _json_default(value: Any) -> Any:
+    """Encode values json cannot: nested numpy arrays and scalars as Python data, anything else as its string."""
+    if type(value).__module__ == "numpy":
+        return value.tolist()
+    return str(value)
+
+class BatchWriter:
+    """Base class for writers that append batches of records to an output file.
+
+    Columns are taken from the first batch unless given up front. Nested values (such as
+    qTest property lists) are stored as JSON strings. A writer can be passed directly as the
+    sink of HttpRequestProcessor.make_requests_to_sink.
+    """
+
+    file_extension = ""
+
+    def __init__(self, output_path: Union[str, Path], columns: Optional[List[str]] = None):
+        """Initialize the writer with its output file and an optional fixed column order."""
+        self.output_path = Path(output_path)
+        self.columns: Optional[List[str]] = list(columns) if columns else None
+        self.rows_written = 0
+        self._opened = False
+
+    def write_batch(self, records: List[Dict[str, Any]]) -> None:
+        """Append a batch of records to the output."""
+        if not records:
+            return
+
+        if self.columns is None:
+            self.columns = self._discover_columns(records)
+        if not self._opened:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._open()
+            self._opened = True
+
+        new_columns = [column for column in self._discover_columns(records) if column not in self.columns]
+        if new_columns:
+            self._add_columns(new_columns)
+
+        rows = [tuple(self._normalize_value(record.get(column)) for column in self.columns) for record in records]
+        self._write_rows(rows)
+        self.rows_written += len(rows)
+
+    def __call__(self, records: List[Dict[str, Any]]) -> None:
+        self.write_batch(records)
+
+    def close(self) -> None:
+        """Flush and close the output."""
+        if self._opened:
+            self._close()
+            self._opened = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    def _discover_columns(records: List[Dict[str, Any]]) -> List[str]:
+        """Return the keys of all records in first-seen order."""
+        columns = {}
+        for record in records:
+            for key in record:
+                columns.setdefault(key, None)
+        return list(columns)
+
+    @staticmethod
+    def _normalize_value(value: Any) -> Any:
+        """Convert a value into a scalar every output format can store."""
+        if type(value).__module__ == "numpy":
+            # numpy arrays from DataFrame list columns become lists, numpy scalars Python scalars
+            value = value.tolist()
+        if isinstance(value, (dict, list, tuple)):
+            return json.dumps(value, default=_json_default)
+        if isinstance(value, (date, datetime)):
+            return value.isoformat()
+        return value
+
+    def _add_columns(self, new_columns: List[str]) -> None:
+        """Extend the output and self.columns with columns that first appear after the header was written."""
+        raise ValueError(f"{type(self).__name__} cannot add columns after the first batch. Found new columns: {new_columns}. Pass the full column list when creating the writer.")
+
+    def _open(self) -> None:
+        raise NotImplementedError
+
+    def _write_rows(self, rows: List[Tuple]) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        raise NotImplementedError
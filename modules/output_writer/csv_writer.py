@@ -0,0 +1,53 @@
+import csv
+import os
+from pathlib import Path
+from typing import List, Optional, Union, Tuple
+
+from .base_writer import BatchWriter
+
+class CsvWriter(BatchWriter):
+    """Append record batches to a CSV file through a large write buffer.
+
+    Columns that first appear in a later batch extend the header: the file is rewritten once
+    with empty values for them in the rows already written, then appending continues.
+    """
+
+    file_extension = ".csv"
+
+    def __init__(self, output_path: Union[str, Path], columns: Optional[List[str]] = None, buffer_size: int = 1024 * 1024, encoding: str = "utf-8"):
+        """Initialize the writer with its output file, optional columns, and write buffer size in bytes."""
+        super().__init__(output_path, columns)
+        self.buffer_size = buffer_size
+        self.encoding = encoding
+        self._file = None
+        self._writer = None
+
+    def _open(self) -> None:
+        self._file = open(self.output_path, "w", newline="", encoding=self.encoding, buffering=self.buffer_size)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def _add_columns(self, new_columns: List[str]) -> None:
+        self._file.close()
+        self.columns.extend(new_columns)
+        padding = [""] * len(new_columns)
+        temporary_path = self.output_path.with_name(f"{self.output_path.name}.{os.getpid()}.tmp")
+        with open(self.output_path, "r", newline="", encoding=self.encoding) as source, \
+                open(temporary_path, "w", newline="", encoding=self.encoding, buffering=self.buffer_size) as target:
+            reader = csv.reader(source)
+            writer = csv.writer(target)
+            next(reader, None)
+            writer.writerow(self.columns)
+            for row in reader:
+                writer.writerow(row + padding)
+        os.replace(temporary_path, self.output_path)
+        self._file = open(self.output_path, "a", newline="", encoding=self.encoding, buffering=self.buffer_size)
+        self._writer = csv.writer(self._file)
+
+    def _write_rows(self, rows: List[Tuple]) -> None:
+        self._writer.writerows(rows)
+
+    def _close(self) -> None:
+        self._file.close()
+        self._file = None
+        self._writer = None
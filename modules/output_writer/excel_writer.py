@@ -0,0 +1,100 @@
+import importlib.util
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Union, Tuple
+
+from .base_writer import BatchWriter
+
+EXCEL_MAX_ROWS = 1048576
+
+class ExcelWriter(BatchWriter):
+    """Write record batches to an .xlsx workbook with a constant-memory streaming writer.
+
+    Uses xlsxwriter in constant_memory mode when installed, otherwise openpyxl in write-only
+    mode. Neither can go back to the header row, so batches are spooled to a temporary file
+    as JSON lines and the workbook is streamed from it on close, once every column is known.
+    When a sheet reaches Excel's row limit, writing continues on a new sheet.
+    """
+
+    file_extension = ".xlsx"
+
+    def __init__(self, output_path: Union[str, Path], columns: Optional[List[str]] = None, sheet_name: str = "export"):
+        """Initialize the writer with its workbook file, optional columns and base sheet name."""
+        super().__init__(output_path, columns)
+        self.sheet_name = sheet_name
+        self._workbook = None
+        self._worksheet = None
+        self._backend = None
+        self._sheet_count = 0
+        self._sheet_row = 0
+        self._spool = None
+        self._spool_path: Optional[Path] = None
+
+    def _open(self) -> None:
+        if importlib.util.find_spec("xlsxwriter"):
+            self._backend = "xlsxwriter"
+        elif importlib.util.find_spec("openpyxl"):
+            self._backend = "openpyxl"
+        else:
+            raise ImportError("Excel output requires 'xlsxwriter' or 'openpyxl'. Install one of them to use output_filetype 'excel'.")
+        self._spool_path = self.output_path.with_name(f"{self.output_path.name}.{os.getpid()}.rows.tmp")
+        self._spool = open(self._spool_path, "w", encoding="utf-8")
+
+    def _add_columns(self, new_columns: List[str]) -> None:
+        # Spooled rows are padded to the final header when the workbook is written
+        self.columns.extend(new_columns)
+
+    def _write_rows(self, rows: List[Tuple]) -> None:
+        self._spool.writelines(json.dumps(row, default=str) + "\n" for row in rows)
+
+    def _open_workbook(self) -> None:
+        """Create the workbook with the backend chosen in _open."""
+        if self._backend == "xlsxwriter":
+            import xlsxwriter
+            self._workbook = xlsxwriter.Workbook(str(self.output_path), {"constant_memory": True, "strings_to_urls": False})
+        else:
+            import openpyxl
+            self._workbook = openpyxl.Workbook(write_only=True)
+
+    def _add_sheet(self) -> None:
+        """Start a new worksheet and write the header row."""
+        self._sheet_count += 1
+        name = self.sheet_name if self._sheet_count == 1 else f"{self.sheet_name}_{self._sheet_count}"
+        if self._backend == "xlsxwriter":
+            self._worksheet = self._workbook.add_worksheet(name)
+            self._worksheet.write_row(0, 0, self.columns)
+        else:
+            self._worksheet = self._workbook.create_sheet(name)
+            self._worksheet.append(self.columns)
+        self._sheet_row = 1
+
+    def _write_row(self, row: List) -> None:
+        """Write one row, continuing on a new sheet at Excel's row limit."""
+        if self._sheet_row >= EXCEL_MAX_ROWS:
+            self._add_sheet()
+        if self._backend == "xlsxwriter":
+            self._worksheet.write_row(self._sheet_row, 0, row)
+        else:
+            self._worksheet.append(row)
+        self._sheet_row += 1
+
+    def _close(self) -> None:
+        self._spool.close()
+        self._spool = None
+        try:
+            self._open_workbook()
+            self._add_sheet()
+            with open(self._spool_path, "r", encoding="utf-8") as spool:
+                for line in spool:
+                    row = json.loads(line)
+                    self._write_row(row + [None] * (len(self.columns) - len(row)))
+            if self._backend == "xlsxwriter":
+                self._workbook.close()
+            else:
+                self._workbook.save(self.output_path)
+        finally:
+            os.remove(self._spool_path)
+            self._spool_path = None
+            self._workbook = None
+            self._worksheet = None
@@ -0,0 +1,137 @@
+import os
+from pathlib import Path
+from typing import Any, List, Optional, Union, Tuple
+
+from .base_writer import BatchWriter
+
+# Rows held back while a column has only nulls, so its type comes from data instead of a guess
+SCHEMA_INFERENCE_ROWS = 10000
+
+class ParquetWriter(BatchWriter):
+    """Append record batches to a Parquet file as row groups using pyarrow.
+
+    A Parquet file has one schema, fixed when the file is opened. Batches are held back until
+    every column has a non-null value or SCHEMA_INFERENCE_ROWS rows are buffered; columns that
+    are still empty then become strings. Later values that do not fit a column's type are cast
+    to it where Arrow can do so safely, and written as text in string columns.
+
+    A column that first appears in a later batch closes the current file as a part; the next
+    part gets the wider schema, and on close the parts are merged into one file with nulls
+    for the columns a part lacks.
+    """
+
+    file_extension = ".parquet"
+
+    def __init__(self, output_path: Union[str, Path], columns: Optional[List[str]] = None, compression: str = "snappy"):
+        """Initialize the writer with its output file, optional columns and compression codec."""
+        super().__init__(output_path, columns)
+        self.compression = compression
+        self._pa = None
+        self._pq = None
+        self._writer = None
+        self._schema = None
+        self._pending: List[Tuple] = []
+        self._parts: List[Path] = []
+
+    def _open(self) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet output requires 'pyarrow'. Install it to use output_filetype 'parquet'.")
+        self._pa = pa
+        self._pq = pq
+
+    def _add_columns(self, new_columns: List[str]) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._move_to_part()
+        self.columns.extend(new_columns)
+        padding = (None,) * len(new_columns)
+        self._pending = [row + padding for row in self._pending]
+
+    def _move_to_part(self) -> None:
+        """Move the file written so far aside as a part to be merged on close."""
+        part_path = self.output_path.with_name(f"{self.output_path.name}.{os.getpid()}.part{len(self._parts)}")
+        os.replace(self.output_path, part_path)
+        self._parts.append(part_path)
+
+    def _write_rows(self, rows: List[Tuple]) -> None:
+        if self._writer is None:
+            self._pending.extend(rows)
+            locked = set(self._schema.names) if self._schema is not None else set()
+            undecided = (values for column, values in zip(self.columns, zip(*self._pending)) if column not in locked)
+            if len(self._pending) < SCHEMA_INFERENCE_ROWS and any(all(value is None for value in values) for values in undecided):
+                return
+            self._open_writer()
+            rows, self._pending = self._pending, []
+        self._write_table(rows)
+
+    def _open_writer(self) -> None:
+        """Fix the schema from the buffered rows and open the Parquet file."""
+        pa = self._pa
+        locked = {field.name: field for field in self._schema} if self._schema is not None else {}
+        fields = []
+        for column, values in zip(self.columns, zip(*self._pending)):
+            if column in locked:
+                fields.append(locked[column])
+                continue
+            try:
+                column_type = pa.array(list(values)).type
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed value types in one column are kept as text
+                column_type = pa.string()
+            fields.append(pa.field(column, pa.string() if pa.types.is_null(column_type) else column_type))
+        self._schema = pa.schema(fields)
+        self._writer = self._pq.ParquetWriter(str(self.output_path), self._schema, compression=self.compression)
+
+    def _write_table(self, rows: List[Tuple]) -> None:
+        """Write rows as one row group with the locked schema."""
+        arrays = [self._column_array(values, field) for values, field in zip(zip(*rows), self._schema)]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+
+    def _column_array(self, values: Tuple, field) -> Any:
+        """Build a column of the locked field type, casting values that Arrow typed differently."""
+        pa = self._pa
+        try:
+            return pa.array(values, type=field.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        if pa.types.is_string(field.type):
+            return pa.array([None if value is None else str(value) for value in values], type=field.type)
+        try:
+            return pa.array(values).cast(field.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            raise ValueError(f"Column '{field.name}' was written as '{field.type}' and a later batch has values that cannot be converted: {e}") from e
+
+    def _close(self) -> None:
+        if self._writer is None and self._pending:
+            self._open_writer()
+            self._write_table(self._pending)
+            self._pending = []
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = None
+        if self._parts:
+            if self.output_path.exists():
+                self._move_to_part()
+            self._merge_parts()
+
+    def _merge_parts(self) -> None:
+        """Rewrite the parts batch by batch into the output file with the final schema."""
+        pa = self._pa
+        writer = self._pq.ParquetWriter(str(self.output_path), self._schema, compression=self.compression)
+        try:
+            for part_path in self._parts:
+                for batch in self._pq.ParquetFile(str(part_path)).iter_batches():
+                    arrays = [
+                        batch.column(field.name) if field.name in batch.schema.names else pa.nulls(batch.num_rows, field.type)
+                        for field in self._schema
+                    ]
+                    writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        finally:
+            writer.close()
+        for part_path in self._parts:
+            os.remove(part_path)
+        self._parts = []
@@ -0,0 +1,79 @@
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Union, Tuple
+
+from .base_writer import BatchWriter
+
+def quote_identifier(name: str) -> str:
+    """Quote a table or column name for use in SQLite statements."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+class SqliteWriter(BatchWriter):
+    """Append record batches to a SQLite table with one executemany transaction per batch.
+
+    With key_columns, rows are upserted on those columns instead of appended, so an existing
+    table can be updated in place by incremental exports.
+    """
+
+    file_extension = ".sqlite"
+
+    def __init__(self, output_path: Union[str, Path], table_name: str = "export", columns: Optional[List[str]] = None, replace_table: bool = True, key_columns: Optional[List[str]] = None):
+        """Initialize the writer with its database file, table name, optional columns and optional upsert key."""
+        super().__init__(output_path, columns)
+        self.table_name = table_name
+        self.replace_table = replace_table
+        self.key_columns = list(key_columns) if key_columns else None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._insert_sql = ""
+
+    def _open(self) -> None:
+        self._connection = sqlite3.connect(self.output_path)
+        # WAL with NORMAL sync keeps each batch commit to a sequential append
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+
+        table = quote_identifier(self.table_name)
+        column_sql = ", ".join(quote_identifier(column) for column in self.columns)
+        with self._connection:
+            if self.replace_table:
+                self._connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self._connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({column_sql})")
+            existing = [row[1] for row in self._connection.execute(f"PRAGMA table_info({table})")]
+            for column in self.columns:
+                if column not in existing:
+                    self._connection.execute(f"ALTER TABLE {table} ADD COLUMN {quote_identifier(column)}")
+            existing = set(existing) | set(self.columns)
+            if self.key_columns:
+                missing_keys = [column for column in self.key_columns if column not in existing]
+                if missing_keys:
+                    raise ValueError(f"Upsert key columns {missing_keys} are not present in table '{self.table_name}'")
+                index = quote_identifier(f"{self.table_name}_upsert_key")
+                key_sql = ", ".join(quote_identifier(column) for column in self.key_columns)
+                self._connection.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {index} ON {table} ({key_sql})")
+        self._prepare_insert()
+
+    def _prepare_insert(self) -> None:
+        """Build the INSERT statement once for the current column list."""
+        column_sql = ", ".join(quote_identifier(column) for column in self.columns)
+        placeholders = ", ".join("?" for _ in self.columns)
+        verb = "INSERT OR REPLACE" if self.key_columns else "INSERT"
+        self._insert_sql = f"{verb} INTO {quote_identifier(self.table_name)} ({column_sql}) VALUES ({placeholders})"
+
+    def _add_columns(self, new_columns: List[str]) -> None:
+        table = quote_identifier(self.table_name)
+        with self._connection:
+            # A table kept from an earlier run may already have columns this run has not seen yet
+            existing = {row[1] for row in self._connection.execute(f"PRAGMA table_info({table})")}
+            for column in new_columns:
+                if column not in existing:
+                    self._connection.execute(f"ALTER TABLE {table} ADD COLUMN {quote_identifier(column)}")
+        self.columns.extend(new_columns)
+        self._prepare_insert()
+
+    def _write_rows(self, rows: List[Tuple]) -> None:
+        with self._connection:
+            self._connection.executemany(self._insert_sql, rows)
+
+    def _close(self) -> None:
+        self._connection.close()
+        self._connection = None
@@ -0,0 +1,34 @@
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+from .base_writer import BatchWriter
+from .csv_writer import CsvWriter
+from .excel_writer import ExcelWriter
+from .parquet_writer import ParquetWriter
+from .sqlite_writer import SqliteWriter
+
+WRITERS = {
+    "sqlite": SqliteWriter,
+    "csv": CsvWriter,
+    "excel": ExcelWriter,
+    "parquet": ParquetWriter,
+}
+
+def create_writer(config: Dict[str, Any], output_name: str, columns: Optional[List[str]] = None, output_dir: Optional[Union[str, Path]] = None, key_columns: Optional[List[str]] = None) -> BatchWriter:
+    """Create the batch writer for config["output_filetype"], writing '<output_name><extension>' under the output directory.
+
+    key_columns makes the writer upsert on those columns, which only the sqlite output supports.
+    """
+    output_filetype = config.get("output_filetype", "csv")
+    writer_class = WRITERS.get(output_filetype)
+    if writer_class is None:
+        raise ValueError(f"Unsupported output_filetype '{output_filetype}'. Allowed values are: {list(WRITERS)}")
+
+    output_dir = Path(output_dir if output_dir is not None else config.get("output_path", "output"))
+    output_path = output_dir / f"{output_name}{writer_class.file_extension}"
+
+    if writer_class is SqliteWriter:
+        return SqliteWriter(output_path, table_name=output_name, columns=columns, key_columns=key_columns)
+    if key_columns:
+        raise ValueError(f"output_filetype '{output_filetype}' does not support upserts. Use 'sqlite' for incremental exports.")
+    return writer_class(output_path, columns=columns)
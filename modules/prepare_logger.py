@@ -1,25 +1,116 @@
+import atexit
+import json
 import logging
+import queue
 from logging import Logger
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import sys
 import os
+import time
 from datetime import datetime
+from typing import Optional
+
+QUEUE_POLICIES = ("block", "drop")
+
+# Attributes every LogRecord has; anything else was passed through 'extra' and goes into JSON output
+_STANDARD_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
 
 class CustomFormatter(logging.Formatter):
-    """Custom formatter for microsecond-level timestamp logging."""
-    
+    """Custom formatter for microsecond-level timestamp logging.
+
+    The date part of the timestamp is formatted once per second and cached, so each record
+    only pays for inserting its sub-second digits. '%f' in datefmt is replaced by microseconds.
+    With json_lines, each record is rendered as a single JSON object.
+    """
+
+    def __init__(self, fmt=None, datefmt=None, style='%', json_lines: bool = False, **kwargs):
+        super().__init__(fmt, datefmt, style, **kwargs)
+        self.json_lines = json_lines
+        # ((second, datefmt), formatted parts), replaced as a whole so handler threads never see a torn cache
+        self._cache = ((None, None), ())
+
     def formatTime(self, record, datefmt=None):
-        """Format log timestamp to include milliseconds."""
-        ct = self.converter(record.created)
-        if datefmt:
-            s = datetime.fromtimestamp(record.created).strftime(datefmt)
-        else:
-            t = datetime.fromtimestamp(record.created)
-            s = t.strftime("%Y-%m-%d %H:%M:%S") + ",%03d" % (record.msecs)
-        return s
-
-def prepare_logger(log_path: str, output_name_prefix="") -> Logger:
-    """Create and configure a logger with console and rotating file handlers."""
+        """Format log timestamp to include milliseconds, or microseconds where datefmt contains '%f'."""
+        second = int(record.created)
+        cache_key, formatted_parts = self._cache
+        if cache_key != (second, datefmt):
+            ct = self.converter(record.created)
+            if datefmt:
+                formatted_parts = tuple(time.strftime(part, ct) for part in datefmt.split("%f"))
+            else:
+                formatted_parts = (time.strftime("%Y-%m-%d %H:%M:%S", ct) + ",",)
+            self._cache = ((second, datefmt), formatted_parts)
+
+        if not datefmt:
+            return "%s%03d" % (formatted_parts[0], record.msecs)
+        if len(formatted_parts) == 1:
+            return formatted_parts[0]
+        microseconds = "%06d" % min(999999, int((record.created - second) * 1000000))
+        return microseconds.join(formatted_parts)
+
+    def format(self, record):
+        if not self.json_lines:
+            return super().format(record)
+
+        entry = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler for a bounded queue that either blocks or drops records when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue, policy: str = "block"):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unsupported log queue policy '{policy}'. Allowed values are: {list(QUEUE_POLICIES)}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+
+    def enqueue(self, record):
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class BlockingSentinelQueueListener(QueueListener):
+    """QueueListener whose stop sentinel waits for room in a bounded queue instead of failing."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+def _stop_listener(listener: QueueListener, queue_handler: BoundedQueueHandler, handlers) -> None:
+    """Drain the queue on exit and report any records dropped while it was full."""
+    listener.stop()
+    if queue_handler.dropped:
+        record = logging.LogRecord(__name__, logging.WARNING, __file__, 0, f"Log queue was full; dropped '{queue_handler.dropped}' records", None, None)
+        for handler in handlers:
+            handler.handle(record)
+
+def prepare_logger(log_path: str, output_name_prefix="", use_queue: bool = False, queue_size: int = 10000, queue_policy: str = "block", json_lines: bool = False, logger_name: Optional[str] = None) -> Logger:
+    """Create and configure a logger with console and rotating file handlers.
+
+    With use_queue, records are handed to a bounded queue and written by a QueueListener on a
+    background thread, so console and file I/O never blocks the caller (such as the event loop).
+    queue_policy decides what happens when the queue is full: 'block' waits, 'drop' discards.
+    With json_lines, the log file is written as one JSON object per line for log shippers.
+    A logger is configured once per logger_name (this module's name by default); later calls
+    with the same name return it unchanged, so a config that needs its own log file and
+    settings needs its own name.
+    """
     
     if not os.path.exists(log_path):
         os.makedirs(log_path)  # Ensure log directory exists
@@ -27,9 +118,12 @@ def prepare_logger(log_path: str, output_name_prefix="") -> Logger:
     timestamp_str = datetime.now().strftime('%Y_%m_%d_%H%M%S')
     log_file = os.path.join(log_path, f"{output_name_prefix}{timestamp_str}.log")
 
-    logger = logging.getLogger(__name__)
+    logger = logging.getLogger(logger_name or __name__)
     logger.setLevel(logging.DEBUG)
 
+    if logger.hasHandlers():
+        return logger
+
     log_format = CustomFormatter(fmt='%(asctime)s %(levelname)s: %(message)s',
                                  datefmt='%Y-%m-%d %H:%M:%S.%f')
 
@@ -41,9 +135,18 @@ def prepare_logger(log_path: str, output_name_prefix="") -> Logger:
     # File handler with log rotation
     file_handler = RotatingFileHandler(log_file, maxBytes=10485760, backupCount=5)
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(log_format)
+    if json_lines:
+        file_handler.setFormatter(CustomFormatter(datefmt='%Y-%m-%dT%H:%M:%S.%f%z', json_lines=True))
+    else:
+        file_handler.setFormatter(log_format)
 
-    if not logger.hasHandlers():
+    if use_queue:
+        queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), queue_policy)
+        listener = BlockingSentinelQueueListener(queue_handler.queue, console_handler, file_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(_stop_listener, listener, queue_handler, (console_handler, file_handler))
+        logger.addHandler(queue_handler)
+    else:
         logger.addHandler(console_handler)
         logger.addHandler(file_handler)
 
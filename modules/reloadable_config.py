@@ -0,0 +1,198 @@
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+
+from .config_loader import ConfigLoader, SensitiveDict, load_validation_plan, read_yaml_config
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional, polling is used without it
+    Observer = None
+    FileSystemEventHandler = object
+
+ConfigCallback = Callable[[Dict[str, Any], Dict[str, Any]], None]
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Wake the reload loop as soon as the file system reports a change."""
+
+    def __init__(self, changed: threading.Event):
+        super().__init__()
+        self.changed = changed
+
+    def on_any_event(self, event):
+        self.changed.set()
+
+
+class ReloadableConfig:
+    """Config handle that watches its config, auth and rules files and swaps in revalidated configs.
+
+    Files are polled by mtime and size every poll_interval seconds. When watchdog is installed,
+    native file system events (inotify and similar) wake the check early. An edit that fails to
+    load or validate is logged and rejected, and the last good config stays active. Only the
+    first load goes through ConfigLoader; reloads validate the new files with the cached
+    validation plans and keep the logger set up by that first load.
+    """
+
+    def __init__(self, config_path: Union[str, Path], rules_dir: Optional[Union[str, Path]] = None, poll_interval: float = 1.0):
+        """Load and validate the initial config; raises like ConfigLoader if it is invalid."""
+        self.config_path = Path(config_path)
+        self.rules_dir = Path(rules_dir) if rules_dir else Path("configs/validation")
+        self.poll_interval = poll_interval
+
+        loader = ConfigLoader(self.config_path, rules_dir)
+        self._config: Dict[str, Any] = loader.config
+        self.logger = loader.logger
+        self.version = 1
+
+        self._subscribers: List[Tuple[ConfigCallback, Any]] = []
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._observer = None
+        self._signatures = self._file_signatures()
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Return the currently active validated config."""
+        return self._config
+
+    def subscribe(self, callback: ConfigCallback, loop=None) -> None:
+        """Call callback(new_config, old_config) after each successful reload.
+
+        When loop is given the callback is scheduled on that asyncio loop instead of running
+        on the watcher thread.
+        """
+        with self._lock:
+            self._subscribers.append((callback, loop))
+
+    def unsubscribe(self, callback: ConfigCallback) -> None:
+        """Stop notifying callback."""
+        with self._lock:
+            self._subscribers = [(cb, loop) for cb, loop in self._subscribers if cb is not callback]
+
+    def watched_paths(self) -> List[Path]:
+        """Return the config, authentication and rules files that trigger a reload."""
+        paths = [self.config_path, self.rules_dir / "config_rules.yaml", self.rules_dir / "auth_rules.yaml"]
+        auth_path = self._config.get("authentication_path")
+        if auth_path:
+            paths.append(Path(auth_path))
+        return paths
+
+    def _file_signatures(self) -> Dict[Path, Optional[Tuple[int, int]]]:
+        signatures = {}
+        for path in self.watched_paths():
+            try:
+                stat = os.stat(path)
+                signatures[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signatures[path] = None
+        return signatures
+
+    def check_for_changes(self) -> bool:
+        """Reload if any watched file changed since the last check; return True if a new config was swapped in."""
+        signatures = self._file_signatures()
+        if signatures == self._signatures:
+            return False
+        self._signatures = signatures
+        return self.reload()
+
+    def reload(self) -> bool:
+        """Load and validate the config again and swap it in atomically; keep the current config on failure."""
+        try:
+            new_config = self._load_validated()
+        except Exception as e:
+            self.logger.error(f"ReloadableConfig: Rejected change to '{self.config_path}', keeping version {self.version}: {e}")
+            return False
+
+        old_config = self._config
+        self._config = new_config
+        self.version += 1
+        # The auth file may have moved, so refresh what is being watched
+        self._signatures = self._file_signatures()
+        self.logger.info(f"ReloadableConfig: Loaded version {self.version} of '{self.config_path}'")
+        self._notify(self._config, old_config)
+        return True
+
+    def _load_validated(self) -> Dict[str, Any]:
+        """Read the config and its authentication file and validate them like ConfigLoader, without setting up logging."""
+        config = read_yaml_config(self.config_path)
+        config_plan = load_validation_plan(self.rules_dir / "config_rules.yaml")
+        errors = config_plan.run(config)
+        if errors:
+            raise ValueError("\n".join(errors))
+
+        auth_path = config.get("authentication_path")
+        if auth_path:
+            if not Path(auth_path).is_file():
+                raise FileNotFoundError(f"Authentication path '{auth_path}' does not exist or is not a valid file.")
+            auth_data = read_yaml_config(auth_path)
+            auth_plan = load_validation_plan(self.rules_dir / "auth_rules.yaml")
+            errors = auth_plan.run(auth_data)
+            if errors:
+                raise ValueError("\n".join(errors))
+            config["auth"] = SensitiveDict(auth_data)
+            if "include_config_rules_in_output" in config:
+                config["config_validation_rules"] = config_plan.rules
+                config["auth_validation_rules"] = auth_plan.rules
+
+        config["logger"] = self.logger
+        return config
+
+    def _notify(self, new_config: Dict[str, Any], old_config: Dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback, loop in subscribers:
+            if loop is not None:
+                loop.call_soon_threadsafe(callback, new_config, old_config)
+                continue
+            try:
+                callback(new_config, old_config)
+            except Exception as e:
+                self.logger.error(f"ReloadableConfig: Subscriber {callback!r} failed: {e}")
+
+    def start(self) -> "ReloadableConfig":
+        """Start watching in a background thread."""
+        if self._thread is not None:
+            return self
+        self._stopped.clear()
+        if Observer is not None:
+            self._observer = Observer()
+            handler = _ChangeHandler(self._changed)
+            for directory in {path.resolve().parent for path in self.watched_paths() if path.resolve().parent.is_dir()}:
+                self._observer.schedule(handler, str(directory), recursive=False)
+            self._observer.start()
+        self._thread = threading.Thread(target=self._watch, name="ReloadableConfig", daemon=True)
+        self._thread.start()
+        return self
+
+    def _watch(self) -> None:
+        while not self._stopped.is_set():
+            self._changed.wait(self.poll_interval)
+            self._changed.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.check_for_changes()
+            except Exception as e:
+                self.logger.error(f"ReloadableConfig: Error while checking for changes: {e}")
+
+    def stop(self) -> None:
+        """Stop watching and wait for the watcher thread to exit."""
+        self._stopped.set()
+        self._changed.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ReloadableConfig":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
@@ -1,70 +1,573 @@
-import aiohttp
 import asyncio
-import pandas as pd
-from typing import List, Dict, Any, Callable
+import inspect
+import json
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import List, Dict, Any, Callable, AsyncIterator, Optional, Tuple, TYPE_CHECKING
+
+from .concurrency import AdaptiveConcurrencyLimiter, gather_or_cancel
+from .metrics import RequestMetrics, routed_trace_config
+from .pagination import PageSizePagination
+from .processing import create_processing_executor, worker_safe_config
+from .response_cache import CachedResponse, ResponseCache
+from .results import as_records, check_result_format, combine_batches
+from .retry import RetryPolicy
+from .session_manager import SessionManager, borrow_session, request_timeout
+
+if TYPE_CHECKING:
+    # Only imported for annotations; aiohttp is loaded by the session manager when a run starts
+    import aiohttp
+
+DEFAULT_STREAM_BATCH_SIZE = 1000
+DEFAULT_PROGRESS_LOG_INTERVAL = 100
 
 class HttpRequestProcessor:
-    def __init__(self, config, request_bundle: List[str], request_header: Dict[str, str], data_processor: Callable[[Any], List[Dict]], method: str = 'GET', payload: Dict[str, Any] = None):
-        """Initialize the request processor with config, requests, headers, and method."""
+    def __init__(self, config, request_bundle: List[str], request_header: Dict[str, str], data_processor: Callable[[Any], List[Dict]], method: str = 'GET', payload: Dict[str, Any] = None, retry_policy: RetryPolicy = None, session_manager: SessionManager = None, response_cache: ResponseCache = None, metrics: RequestMetrics = None, request_budget=None):
+        """Initialize the request processor with config, requests, headers, method, retry policy, and optional shared session manager, response cache, metrics collector and request budget.
+
+        request_budget is a limiter shared with other processors (anything usable with 'async with',
+        such as an asyncio.Semaphore); every request also holds one of its slots while in flight.
+        """
         self.config = config
         self.request_bundle = request_bundle
         self.request_header = request_header
         self.data_processor = data_processor
         self.method = method.upper()  # Ensure method is uppercase (GET, POST, etc.)
         self.payload = payload 
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy.from_config(config)
+        self.failed_requests: List[Dict[str, Any]] = []
+        self.limiter = None
+        self.session_manager = session_manager
+        self.response_cache = response_cache if response_cache is not None else ResponseCache.from_config(config)
+        # A cache passed in is closed by its owner; one opened from the config is closed by close()
+        self._owns_response_cache = response_cache is None
+        self.metrics = metrics if metrics is not None else (RequestMetrics() if config.get("collect_metrics", False) else None)
+        # A collector passed in may be shared with other processors, so only one created here is reset per run
+        self._owns_metrics = metrics is None
+        # Extra arguments of every request; the config's timeouts are added when a run starts
+        self._request_kwargs: Dict[str, Any] = {"trace_request_ctx": self.metrics}
+        self.request_budget = request_budget
+        self._executor = None
+        self._processor_config = None
+        self._completed_requests = 0
+        self._run_total: Optional[int] = None
+
+    async def fetch(self, session: "aiohttp.ClientSession", url: str, limiter=None) -> Any:
+        """Make an async request to the given URL, retrying transient failures according to the retry policy.
+
+        Each attempt holds a slot of limiter, the run's concurrency limiter, which is given back
+        while waiting to retry so other requests can use it.
+        """
+        cached = None
+        if self.response_cache is not None and self.method == 'GET':
+            # Looked up once per request; a stale entry is passed on for conditional revalidation
+            key = self.response_cache.make_key(self.method, url, self.request_header)
+            entry = await self.response_cache.aget(key)
+            if entry is not None and self.response_cache.is_fresh(entry):
+                self._log_request_detail(f"Request to '{url}' served from cache")
+                self._count("cache_hits")
+                self._request_completed()
+                return await self.response_cache.amark_hit(entry)
+            cached = (key, entry)
+
+        attempt = 0
+        while True:
+            self._log_request_detail(f"Making '{self.method}' request to '{url}'")
+            try:
+                response = await self._attempt(session, url, cached, limiter)
+                self._request_completed()
+                return response
+            except Exception as e:
+                if not self.retry_policy.should_retry(attempt, e):
+                    self.config["logger"].error(f"Error making '{self.method}' request to '{url}': {e}")
+                    raise
+                delay = self.retry_policy.delay(attempt, e)
+                attempt += 1
+                self._count("retries")
+                self.config["logger"].warning(f"Retrying '{self.method}' request to '{url}' in {delay:.2f}s (attempt {attempt} of {self.retry_policy.retry_attempts}): {e}")
+                await asyncio.sleep(delay)
+
+    async def _attempt(self, session: "aiohttp.ClientSession", url: str, cached: Optional[Tuple[str, Optional[CachedResponse]]], limiter=None) -> Any:
+        """Send one attempt of a request while holding a slot of limiter, when one is given."""
+        if limiter is None:
+            return await self._send(session, url, cached)
+        waiting_since = time.perf_counter()
+        async with limiter:
+            self._observe("semaphore_wait", time.perf_counter() - waiting_since)
+            with self._timed("in_flight"):
+                return await self._send(session, url, cached)
+
+    def _log_request_detail(self, message: str) -> None:
+        """Log a per-request line, only when config["log_request_details"] is enabled."""
+        if self.config.get("log_request_details", False):
+            self.config["logger"].debug(message)
+
+    def _request_completed(self) -> None:
+        """Count a completed request and log aggregated progress every config["log_progress_interval"] requests."""
+        self._completed_requests += 1
+        interval = self.config.get("log_progress_interval", DEFAULT_PROGRESS_LOG_INTERVAL)
+        if interval and (self._completed_requests % interval == 0 or self._completed_requests == self._run_total):
+            of_total = f" of '{self._run_total}'" if self._run_total is not None else ""
+            self.config["logger"].info(f"AsyncRequestProcessor: Completed '{self._completed_requests}'{of_total} requests")
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        """Increase a metrics counter when metrics are being collected."""
+        if self.metrics is not None:
+            self.metrics.count(name, amount)
 
-    async def fetch(self, session: aiohttp.ClientSession, url: str) -> Any:
-        """Make an async request to the given URL using the specified HTTP method."""
-        self.config["logger"].info(f"Making '{self.method}' request to '{url}'")
+    @contextmanager
+    def _timed(self, name: str):
+        """Time the enclosed block into the named metrics timer when metrics are being collected."""
+        if self.metrics is None:
+            yield
+            return
+        started = time.perf_counter()
         try:
-            if self.method == 'GET':
-                async with session.get(url, headers=self.request_header) as response:
-                    return await self._handle_response(response, url)
-            elif self.method == 'POST':
-                async with session.post(url, headers=self.request_header, json=self.payload) as response:
-                    return await self._handle_response(response, url)
-            # elif self.method == 'PUT':
-            #     async with session.put(url, headers=self.request_header, json=self.payload) as response:
-            #         return await self._handle_response(response, url)
-            # elif self.method == 'DELETE':
-            #     async with session.delete(url, headers=self.request_header) as response:
-            #         return await self._handle_response(response, url)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {self.method}")
+            yield
+        finally:
+            self.metrics.observe(name, time.perf_counter() - started)
+
+    def _observe(self, name: str, seconds: float) -> None:
+        """Record a duration into the named metrics timer when metrics are being collected."""
+        if self.metrics is not None:
+            self.metrics.observe(name, seconds)
+
+    def _trace_configs(self) -> Optional[List["aiohttp.TraceConfig"]]:
+        """Return the trace configs for sessions created by this processor."""
+        return [routed_trace_config()] if self.metrics is not None else None
+
+    def _record_attempt(self, started: float, status: Optional[int]) -> None:
+        """Feed the latency and status of a request attempt back to an adaptive limiter."""
+        if isinstance(self.limiter, AdaptiveConcurrencyLimiter):
+            self.limiter.record_response(time.monotonic() - started, status)
+
+    def progress(self) -> Dict[str, Any]:
+        """Return the current run's completed request count, its total when known, and the number of failed requests."""
+        return {"completed": self._completed_requests, "total": self._run_total, "failed": len(self.failed_requests)}
+
+    def close(self) -> None:
+        """Close the response cache if this processor opened it from the config."""
+        if self._owns_response_cache and self.response_cache is not None:
+            self.response_cache.close()
+            self.response_cache = None
+
+    def __enter__(self) -> "HttpRequestProcessor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    async def _send(self, session: "aiohttp.ClientSession", url: str, cached: Optional[Tuple[str, Optional[CachedResponse]]] = None) -> Any:
+        """Send a single request, holding a slot of the shared request budget while it is in flight."""
+        if self.request_budget is None:
+            return await self._timed_send(session, url, cached)
+        async with self.request_budget:
+            return await self._timed_send(session, url, cached)
+
+    async def _timed_send(self, session: "aiohttp.ClientSession", url: str, cached: Optional[Tuple[str, Optional[CachedResponse]]] = None) -> Any:
+        """Send a single request and report its latency and status to an adaptive limiter.
+
+        Timed only once the request budget is held, so waiting behind other jobs does not read as server latency.
+        """
+        started = time.monotonic()
+        try:
+            response = await self._send_request(session, url, cached)
         except Exception as e:
-            self.config["logger"].error(f"Error making '{self.method}' request to '{url}': {e}")
+            self._record_attempt(started, getattr(e, "status", None))
             raise
+        self._record_attempt(started, 200)
+        return response
+
+    async def _send_request(self, session: "aiohttp.ClientSession", url: str, cached: Optional[Tuple[str, Optional[CachedResponse]]] = None) -> Any:
+        """Send a single request to the given URL using the specified HTTP method.
+
+        cached is the (key, entry) pair fetch already looked up in the response cache.
+        """
+        if self.method == 'GET':
+            if self.response_cache is not None:
+                if cached is None:
+                    key = self.response_cache.make_key(self.method, url, self.request_header)
+                    cached = (key, await self.response_cache.aget(key))
+                return await self._cached_get(session, url, *cached)
+            async with session.get(url, headers=self.request_header, **self._request_kwargs) as response:
+                return await self._handle_response(response, url)
+        elif self.method == 'POST':
+            async with session.post(url, headers=self.request_header, json=self.payload, **self._request_kwargs) as response:
+                return await self._handle_response(response, url)
+        # elif self.method == 'PUT':
+        #     async with session.put(url, headers=self.request_header, json=self.payload) as response:
+        #         return await self._handle_response(response, url)
+        # elif self.method == 'DELETE':
+        #     async with session.delete(url, headers=self.request_header) as response:
+        #         return await self._handle_response(response, url)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {self.method}")
+
+    async def _cached_get(self, session: "aiohttp.ClientSession", url: str, key: str, entry: Optional[CachedResponse]) -> Any:
+        """Make a GET request, revalidating the cached entry, if any, with a conditional request and storing fresh responses."""
+        headers = dict(self.request_header or {})
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+
+        async with session.get(url, headers=headers, **self._request_kwargs) as response:
+            if response.status == 304 and entry is not None:
+                self._log_request_detail(f"Request to '{url}' not modified, served from cache")
+                return await self.response_cache.amark_hit(entry, revalidated=True)
+            data = await self._handle_response(response, url)
+            await self.response_cache.astore(key, url, data, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return data
 
     async def _handle_response(self, response, url: str) -> Any:
         """Handle the HTTP response and return JSON data if successful."""
         if response.status == 200:
-            self.config["logger"].info(f"Request to '{url}' succeeded with status '{response.status}'")
+            self._log_request_detail(f"Request to '{url}' succeeded with status '{response.status}'")
             return await response.json()
         else:
             self.config["logger"].error(f"Request to '{url}' failed with status '{response.status}'")
             response.raise_for_status()
 
-    async def make_requests(self, config) -> pd.DataFrame:
-        """Perform asynchronous requests with limited concurrency and process the responses."""
+    def _begin_run(self, config, total_requests: Optional[int] = None):
+        """Reset the per-run progress counters and return the run's concurrency limiter."""
+        self._completed_requests = 0
+        self._run_total = total_requests
+        self._request_kwargs = {"trace_request_ctx": self.metrics}
+        timeout = request_timeout(config)
+        if timeout is not None:
+            # Set per request so this config's timeouts also apply on a session shared with other configs
+            self._request_kwargs["timeout"] = timeout
+        if self.metrics is not None:
+            if self._owns_metrics:
+                self.metrics.reset()
+            if self.session_manager is not None and routed_trace_config() not in self.session_manager.trace_configs:
+                self.config["logger"].warning("AsyncRequestProcessor: The shared session was created without metrics tracing, so request latencies and statuses are not collected. Create its SessionManager with collect_metrics set.")
+        return self._create_limiter(config)
 
+    def _create_limiter(self, config):
+        """Return the concurrency limiter for a run: a fixed semaphore, or an adaptive limiter when enabled."""
         # Use the value from config["max_concurrent_requests"], or default to 1 if not provided
         max_concurrent_requests = config.get("max_concurrent_requests", 1)
-        semaphore = asyncio.Semaphore(max_concurrent_requests)
-
-        async with aiohttp.ClientSession() as session:
-            async def limited_fetch(url):
-                async with semaphore:  # Limit the number of concurrent requests
-                    return await self.fetch(session, url)
-            
-            # Create the tasks for fetching with concurrency control
-            tasks = [limited_fetch(url) for url in self.request_bundle]
-            self.config["logger"].info(f"AsyncRequestProcessor: Making '{len(tasks)}' requests with a max concurrency of '{max_concurrent_requests}'")
-            
-            # Execute the tasks concurrently but with the concurrency limit
-            response_bundle = await asyncio.gather(*tasks)
-
-        # Process the response data
-        processed_data = [self.data_processor(config, response) for response in response_bundle]
-        flattened_data = [item for sublist in processed_data for item in sublist]
-        
-        return pd.DataFrame(flattened_data)
+        if config.get("adaptive_concurrency", False):
+            self.limiter = AdaptiveConcurrencyLimiter(
+                min_limit=config.get("adaptive_concurrency_min", 1),
+                max_limit=config.get("adaptive_concurrency_max", max_concurrent_requests),
+                initial_limit=max_concurrent_requests,
+                logger=self.config["logger"],
+            )
+        else:
+            self.limiter = asyncio.Semaphore(max_concurrent_requests)
+        return self.limiter
+
+    def on_config_reload(self, new_config, old_config) -> None:
+        """ReloadableConfig subscriber: adopt a reloaded config, resizing an active adaptive limiter.
+
+        Subscribe with the processor's event loop so this runs on it. A fixed semaphore cannot be
+        resized in flight, so a new max_concurrent_requests applies to it from the next run.
+        """
+        self.config = new_config
+        if isinstance(self.limiter, AdaptiveConcurrencyLimiter):
+            max_concurrent_requests = new_config.get("max_concurrent_requests", 1)
+            # Workers for the current run were sized from the old maximum, so it cannot grow past that
+            max_limit = min(new_config.get("adaptive_concurrency_max", max_concurrent_requests), self.limiter.max_limit)
+            min_limit = min(new_config.get("adaptive_concurrency_min", 1), max_limit)
+            self.limiter.set_bounds(min_limit, max_limit)
+
+    def _max_in_flight(self, config) -> int:
+        """Return the most requests the current limiter can ever allow in flight."""
+        if isinstance(self.limiter, AdaptiveConcurrencyLimiter):
+            return self.limiter.max_limit
+        return config.get("max_concurrent_requests", 1)
+
+    def _log_run_stats(self) -> None:
+        """Log the final adaptive limiter, response cache and metrics summaries for a run, exporting metrics if configured."""
+        if isinstance(self.limiter, AdaptiveConcurrencyLimiter):
+            self.config["logger"].info(f"AsyncRequestProcessor: Adaptive concurrency stats: {self.limiter.stats()}")
+        if self.response_cache is not None:
+            self.config["logger"].info(f"AsyncRequestProcessor: Response cache stats: {self.response_cache.stats(reset=True)}")
+        if self.metrics is not None:
+            self.metrics.finish()
+            self.config["logger"].info(f"AsyncRequestProcessor: Request metrics: {json.dumps(self.metrics.summary())}")
+            metrics_output_path = self.config.get("metrics_output_path")
+            if metrics_output_path:
+                self.metrics.export(metrics_output_path)
+
+    @asynccontextmanager
+    async def _processing_pool(self, config):
+        """Set up the data_processor executor from config["processing_mode"] for the duration of a run.
+
+        In 'process' mode data_processor must be a picklable module-level function, and it
+        receives a copy of the config without the logger and authentication entries.
+        """
+        mode = config.get("processing_mode", "inline")
+        self._executor = create_processing_executor(mode, config.get("processing_workers"))
+        self._processor_config = worker_safe_config(config) if mode == "process" else config
+        try:
+            yield
+        finally:
+            executor, self._executor = self._executor, None
+            if executor is not None:
+                # Waiting for running tasks blocks, so it happens off the event loop
+                await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+            self._processor_config = None
+
+    async def _process(self, config, response: Any) -> Any:
+        """Run data_processor over one response, on the executor when one is configured.
+
+        data_processor may return a list of records, a pandas DataFrame or a pyarrow Table.
+        """
+        with self._timed("processing"):
+            if self._executor is None:
+                return self.data_processor(config, response)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.data_processor, self._processor_config, response)
+
+    def _record_failure(self, url: str, error: Exception) -> None:
+        """Remember a request that failed after all retries so the caller can rerun just that URL."""
+        self.failed_requests.append({"url": url, "error": str(error), "status": getattr(error, "status", None)})
+        self._count("failed_requests")
+
+    async def make_requests(self, config, collect_failures: bool = False, result_format: Optional[str] = None) -> Any:
+        """Perform asynchronous requests with limited concurrency and process the responses.
+
+        With collect_failures, requests that still fail after retrying are recorded in
+        self.failed_requests instead of aborting the run, and the successful responses are kept.
+        result_format ('dataframe', 'records' or 'arrow') defaults to config["result_format"], then 'dataframe'.
+        """
+        result_format = result_format or config.get("result_format", "dataframe")
+        check_result_format(result_format)
+        self.failed_requests = []
+
+        semaphore = self._begin_run(config, len(self.request_bundle))
+        max_concurrent_requests = self._max_in_flight(config)
+
+        async with self._processing_pool(config):
+            async with borrow_session(config, self.session_manager, self._trace_configs()) as session:
+                async def limited_fetch(url):
+                    try:
+                        # The semaphore limits the number of concurrent requests
+                        response = await self.fetch(session, url, semaphore)
+                    except Exception as e:
+                        if not collect_failures:
+                            raise
+                        self._record_failure(url, e)
+                        return []
+                    # Process each response as soon as it arrives so parsing overlaps with fetching
+                    return await self._process(config, response)
+
+                # Create the tasks for fetching with concurrency control
+                tasks = [limited_fetch(url) for url in self.request_bundle]
+                self.config["logger"].info(f"AsyncRequestProcessor: Making '{len(tasks)}' requests with a max concurrency of '{max_concurrent_requests}'")
+
+                # Execute the tasks concurrently but with the concurrency limit
+                processed_data = await gather_or_cancel(*tasks)
+
+        if self.failed_requests:
+            self.config["logger"].warning(f"AsyncRequestProcessor: '{len(self.failed_requests)}' of '{len(tasks)}' requests failed and were skipped")
+
+        with self._timed("result_build"):
+            result = combine_batches(processed_data, result_format)
+
+        self._log_run_stats()
+
+        return result
+
+    async def fetch_paginated(self, config, session: "aiohttp.ClientSession", semaphore: asyncio.Semaphore, base_url: str, strategy: PageSizePagination, page_sink: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+        """Crawl every page of base_url, keeping pages in flight up to the semaphore limit, and return the processed page batches in page order.
+
+        With page_sink, each processed page is passed to it in page order as soon as every
+        earlier page has been, and nothing is kept; page_sink may return an awaitable.
+
+        Pages are requested ahead in rounds that double in size, like TCP slow start: the first
+        page alone, then two, then four, each round starting once the previous one came back
+        full. Once a round reaches the semaphore limit, pages are handed out continuously. A
+        short page stops handing out pages, and a total count reported by the API fixes the
+        last page.
+        """
+        max_in_flight = self._max_in_flight(config)
+        next_page = strategy.start_page
+        last_page = None
+        processed_pages: Dict[int, Any] = {}
+        round_size = 1
+        round_end = strategy.start_page
+        round_done = 0
+        pipelining = max_in_flight <= 1
+        page_available = asyncio.Condition()
+        delivered_through = strategy.start_page - 1
+        delivery_lock = asyncio.Lock()
+
+        def can_hand_out() -> bool:
+            return last_page is not None or pipelining or next_page <= round_end
+
+        async def deliver_ready_pages():
+            nonlocal delivered_through
+            async with delivery_lock:
+                while delivered_through + 1 in processed_pages and (last_page is None or delivered_through < last_page):
+                    delivered_through += 1
+                    result = page_sink(processed_pages.pop(delivered_through))
+                    if inspect.isawaitable(result):
+                        await result
+
+        async def page_worker():
+            nonlocal next_page, last_page, round_size, round_end, round_done, pipelining
+            while True:
+                async with page_available:
+                    await page_available.wait_for(can_hand_out)
+                page = next_page
+                if last_page is not None and page > last_page:
+                    return
+                next_page += 1
+
+                response = await self.fetch(session, strategy.page_url(base_url, page), semaphore)
+
+                if strategy.is_last_page(page, response):
+                    last_page = page if last_page is None else min(last_page, page)
+                else:
+                    reported = strategy.reported_last_page(response)
+                    if reported is not None:
+                        last_page = reported if last_page is None else min(last_page, reported)
+                    round_done += 1
+                    if not pipelining and round_done == round_size:
+                        # The whole round came back full, so the next one may be twice as large
+                        round_size = min(2 * round_size, max_in_flight)
+                        round_end += round_size
+                        round_done = 0
+                        pipelining = round_size >= max_in_flight
+                async with page_available:
+                    page_available.notify_all()
+                processed_pages[page] = await self._process(config, response)
+                if page_sink is not None:
+                    await deliver_ready_pages()
+
+        await gather_or_cancel(*(page_worker() for _ in range(max_in_flight)))
+
+        page_count = last_page - strategy.start_page + 1 if last_page is not None else 0
+        self.config["logger"].info(f"AsyncRequestProcessor: Fetched '{page_count}' pages from '{base_url}'")
+        if page_sink is not None:
+            return []
+        return [processed_pages[page] for page in sorted(processed_pages) if page <= last_page]
+
+    async def make_paginated_requests(self, config, strategy: PageSizePagination = None, result_format: Optional[str] = None) -> Any:
+        """Crawl every base URL in the request bundle page by page and process the responses into the requested result format."""
+        result_format = result_format or config.get("result_format", "dataframe")
+        check_result_format(result_format)
+        if strategy is None:
+            strategy = PageSizePagination()
+
+        semaphore = self._begin_run(config)
+        max_concurrent_requests = self._max_in_flight(config)
+
+        async with self._processing_pool(config):
+            async with borrow_session(config, self.session_manager, self._trace_configs()) as session:
+                self.config["logger"].info(f"AsyncRequestProcessor: Crawling '{len(self.request_bundle)}' paginated endpoints with a page size of '{strategy.page_size}' and a max concurrency of '{max_concurrent_requests}'")
+                processed_data = await gather_or_cancel(*(self.fetch_paginated(config, session, semaphore, url, strategy) for url in self.request_bundle))
+
+        with self._timed("result_build"):
+            result = combine_batches([batch for pages in processed_data for batch in pages], result_format)
+
+        self._log_run_stats()
+
+        return result
+
+    async def make_paginated_requests_to_sink(self, config, sink: Callable[[List[Dict]], Any], strategy: PageSizePagination = None) -> int:
+        """Crawl every base URL in the request bundle page by page, passing each page's records to sink, and return the number of records written.
+
+        Pages of one base URL reach sink in page order; pages of different base URLs may interleave.
+        """
+        if strategy is None:
+            strategy = PageSizePagination()
+
+        semaphore = self._begin_run(config)
+        max_concurrent_requests = self._max_in_flight(config)
+        record_count = 0
+
+        async def write_page(batch):
+            nonlocal record_count
+            records = as_records(batch)
+            if not records:
+                return
+            result = sink(records)
+            if inspect.isawaitable(result):
+                await result
+            record_count += len(records)
+
+        async with self._processing_pool(config):
+            async with borrow_session(config, self.session_manager, self._trace_configs()) as session:
+                self.config["logger"].info(f"AsyncRequestProcessor: Crawling '{len(self.request_bundle)}' paginated endpoints into a sink with a page size of '{strategy.page_size}' and a max concurrency of '{max_concurrent_requests}'")
+                await gather_or_cancel(*(self.fetch_paginated(config, session, semaphore, url, strategy, write_page) for url in self.request_bundle))
+
+        self._log_run_stats()
+
+        self.config["logger"].info(f"AsyncRequestProcessor: Wrote '{record_count}' records to sink")
+        return record_count
+
+    async def stream_requests(self, config, batch_size: int = None, collect_failures: bool = False) -> AsyncIterator[List[Dict]]:
+        """Fetch and process responses as they complete, yielding records in batches of at most batch_size."""
+        self.failed_requests = []
+        if batch_size is None:
+            batch_size = config.get("stream_batch_size", DEFAULT_STREAM_BATCH_SIZE)
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1. Found: {batch_size}")
+
+        limiter = self._begin_run(config, len(self.request_bundle))
+        max_concurrent_requests = self._max_in_flight(config)
+
+        # Bounded so that fetching pauses while the consumer is busy writing a batch
+        results: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent_requests)
+        url_iterator = iter(self.request_bundle)
+        done_marker = object()
+
+        async with self._processing_pool(config):
+            async with borrow_session(config, self.session_manager, self._trace_configs()) as session:
+                async def worker():
+                    try:
+                        for url in url_iterator:
+                            try:
+                                response = await self.fetch(session, url, limiter)
+                            except Exception as e:
+                                if not collect_failures:
+                                    raise
+                                self._record_failure(url, e)
+                                continue
+                            await results.put(await self._process(config, response))
+                    except Exception as e:
+                        await results.put(e)
+                    await results.put(done_marker)
+
+                worker_count = max(1, min(max_concurrent_requests, len(self.request_bundle)))
+                self.config["logger"].info(f"AsyncRequestProcessor: Streaming '{len(self.request_bundle)}' requests with a max concurrency of '{max_concurrent_requests}' and a batch size of '{batch_size}'")
+                workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+
+                try:
+                    buffer: List[Dict] = []
+                    running = worker_count
+                    while running:
+                        item = await results.get()
+                        if item is done_marker:
+                            running -= 1
+                            continue
+                        if isinstance(item, Exception):
+                            raise item
+
+                        buffer.extend(as_records(item))
+                        while len(buffer) >= batch_size:
+                            yield buffer[:batch_size]
+                            buffer = buffer[batch_size:]
+
+                    if buffer:
+                        yield buffer
+                    self._log_run_stats()
+                finally:
+                    for task in workers:
+                        task.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+
+    async def make_requests_to_sink(self, config, sink: Callable[[List[Dict]], Any], batch_size: int = None, collect_failures: bool = False) -> int:
+        """Stream processed records into sink batch by batch and return the number of records written."""
+        record_count = 0
+        async for batch in self.stream_requests(config, batch_size, collect_failures):
+            result = sink(batch)
+            if inspect.isawaitable(result):
+                await result
+            record_count += len(batch)
+
+        self.config["logger"].info(f"AsyncRequestProcessor: Wrote '{record_count}' records to sink")
+        return record_count
@@ -0,0 +1,223 @@
+from typing import Dict, Any, List, Optional, Union
+
+OUTPUT_FORMATS = ("dataframe", "arrow")
+
+MAPPING_KEYS = frozenset({
+    "fields", "properties", "records_path", "properties_key", "property_name_field",
+    "property_value_fields", "property_prefix", "output",
+})
+
+class ColumnarProcessor:
+    """data_processor that turns a qTest response straight into a pandas DataFrame or pyarrow Table.
+
+    Nested objects become dotted columns ('parent.id'). fields maps output columns to those
+    source columns; when it is omitted every column except the property list is kept. The qTest
+    'properties' list is exploded and pivoted into one column per property. properties selects
+    which ones: True keeps all of them under their field_name, a dict maps field_name to an
+    output column, and False skips them.
+
+    With pyarrow installed the response is converted with Arrow's builders and the properties
+    are pivoted with compute kernels; otherwise, or when a response has values Arrow cannot
+    type consistently, pd.json_normalize and a pandas pivot are used.
+
+    Instances are plain picklable objects, so they also work with processing_mode 'process'.
+    """
+
+    def __init__(self, fields: Optional[Dict[str, str]] = None, properties: Union[bool, Dict[str, str]] = True,
+                 records_path: Optional[str] = None, properties_key: str = "properties", property_name_field: str = "field_name",
+                 property_value_fields: Optional[List[str]] = None, property_prefix: str = "", output: str = "dataframe"):
+        """Initialize the processor with its field mapping, property selection and output format."""
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output '{output}'. Allowed values are: {list(OUTPUT_FORMATS)}")
+        self.fields = dict(fields) if fields else None
+        self.properties = dict(properties) if isinstance(properties, dict) else bool(properties)
+        self.records_path = records_path
+        self.properties_key = properties_key
+        self.property_name_field = property_name_field
+        # The display value is preferred; the raw value is used when a property has no display value
+        self.property_value_fields = list(property_value_fields or ["field_value_name", "field_value"])
+        self.property_prefix = property_prefix
+        self.output = output
+
+    @classmethod
+    def from_mapping(cls, mapping: Dict[str, Any]) -> "ColumnarProcessor":
+        """Build a processor from a declarative mapping, such as a section loaded from YAML, whose keys match the constructor arguments."""
+        unknown_keys = set(mapping) - MAPPING_KEYS
+        if unknown_keys:
+            raise ValueError(f"Unknown field mapping keys: {', '.join(sorted(unknown_keys))}")
+        return cls(**mapping)
+
+    def __call__(self, config, response: Any) -> Any:
+        """Process one response into a DataFrame or Table; matches the data_processor signature."""
+        records = self._records(response)
+        try:
+            import pyarrow as pa
+        except ImportError:
+            pa = None
+
+        if pa is not None:
+            try:
+                table = self._arrow_table(records)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pass
+            else:
+                return table if self.output == "arrow" else table.to_pandas()
+
+        frame = self._pandas_frame(records)
+        if self.output == "arrow":
+            if pa is None:
+                raise ImportError("ColumnarProcessor output 'arrow' requires 'pyarrow'. Install it or use output 'dataframe'.")
+            return pa.Table.from_pandas(frame, preserve_index=False)
+        return frame
+
+    def _records(self, response: Any) -> List[Dict[str, Any]]:
+        """Return the list of records in a response, following records_path for wrapped responses."""
+        if self.records_path is not None and isinstance(response, dict):
+            for key in self.records_path.split("."):
+                response = (response or {}).get(key)
+        if response is None:
+            return []
+        if isinstance(response, dict):
+            return [response]
+        return response
+
+    def _mapped_property_columns(self) -> Optional[List[str]]:
+        """Return the output columns of a property mapping, or None when all properties are kept."""
+        return list(dict.fromkeys(self.properties.values())) if isinstance(self.properties, dict) else None
+
+    def _arrow_table(self, records: List[Dict[str, Any]]):
+        """Build the output table with Arrow builders and compute kernels."""
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        row_count = len(records)
+        # pa.array infers one struct type over every record, so keys missing from the first record are kept
+        table = pa.Table.from_struct_array(pa.array(records)) if records else pa.table({})
+
+        property_lists = None
+        if self.properties_key in table.column_names:
+            property_lists = table.column(self.properties_key).combine_chunks()
+            table = table.drop_columns([self.properties_key])
+        while any(pa.types.is_struct(field.type) for field in table.schema):
+            table = table.flatten()
+
+        if self.fields is not None:
+            table = pa.table({
+                output_column: table.column(source) if source in table.column_names else pa.nulls(row_count)
+                for output_column, source in self.fields.items()
+            })
+
+        property_columns = {}
+        mapped_columns = self._mapped_property_columns()
+        if self.properties is not False and property_lists is not None and pa.types.is_list(property_lists.type) and pa.types.is_struct(property_lists.type.value_type):
+            flat = pc.list_flatten(property_lists)
+            struct_fields = {flat.type.field(index).name for index in range(flat.type.num_fields)}
+            if self.property_name_field in struct_fields:
+                parents = pc.list_parent_indices(property_lists)
+                names = flat.field(self.property_name_field).cast(pa.string())
+                values = self._arrow_property_values(flat, struct_fields)
+
+                if mapped_columns is not None:
+                    selected = pc.is_in(names, value_set=pa.array(list(self.properties), pa.string()))
+                    names, values, parents = names.filter(selected), values.filter(selected), parents.filter(selected)
+
+                for name in pc.unique(names).to_pylist():
+                    if name is None:
+                        continue
+                    selected = pc.equal(names, name)
+                    rows = parents.filter(selected).to_numpy()
+                    # Point each record at its property value, or at null; a property listed twice keeps its last value
+                    positions = np.full(row_count, -1, dtype=np.int64)
+                    positions[rows] = np.arange(len(rows))
+                    column_values = values.filter(selected).take(pa.array(positions, mask=positions < 0))
+                    column = self.properties[name] if mapped_columns is not None else f"{self.property_prefix}{name}"
+                    property_columns[column] = column_values
+
+        if mapped_columns is not None:
+            # Keep every mapped column, in mapping order, so batches share one schema
+            property_columns = {column: property_columns.get(column, pa.nulls(row_count)) for column in mapped_columns}
+
+        for column, column_values in property_columns.items():
+            table = table.append_column(f"{column}_property" if column in table.column_names else column, column_values)
+        return table
+
+    def _arrow_property_values(self, flat, struct_fields):
+        """Return the preferred value of each property, skipping null and empty values, as one Arrow array."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        candidates = []
+        for field in self.property_value_fields:
+            if field not in struct_fields:
+                continue
+            values = flat.field(field)
+            if pa.types.is_string(values.type):
+                values = pc.if_else(pc.equal(values, ""), pa.scalar(None, pa.string()), values)
+            candidates.append(values)
+        if not candidates:
+            return pa.nulls(len(flat))
+        if len({values.type for values in candidates}) > 1:
+            candidates = [values.cast(pa.string()) for values in candidates]
+        return pc.coalesce(*candidates) if len(candidates) > 1 else candidates[0]
+
+    def _pandas_frame(self, records: List[Dict[str, Any]]):
+        """Build the output frame with pd.json_normalize and a pandas pivot."""
+        import pandas as pd
+
+        # Properties are handled separately, so keep them out of json_normalize
+        frame = pd.json_normalize([{key: value for key, value in record.items() if key != self.properties_key} for record in records], sep=".")
+        if self.fields is not None:
+            frame = pd.DataFrame(
+                {output_column: frame[source] if source in frame.columns else pd.Series([None] * len(frame), dtype=object)
+                 for output_column, source in self.fields.items()},
+                index=frame.index,
+            )
+
+        if self.properties is not False and records:
+            property_lists = pd.Series([record.get(self.properties_key) or [] for record in records], dtype=object)
+            property_columns = self._pandas_properties(property_lists)
+            if property_columns is not None:
+                frame = frame.join(property_columns, rsuffix="_property")
+        return frame
+
+    def _pandas_properties(self, property_lists):
+        """Explode the per-record property lists and pivot them into one column per property, indexed like the records."""
+        import pandas as pd
+
+        mapped_columns = self._mapped_property_columns()
+        missing = pd.DataFrame(index=property_lists.index, columns=mapped_columns, dtype=object) if mapped_columns is not None else None
+
+        exploded = property_lists.explode().dropna()
+        if exploded.empty:
+            return missing
+        # Property entries are flat dicts, so the DataFrame constructor is enough and much faster than json_normalize
+        long = pd.DataFrame(exploded.tolist(), index=exploded.index)
+        if self.property_name_field not in long.columns:
+            return missing
+
+        value_fields = [field for field in self.property_value_fields if field in long.columns]
+        if value_fields:
+            values = long[value_fields[0]]
+            for field in value_fields[1:]:
+                values = values.where(values.notna() & (values != ""), long[field])
+        else:
+            values = pd.Series([None] * len(long), index=long.index, dtype=object)
+
+        names = long[self.property_name_field]
+        if mapped_columns is not None:
+            selected = names.isin(list(self.properties))
+            names, values = names[selected].map(self.properties), values[selected]
+        elif self.property_prefix:
+            names = self.property_prefix + names.astype(str)
+
+        pairs = pd.DataFrame({"record": names.index, "name": names.to_numpy(), "value": values.to_numpy()})
+        # A property listed twice on one record keeps its last value
+        pairs = pairs.drop_duplicates(["record", "name"], keep="last")
+        wide = pairs.pivot(index="record", columns="name", values="value")
+        wide.columns.name = None
+        wide.index.name = None
+        if missing is not None:
+            # Keep every mapped column, in mapping order, so batches share one schema
+            wide = wide.reindex(columns=missing.columns)
+        return wide
@@ -0,0 +1,296 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Any, Deque, List, Optional
+
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+async def gather_or_cancel(*awaitables) -> List[Any]:
+    """Await the awaitables concurrently like asyncio.gather, cancelling the others as soon as one raises.
+
+    Plain gather leaves the siblings of a failed awaitable running, still sending requests
+    nobody will read.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter that grows while the server is healthy and backs off on overload.
+
+    The limit grows by roughly one slot per round trip of successful responses and is cut by
+    decrease_factor when a 429/503 arrives or the smoothed latency rises above
+    latency_tolerance times the baseline latency. The baseline is the fastest latency of the
+    current and the previous baseline_window seconds, so it follows a server whose normal
+    latency rises instead of holding on to one lucky fast response for the whole run. It can
+    be used anywhere an asyncio.Semaphore is used with 'async with'.
+    """
+
+    def __init__(self, min_limit: int = 1, max_limit: int = 10, initial_limit: Optional[int] = None, decrease_factor: float = 0.5, latency_tolerance: float = 3.0, logger=None, baseline_window: float = 30.0):
+        """Initialize the limiter with its bounds, starting limit, backoff parameters and latency baseline window in seconds."""
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError(f"Concurrency bounds must satisfy 1 <= min_limit <= max_limit. Found: {min_limit}, {max_limit}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.baseline_window = baseline_window
+        self.logger = logger
+
+        self._limit = float(min(max(initial_limit or min_limit, min_limit), max_limit))
+        self._condition = asyncio.Condition()
+        self.in_flight = 0
+        self.completed = 0
+        self.overloaded = 0
+        self._started = time.monotonic()
+        self._last_decrease = 0.0
+        self._window_started = self._started
+        self._window_min_latency: Optional[float] = None
+        self._previous_window_min_latency: Optional[float] = None
+        self._latency_ewma: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        """Return the current number of requests allowed in flight."""
+        return int(self._limit)
+
+    def set_bounds(self, min_limit: int, max_limit: int, limit: Optional[int] = None) -> None:
+        """Change the bounds (and optionally the current limit) while requests are in flight.
+
+        Must be called from the limiter's event loop. A higher limit admits waiters as soon as
+        the next in-flight request finishes.
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError(f"Concurrency bounds must satisfy 1 <= min_limit <= max_limit. Found: {min_limit}, {max_limit}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(min(max(limit if limit is not None else self._limit, min_limit), max_limit))
+        if self.logger:
+            self.logger.info(f"AdaptiveConcurrencyLimiter: Bounds set to '{min_limit}'-'{max_limit}', limit is now '{self.limit}'")
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit and take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        """Give a slot back and wake waiters, picking up any limit increase."""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.release()
+
+    def record_response(self, latency: float, status: Optional[int]) -> None:
+        """Adjust the limit from the latency and status of a completed request attempt."""
+        self.completed += 1
+        now = time.monotonic()
+
+        if status in OVERLOAD_STATUSES:
+            self.overloaded += 1
+            self._decrease(now, f"status '{status}'")
+            return
+        if status is None or status >= 400:
+            return
+
+        baseline = self._update_baseline(now, latency)
+        self._latency_ewma = latency if self._latency_ewma is None else 0.8 * self._latency_ewma + 0.2 * latency
+
+        if self._latency_ewma > baseline * self.latency_tolerance:
+            self._decrease(now, f"latency {self._latency_ewma:.3f}s")
+        elif self._limit < self.max_limit:
+            previous = self.limit
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            if self.limit != previous and self.logger:
+                self.logger.info(f"AdaptiveConcurrencyLimiter: Increased limit to '{self.limit}' ({self.throughput():.1f} req/s)")
+
+    def _update_baseline(self, now: float, latency: float) -> float:
+        """Add a latency to the windowed minimum and return the baseline over the current and previous window."""
+        if now - self._window_started >= self.baseline_window:
+            # A window without samples (an idle spell) leaves nothing to carry over
+            elapsed_windows = int((now - self._window_started) // self.baseline_window)
+            self._previous_window_min_latency = self._window_min_latency if elapsed_windows == 1 else None
+            self._window_min_latency = None
+            self._window_started += elapsed_windows * self.baseline_window
+        self._window_min_latency = latency if self._window_min_latency is None else min(self._window_min_latency, latency)
+        return self._latency_baseline()
+
+    def _decrease(self, now: float, reason: str) -> None:
+        """Cut the limit multiplicatively, at most once per smoothed round trip."""
+        if now - self._last_decrease < (self._latency_ewma or 0.0):
+            return
+        self._last_decrease = now
+        previous = self.limit
+        self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+        if self.limit != previous and self.logger:
+            self.logger.warning(f"AdaptiveConcurrencyLimiter: Decreased limit to '{self.limit}' after {reason}")
+
+    def throughput(self) -> float:
+        """Return the average number of completed requests per second since the limiter was created."""
+        elapsed = time.monotonic() - self._started
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current limit and throughput counters for logging."""
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "overloaded": self.overloaded,
+            "throughput": round(self.throughput(), 2),
+            "latency_ewma": round(self._latency_ewma, 4) if self._latency_ewma is not None else None,
+            "latency_baseline": round(self._latency_baseline(), 4) if self._window_min_latency is not None else None,
+        }
+
+    def _latency_baseline(self) -> float:
+        """Return the fastest latency of the current and previous window; requires at least one sample."""
+        if self._previous_window_min_latency is None:
+            return self._window_min_latency
+        return min(self._window_min_latency, self._previous_window_min_latency)
+
+
+class _DomainState:
+    """Slots, rate tokens and per-job wait queues of one domain in a FairDomainLimiter."""
+
+    def __init__(self, burst: float):
+        self.in_flight = 0
+        self.tokens = burst
+        self.refilled = time.monotonic()
+        # job_id -> waiters of that job; the first key is the job served next
+        self.waiting: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self.wakeup: Optional[asyncio.TimerHandle] = None
+
+
+class FairDomainLimiter:
+    """Concurrency and rate limit per domain, shared by many jobs and fair between them.
+
+    At most max_concurrent requests are in flight per domain, and with requests_per_second
+    set, requests start no faster than that rate (a token bucket allowing bursts of burst
+    requests). When requests wait, free slots go to the waiting jobs in round-robin order,
+    so a job with thousands of queued requests cannot starve one with a few. Use
+    for_job to get the limiter for one job's requests; it works anywhere an
+    asyncio.Semaphore is used with 'async with'.
+    """
+
+    def __init__(self, max_concurrent: int = 10, requests_per_second: Optional[float] = None, burst: Optional[int] = None):
+        """Initialize the limiter with the per-domain concurrency, rate and burst size."""
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1. Found: {max_concurrent}")
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError(f"requests_per_second must be greater than 0. Found: {requests_per_second}")
+        self.max_concurrent = max_concurrent
+        self.requests_per_second = requests_per_second
+        self.burst = float(burst if burst is not None else max(1, int(requests_per_second or 1)))
+        self._domains: Dict[str, _DomainState] = {}
+
+    def for_job(self, domain: str, job_id: str) -> "JobRequestLimiter":
+        """Return the limiter one job uses for its requests to domain."""
+        return JobRequestLimiter(self, domain, job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the in-flight and waiting request counts of every domain."""
+        return {
+            domain: {"in_flight": state.in_flight, "waiting": sum(len(waiters) for waiters in state.waiting.values())}
+            for domain, state in self._domains.items()
+        }
+
+    async def acquire(self, domain: str, job_id: str) -> None:
+        """Wait for a slot on domain in job_id's turn and take it."""
+        state = self._domains.get(domain)
+        if state is None:
+            state = self._domains[domain] = _DomainState(self.burst)
+
+        if not state.waiting and state.in_flight < self.max_concurrent and self._take_token(state):
+            state.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        state.waiting.setdefault(job_id, deque()).append(waiter)
+        self._dispatch(state)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted as the waiting task was cancelled, so hand it on
+                self.release(domain)
+            raise
+
+    def release(self, domain: str) -> None:
+        """Give a slot on domain back and grant it to the next waiting job."""
+        state = self._domains[domain]
+        state.in_flight -= 1
+        self._dispatch(state)
+
+    def _take_token(self, state: _DomainState) -> bool:
+        """Take one rate token if one is available; always succeeds without a rate limit."""
+        if self.requests_per_second is None:
+            return True
+        now = time.monotonic()
+        state.tokens = min(self.burst, state.tokens + (now - state.refilled) * self.requests_per_second)
+        state.refilled = now
+        if state.tokens < 1:
+            return False
+        state.tokens -= 1
+        return True
+
+    def _dispatch(self, state: _DomainState) -> None:
+        """Grant free slots to waiting jobs in round-robin order, scheduling a wakeup when out of rate tokens."""
+        while state.waiting and state.in_flight < self.max_concurrent:
+            job_id, waiters = next(iter(state.waiting.items()))
+            while waiters and waiters[0].done():
+                waiters.popleft()  # Cancelled while waiting
+            if not waiters:
+                del state.waiting[job_id]
+                continue
+
+            if not self._take_token(state):
+                if state.wakeup is None:
+                    delay = (1 - state.tokens) / self.requests_per_second
+                    state.wakeup = asyncio.get_running_loop().call_later(delay, self._wake, state)
+                return
+
+            waiters.popleft().set_result(None)
+            state.in_flight += 1
+            # This job goes to the back of the line
+            if waiters:
+                state.waiting.move_to_end(job_id)
+            else:
+                del state.waiting[job_id]
+
+    def _wake(self, state: _DomainState) -> None:
+        """Timer callback: retry granting slots once a rate token is available."""
+        state.wakeup = None
+        self._dispatch(state)
+
+
+class JobRequestLimiter:
+    """One job's view of a FairDomainLimiter; also records its request count and the total time its requests waited for slots."""
+
+    def __init__(self, limiter: FairDomainLimiter, domain: str, job_id: str):
+        """Initialize the view with the shared limiter, the job's domain and its id."""
+        self.limiter = limiter
+        self.domain = domain
+        self.job_id = job_id
+        self.requests = 0
+        self.wait_seconds = 0.0
+
+    async def __aenter__(self):
+        waiting_since = time.monotonic()
+        await self.limiter.acquire(self.domain, self.job_id)
+        self.wait_seconds += time.monotonic() - waiting_since
+        self.requests += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.limiter.release(self.domain)
@@ -0,0 +1,231 @@
+import asyncio
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, AsyncIterator
+
+from ..output_writer.writer_factory import create_writer
+from .async_request_handler import HttpRequestProcessor
+from .columnar_processor import ColumnarProcessor
+from .incremental_export import IncrementalExporter
+from .pagination import PageSizePagination
+from .response_cache import ResponseCache
+from .session_manager import SessionManager
+
+TEST_CASES_ENDPOINT = "api/v3/projects/{project}/test-cases"
+# Test cases are upserted on their id when incremental_export is set
+TEST_CASE_KEY_COLUMNS = ["id"]
+
+JOB_STATES = ("queued", "running", "succeeded", "failed", "cancelled")
+FINISHED_STATES = frozenset({"succeeded", "failed", "cancelled"})
+
+def test_case_urls(config) -> Dict[int, str]:
+    """Return the test case list URL of every target project, keyed by project id."""
+    return {project: f"{config['qTest_domain']}{TEST_CASES_ENDPOINT.format(project=project)}" for project in config["target_projects"]}
+
+def auth_header(config) -> Dict[str, str]:
+    """Return the Authorization header from the authentication config loaded by ConfigLoader."""
+    auth = config.get("auth")
+    token = auth.get_data().get("qTest_bearer_token") if auth is not None else None
+    if not token:
+        raise ValueError("The authentication config has no 'qTest_bearer_token'.")
+    return {"Authorization": token}
+
+
+class ExportJob:
+    """One test case export of a loaded config, run as a task on the runner's event loop.
+
+    Projects are exported one after another so the config's max_concurrent_requests still
+    bounds the job; pages of the current project are fetched concurrently and written as they
+    arrive, so a project is never held in memory as a whole. Progress is
+    reported in requests and projects, and the ETA is extrapolated from the projects done.
+    With incremental_export set, only test cases modified since the last successful run are
+    fetched and upserted, and the watermarks advance only when every project succeeded.
+    """
+
+    def __init__(self, job_id: str, name: str, config):
+        """Initialize the job with its id, display name and a config loaded by ConfigLoader."""
+        self.job_id = job_id
+        self.name = name
+        self.config = config
+        self.state = "queued"
+        self.error: Optional[str] = None
+        self.project_errors: List[Dict[str, Any]] = []
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.projects_total = len(config.get("target_projects") or [])
+        self.projects_done = 0
+        self.records_written = 0
+        self.output_path: Optional[str] = None
+        self._requests_done = 0
+        self._processor: Optional[HttpRequestProcessor] = None
+        self.task: Optional[asyncio.Task] = None
+
+    async def run(self, request_budget=None, session_manager: Optional[SessionManager] = None) -> None:
+        """Export every target project into the configured output, recording errors per project."""
+        logger = self.config["logger"]
+        self.state = "running"
+        self.started = time.time()
+        own_session_manager = session_manager is None
+        writer = None
+        exporter: Optional[IncrementalExporter] = None
+        response_cache: Optional[ResponseCache] = None
+        # Writers do blocking file I/O, so they run off the event loop, always on the same thread since SQLite connections are bound to theirs
+        writer_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"export-{self.job_id}")
+        loop = asyncio.get_running_loop()
+        try:
+            # Setup failures, such as an auth file without a token, fail the job like any other error
+            session_manager = session_manager or SessionManager.from_config(self.config)
+            header = auth_header(self.config)
+            # One cache for all projects of the job, so its database is opened and closed once
+            response_cache = ResponseCache.from_config(self.config)
+            incremental = self.config.get("incremental_export") is True
+            writer = create_writer(self.config, f"{self.name}_test_cases", key_columns=TEST_CASE_KEY_COLUMNS if incremental else None)
+            self.output_path = str(writer.output_path)
+            if incremental:
+                exporter = IncrementalExporter(self.config, writer)
+                exporter.watermark_store.begin_run()
+            for project, url in test_case_urls(self.config).items():
+                if exporter is not None:
+                    url = exporter.project_url(TEST_CASES_ENDPOINT, project, url)
+                self._processor = HttpRequestProcessor(
+                    self.config, [url], header, ColumnarProcessor(),
+                    session_manager=session_manager, response_cache=response_cache, request_budget=request_budget,
+                )
+
+                async def write_page(records, project=project):
+                    await loop.run_in_executor(writer_thread, writer.write_batch, records)
+                    self.records_written += len(records)
+                    if exporter is not None:
+                        exporter.record_project(TEST_CASES_ENDPOINT, project, records)
+
+                try:
+                    await self._processor.make_paginated_requests_to_sink(self.config, write_page, PageSizePagination())
+                except Exception as e:
+                    logger.error(f"ExportJob: Export of project '{project}' in job '{self.job_id}' failed: {e}")
+                    self.project_errors.append({"project": project, "error": str(e)})
+                finally:
+                    self._requests_done += self._processor.progress()["completed"]
+                    self._processor = None
+                    self.projects_done += 1
+            self.state = "failed" if self.project_errors else "succeeded"
+        except asyncio.CancelledError:
+            self.state = "cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"ExportJob: Job '{self.job_id}' failed: {e}")
+            self.state = "failed"
+            self.error = str(e)
+        finally:
+            self.finished = time.time()
+            if own_session_manager and session_manager is not None:
+                await session_manager.close()
+            if response_cache is not None:
+                response_cache.close()
+            if exporter is not None:
+                # Watermarks are only committed when every project was exported
+                exporter.watermark_store.finish_run(self.state == "succeeded")
+                exporter.close()
+            try:
+                if writer is not None:
+                    await loop.run_in_executor(writer_thread, writer.close)
+            finally:
+                writer_thread.shutdown(wait=False)
+            logger.info(f"ExportJob: Job '{self.job_id}' {self.state} after '{self.finished - self.started:.2f}'s with '{self.records_written}' records written to '{self.output_path}'")
+
+    def progress(self) -> Dict[str, Any]:
+        """Return a JSON-serializable snapshot of the job's state, counts, throughput and ETA."""
+        processor = self._processor
+        current = processor.progress() if processor is not None else {"completed": 0, "failed": 0}
+        requests_done = self._requests_done + current["completed"]
+        elapsed = ((self.finished or time.time()) - self.started) if self.started else 0.0
+
+        # Pages per project are unknown until each crawl ends, so totals and the ETA scale from finished projects
+        fraction = self.projects_done / self.projects_total if self.projects_total else 0.0
+        requests_total = round(requests_done / fraction) if fraction and self.state not in FINISHED_STATES else None
+        eta_seconds = round(elapsed * (1 - fraction) / fraction, 1) if fraction and self.state == "running" else None
+        if self.state in FINISHED_STATES:
+            requests_total = requests_done
+            eta_seconds = 0.0
+
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "state": self.state,
+            "projects_done": self.projects_done,
+            "projects_total": self.projects_total,
+            "requests_done": requests_done,
+            "requests_total": requests_total,
+            "requests_per_second": round(requests_done / elapsed, 2) if elapsed else 0.0,
+            "records_written": self.records_written,
+            "errors": len(self.project_errors) + current["failed"] + (1 if self.error else 0),
+            "error_details": self.project_errors + ([{"project": None, "error": self.error}] if self.error else []),
+            "elapsed_seconds": round(elapsed, 1),
+            "eta_seconds": eta_seconds,
+            "output_path": self.output_path,
+        }
+
+
+class JobRunner:
+    """In-process runner for export jobs on the current event loop, sharing one global request budget.
+
+    Every request of every job holds a slot of the budget while in flight, so concurrent jobs
+    together never exceed max_concurrent_requests. Jobs live in this process only, which is
+    why scripts/launch_UI.py runs the UI with a single worker.
+    """
+
+    def __init__(self, max_concurrent_requests: int = 20, keep_finished: int = 50):
+        """Initialize the runner with the global request budget and how many finished jobs to remember."""
+        if max_concurrent_requests < 1:
+            raise ValueError(f"max_concurrent_requests must be at least 1. Found: {max_concurrent_requests}")
+        self.max_concurrent_requests = max_concurrent_requests
+        self.keep_finished = keep_finished
+        self.request_budget = asyncio.Semaphore(max_concurrent_requests)
+        self._jobs: Dict[str, ExportJob] = {}
+        self._ids = itertools.count(1)
+
+    def submit(self, config, name: str) -> ExportJob:
+        """Start exporting a loaded and validated config as a new job and return it; must be called on the event loop."""
+        job = ExportJob(f"{int(time.time())}-{next(self._ids)}", name, config)
+        self._jobs[job.job_id] = job
+        job.task = asyncio.get_running_loop().create_task(job.run(self.request_budget))
+        self._forget_finished()
+        return job
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        """Return the job with the given id, or None."""
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> List[ExportJob]:
+        """Return every known job, newest first."""
+        return sorted(self._jobs.values(), key=lambda job: job.created, reverse=True)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; return False if it does not exist or has already finished."""
+        job = self._jobs.get(job_id)
+        if job is None or job.state in FINISHED_STATES or job.task is None:
+            return False
+        if job.state == "queued":
+            # A task cancelled before its first step never runs, so record the outcome here
+            job.state = "cancelled"
+            job.finished = time.time()
+        return job.task.cancel()
+
+    async def events(self, job_id: str, interval: float = 0.5) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the job's progress every interval seconds, ending with its final snapshot."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        # A task that died without recording a final state must not turn this into a busy loop
+        while job.state not in FINISHED_STATES and not (job.task is not None and job.task.done()):
+            yield job.progress()
+            # Wake early when the job ends so the final snapshot is not delayed by a full interval
+            await asyncio.wait({job.task}, timeout=interval)
+        yield job.progress()
+
+    def _forget_finished(self) -> None:
+        """Drop the oldest finished jobs beyond keep_finished."""
+        finished = [job for job in self.jobs() if job.state in FINISHED_STATES]
+        for job in finished[self.keep_finished:]:
+            del self._jobs[job.job_id]
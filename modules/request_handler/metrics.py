@@ -0,0 +1,173 @@
+import json
+import math
+import os
+import time
+from collections import Counter, defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Callable, Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import aiohttp
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Return the nearest-rank percentile of an already sorted list, or None if it is empty."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _rounded(value: Optional[float], digits: int = 6) -> Optional[float]:
+    """Round a duration for reporting, passing None through."""
+    return round(value, digits) if value is not None else None
+
+
+def _metrics_trace_config(collector_of: Callable[[Any], Optional["RequestMetrics"]]) -> "aiohttp.TraceConfig":
+    """Return a TraceConfig whose hooks feed the collector that collector_of returns for each request's trace context."""
+    import aiohttp
+
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_request_start(session, ctx, params):
+        ctx.started = time.monotonic()
+
+    async def on_request_end(session, ctx, params):
+        metrics = collector_of(ctx)
+        if metrics is not None:
+            metrics.latencies.append(time.monotonic() - ctx.started)
+            metrics.statuses[params.response.status] += 1
+
+    async def on_request_exception(session, ctx, params):
+        metrics = collector_of(ctx)
+        if metrics is not None:
+            metrics.latencies.append(time.monotonic() - ctx.started)
+            metrics.statuses[type(params.exception).__name__] += 1
+
+    def counter_hook(name: str, amount_of: Callable[[Any], int] = lambda params: 1):
+        async def hook(session, ctx, params):
+            metrics = collector_of(ctx)
+            if metrics is not None:
+                metrics.counters[name] += amount_of(params)
+        return hook
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    trace_config.on_response_chunk_received.append(counter_hook("bytes_received", lambda params: len(params.chunk)))
+    trace_config.on_connection_create_end.append(counter_hook("connections_created"))
+    trace_config.on_connection_reuseconn.append(counter_hook("connections_reused"))
+    trace_config.on_dns_cache_hit.append(counter_hook("dns_cache_hits"))
+    trace_config.on_dns_cache_miss.append(counter_hook("dns_cache_misses"))
+    return trace_config
+
+
+@lru_cache(maxsize=None)
+def routed_trace_config() -> "aiohttp.TraceConfig":
+    """Return the TraceConfig for shared sessions, feeding the RequestMetrics passed as each request's trace_request_ctx.
+
+    Sessions shared by several processors are created before most of them exist, so one
+    hook set routes every request to its own processor's collector.
+    """
+    return _metrics_trace_config(lambda ctx: ctx.trace_request_ctx if isinstance(ctx.trace_request_ctx, RequestMetrics) else None)
+
+
+class RequestMetrics:
+    """Collects per-request timing, byte and status metrics for HttpRequestProcessor runs.
+
+    Network-level numbers (latency per attempt, bytes received, connection reuse, DNS cache)
+    come from aiohttp TraceConfig hooks, so the session must be created with trace_config(),
+    or, when it is shared, with routed_trace_config() and the collector passed as each
+    request's trace_request_ctx.
+    Stage timers (semaphore wait, time in flight, data_processor, result construction) are
+    recorded by the processor itself.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear every metric and restart the run clock."""
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        self.counters: Counter = Counter()
+        self.timers: Dict[str, List[float]] = defaultdict(list)
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record one duration for the named stage timer."""
+        self.timers[name].append(seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase the named counter."""
+        self.counters[name] += amount
+
+    def finish(self) -> None:
+        """Stop the run clock used for throughput."""
+        self.finished = time.monotonic()
+
+    def trace_config(self) -> "aiohttp.TraceConfig":
+        """Return a TraceConfig that feeds this collector; pass it to the ClientSession."""
+        return _metrics_trace_config(lambda ctx: self)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the end-of-run summary: request counts, latency percentiles, throughput, counters and stage timers."""
+        elapsed = (self.finished or time.monotonic()) - self.started
+        latencies = sorted(self.latencies)
+        return {
+            "elapsed_seconds": round(elapsed, 4),
+            "requests": len(latencies),
+            "requests_per_second": round(len(latencies) / elapsed, 2) if elapsed > 0 else None,
+            "statuses": {str(status): count for status, count in self.statuses.items()},
+            "latency_seconds": {
+                "p50": _rounded(percentile(latencies, 0.50)),
+                "p90": _rounded(percentile(latencies, 0.90)),
+                "p99": _rounded(percentile(latencies, 0.99)),
+                "max": _rounded(latencies[-1] if latencies else None),
+            },
+            "counters": dict(self.counters),
+            "timers_seconds": {
+                name: {
+                    "count": len(values),
+                    "total": round(sum(values), 4),
+                    "p50": _rounded(percentile(sorted(values), 0.50)),
+                    "p99": _rounded(percentile(sorted(values), 0.99)),
+                }
+                for name, values in self.timers.items()
+            },
+        }
+
+    def export(self, output_path: Union[str, Path]) -> None:
+        """Write the summary to output_path: Prometheus text format for '.prom' files, JSON otherwise."""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        content = self.to_prometheus() if output_path.suffix == ".prom" else json.dumps(self.summary(), indent=4)
+        # Write then rename so a node_exporter textfile collector never reads a partial file
+        temporary_path = output_path.with_suffix(output_path.suffix + f".{os.getpid()}.tmp")
+        temporary_path.write_text(content)
+        os.replace(temporary_path, output_path)
+
+    def to_prometheus(self) -> str:
+        """Render the summary in the Prometheus text exposition format."""
+        summary = self.summary()
+        lines = [
+            "# TYPE qtest_export_requests_total counter",
+            *(f'qtest_export_requests_total{{status="{status}"}} {count}' for status, count in summary["statuses"].items()),
+            "# TYPE qtest_export_request_latency_seconds summary",
+            *(f'qtest_export_request_latency_seconds{{quantile="{q}"}} {summary["latency_seconds"][name]}'
+              for q, name in (("0.5", "p50"), ("0.9", "p90"), ("0.99", "p99")) if summary["latency_seconds"][name] is not None),
+            f"qtest_export_request_latency_seconds_sum {round(sum(self.latencies), 6)}",
+            f"qtest_export_request_latency_seconds_count {len(self.latencies)}",
+            "# TYPE qtest_export_elapsed_seconds gauge",
+            f"qtest_export_elapsed_seconds {summary['elapsed_seconds']}",
+        ]
+        for name, value in summary["counters"].items():
+            lines += [f"# TYPE qtest_export_{name}_total counter", f"qtest_export_{name}_total {value}"]
+        for name, timer in summary["timers_seconds"].items():
+            lines += [
+                f"# TYPE qtest_export_{name}_seconds summary",
+                f"qtest_export_{name}_seconds_sum {timer['total']}",
+                f"qtest_export_{name}_seconds_count {timer['count']}",
+            ]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,51 @@
+import math
+from typing import List, Any, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+class PageSizePagination:
+    """Page/size pagination strategy for qTest list endpoints."""
+
+    def __init__(self, page_size: int = 100, page_param: str = 'page', size_param: str = 'size', start_page: int = 1, items_key: Optional[str] = None, max_pages: Optional[int] = None, total_key: str = 'total'):
+        """Initialize the strategy with the page size, query parameter names, optional page cap and the key of a reported total count."""
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1. Found: {page_size}")
+        self.page_size = page_size
+        self.page_param = page_param
+        self.size_param = size_param
+        self.start_page = start_page
+        self.items_key = items_key
+        self.max_pages = max_pages
+        self.total_key = total_key
+
+    def page_url(self, base_url: str, page: int) -> str:
+        """Return base_url with the page and size query parameters set for the given page."""
+        parts = urlsplit(base_url)
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in (self.page_param, self.size_param)]
+        query += [(self.page_param, str(page)), (self.size_param, str(self.page_size))]
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def page_records(self, response: Any) -> List[Any]:
+        """Return the list of records contained in a page response, which may be a bare list or an object with the items_key list."""
+        if isinstance(response, dict):
+            return response.get(self.items_key or 'items') or []
+        if isinstance(response, list):
+            return response
+        return []
+
+    def is_last_page(self, page: int, response: Any) -> bool:
+        """Return True if the response is short or empty, or the page cap has been reached."""
+        if self.max_pages is not None and page - self.start_page + 1 >= self.max_pages:
+            return True
+        return len(self.page_records(response)) < self.page_size
+
+    def reported_last_page(self, response: Any) -> Optional[int]:
+        """Return the last page implied by the total count of an object response, or None if the API reports no total."""
+        if not isinstance(response, dict):
+            return None
+        total = response.get(self.total_key)
+        if not isinstance(total, int) or isinstance(total, bool):
+            return None
+        page_count = max(1, math.ceil(total / self.page_size))
+        if self.max_pages is not None:
+            page_count = min(page_count, self.max_pages)
+        return self.start_page + page_count - 1
@@ -0,0 +1,24 @@
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Dict, Any, Optional
+
+from ..config_loader import SensitiveDict
+
+PROCESSING_MODES = ("inline", "thread", "process")
+
+def worker_safe_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the config without the logger and sensitive entries so it can be pickled to worker processes."""
+    return {
+        key: value for key, value in config.items()
+        if not isinstance(value, (logging.Logger, SensitiveDict))
+    }
+
+def create_processing_executor(mode: str = "inline", workers: Optional[int] = None) -> Optional[Executor]:
+    """Return the executor for the given processing mode, or None to run data_processor on the event loop."""
+    if mode == "inline":
+        return None
+    if mode == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="data_processor")
+    if mode == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    raise ValueError(f"Unsupported processing mode '{mode}'. Allowed values are: {list(PROCESSING_MODES)}")
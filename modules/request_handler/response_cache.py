@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional, Union, Tuple
+
+CACHE_KEY_HEADERS = ("authorization", "accept", "accept-language", "content-type")
+# Stored in the database's user_version; version 1 stores bodies as JSON
+CACHE_FORMAT_VERSION = 1
+
+class CachedResponse:
+    """A response body stored in the cache together with its revalidation headers."""
+
+    def __init__(self, key: str, body: bytes, etag: Optional[str], last_modified: Optional[str], stored_at: float):
+        self.key = key
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    def load(self) -> Any:
+        """Return the stored response data."""
+        return json.loads(self.body)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the If-None-Match/If-Modified-Since headers used to revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """On-disk SQLite cache of parsed JSON responses with TTL, LRU size eviction and conditional revalidation.
+
+    Bodies are stored as compact JSON, never pickled, so a cache file written by someone else
+    can at worst hold wrong data, not run code. Entries younger than ttl seconds are served without contacting the server; older
+    entries are revalidated with their ETag/Last-Modified validators.
+
+    The aget/astore/amark_hit variants run the SQLite work and body decoding on the cache's
+    own thread, so the event loop never blocks on them. Close the cache, or use it as a context manager, to
+    release the database connection and that thread.
+    """
+
+    def __init__(self, cache_path: Union[str, Path], ttl: float = 0, max_size_bytes: int = 512 * 1024 * 1024):
+        """Initialize the cache database at cache_path with its TTL in seconds and maximum total body size."""
+        self.cache_path = Path(cache_path)
+        self.ttl = ttl
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            # Databases written before bodies were stored as JSON hold pickled bodies, which are dropped
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] < CACHE_FORMAT_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS responses")
+                self._connection.execute(f"PRAGMA user_version = {CACHE_FORMAT_VERSION}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT, etag TEXT, last_modified TEXT, body BLOB, "
+                "size INTEGER, stored_at REAL, accessed_at REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        # Kept up to date by store and _evict, so eviction never has to sum the table
+        self._total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="response-cache")
+
+    @classmethod
+    def from_config(cls, config) -> Optional["ResponseCache"]:
+        """Build a cache from the response_cache_* config keys, or return None if caching is not configured."""
+        cache_path = config.get("response_cache_path")
+        if not cache_path:
+            return None
+        return cls(
+            cache_path,
+            ttl=config.get("response_cache_ttl", 0),
+            max_size_bytes=config.get("response_cache_max_mb", 512) * 1024 * 1024,
+        )
+
+    @staticmethod
+    def make_key(method: str, url: str, headers: Optional[Dict[str, str]] = None, payload: Any = None) -> str:
+        """Return the cache key for a request from its method, URL, relevant headers and payload."""
+        relevant_headers = sorted((name.lower(), value) for name, value in (headers or {}).items() if name.lower() in CACHE_KEY_HEADERS)
+        material = json.dumps([method.upper(), url, relevant_headers, payload], sort_keys=True, default=str)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached entry for key, or None if there is none."""
+        with self._lock:
+            row = self._connection.execute("SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(key, row[0], row[1], row[2], row[3])
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Return True if the entry is young enough to be served without revalidation."""
+        return self.ttl > 0 and time.time() - entry.stored_at < self.ttl
+
+    def mark_hit(self, entry: CachedResponse, revalidated: bool = False) -> Any:
+        """Record a cache hit, restart the entry's TTL after a revalidation, and return its data."""
+        now = time.time()
+        with self._lock, self._connection:
+            if revalidated:
+                self.revalidated += 1
+                self._connection.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, entry.key))
+            else:
+                self.hits += 1
+                self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, entry.key))
+        return entry.load()
+
+    def store(self, key: str, url: str, data: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a freshly fetched response and evict least recently used entries beyond the size limit."""
+        body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        now = time.time()
+        with self._lock, self._connection:
+            self.misses += 1
+            replaced = self._connection.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, url, etag, last_modified, body, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, etag, last_modified, body, len(body), now, now),
+            )
+            self._total_size += len(body) - (replaced[0] if replaced else 0)
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the total body size fits in max_size_bytes."""
+        cursor = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        evicted = []
+        for key, size in cursor:
+            evicted.append((key,))
+            self._total_size -= size
+            if self._total_size <= self.max_size_bytes:
+                break
+        cursor.close()
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    async def aget(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached entry for key, looked up on the cache's thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.get, key)
+
+    async def amark_hit(self, entry: CachedResponse, revalidated: bool = False) -> Any:
+        """Record a cache hit and load the entry's data on the cache's thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.mark_hit, entry, revalidated)
+
+    async def astore(self, key: str, url: str, data: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Store a freshly fetched response on the cache's thread."""
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.store, key, url, data, etag, last_modified)
+
+    def stats(self, reset: bool = False) -> Dict[str, int]:
+        """Return hit, revalidation and miss counts, optionally resetting them for the next run."""
+        counts = {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+        if reset:
+            self.hits = self.revalidated = self.misses = 0
+        return counts
+
+    def close(self) -> None:
+        """Close the cache database and stop its thread."""
+        self._executor.shutdown(wait=True)
+        self._connection.close()
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,119 @@
+from typing import Dict, Any, List
+
+RESULT_FORMATS = ("dataframe", "records", "arrow")
+
+def _batch_kind(batch: Any) -> str:
+    """Return 'records', 'dataframe' or 'arrow' for one data_processor result."""
+    if isinstance(batch, list):
+        return "records"
+    module = type(batch).__module__
+    if module.startswith("pandas"):
+        return "dataframe"
+    if module.startswith("pyarrow"):
+        return "arrow"
+    raise TypeError(f"data_processor must return a list of records, a pandas DataFrame or a pyarrow Table. Found: {type(batch).__name__}")
+
+def _plain_value(value: Any) -> Any:
+    """Return a DataFrame cell as plain Python data; list columns hold numpy arrays, possibly nested in dicts."""
+    if isinstance(value, dict):
+        return {key: _plain_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain_value(item) for item in value]
+    if type(value).__module__ == "numpy":
+        # Arrays become lists and numpy scalars Python scalars
+        return _plain_value(value.tolist())
+    return value
+
+def as_records(batch: Any) -> List[Dict]:
+    """Return one data_processor result as a list of dicts, with missing DataFrame values as None."""
+    kind = _batch_kind(batch)
+    if kind == "records":
+        return batch
+    if kind == "arrow":
+        return batch.to_pylist()
+    records = batch.astype(object).where(batch.notna(), None).to_dict("records")
+    # Only object columns can hold arrays or nested data; numeric columns are already Python scalars here
+    object_columns = [column for column, dtype in batch.dtypes.items() if dtype == object]
+    if object_columns:
+        for record in records:
+            for column in object_columns:
+                record[column] = _plain_value(record[column])
+    return records
+
+def check_result_format(result_format: str) -> None:
+    """Raise a ValueError if result_format is not one of RESULT_FORMATS."""
+    if result_format not in RESULT_FORMATS:
+        raise ValueError(f"Unsupported result_format '{result_format}'. Allowed values are: {list(RESULT_FORMATS)}")
+
+def build_result(records: List[Dict], result_format: str = "dataframe") -> Any:
+    """Return the records as a pandas DataFrame, a pyarrow Table or the plain list of dicts.
+
+    pandas and pyarrow are imported only when their format is requested, so callers that
+    write records straight to an output never load them.
+    """
+    check_result_format(result_format)
+
+    if result_format == "records":
+        return records
+
+    if result_format == "dataframe":
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("The 'dataframe' result format requires 'pandas'. Install it or use result_format 'records'.")
+        return pd.DataFrame(records)
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("The 'arrow' result format requires 'pyarrow'. Install it or use result_format 'records'.")
+    # Collect columns across all records, like the DataFrame constructor does, instead of only the first record's keys
+    columns = dict.fromkeys(key for record in records for key in record)
+    return pa.table({column: [record.get(column) for record in records] for column in columns})
+
+def _to_dataframe(batch: Any) -> Any:
+    """Return one data_processor result as a pandas DataFrame."""
+    import pandas as pd
+
+    kind = _batch_kind(batch)
+    if kind == "dataframe":
+        return batch
+    if kind == "arrow":
+        return batch.to_pandas()
+    return pd.DataFrame(batch)
+
+def _to_arrow(batch: Any) -> Any:
+    """Return one data_processor result as a pyarrow Table."""
+    import pyarrow as pa
+
+    kind = _batch_kind(batch)
+    if kind == "arrow":
+        return batch
+    if kind == "dataframe":
+        return pa.Table.from_pandas(batch, preserve_index=False)
+    return build_result(batch, "arrow")
+
+def combine_batches(batches: List[Any], result_format: str = "dataframe") -> Any:
+    """Combine per-response data_processor results into one result of the requested format.
+
+    Batches may be lists of records, DataFrames or pyarrow Tables. Columnar batches are
+    concatenated directly instead of being expanded into one dict per row.
+    """
+    check_result_format(result_format)
+    batches = [batch for batch in batches if len(batch)]
+
+    if result_format == "records" or all(isinstance(batch, list) for batch in batches):
+        return build_result([record for batch in batches for record in as_records(batch)], result_format)
+
+    if result_format == "dataframe":
+        import pandas as pd
+        return pd.concat([_to_dataframe(batch) for batch in batches], ignore_index=True)
+
+    import pyarrow as pa
+    tables = [_to_arrow(batch) for batch in batches]
+    try:
+        # Responses can carry different property columns, so missing columns are filled with nulls
+        return pa.concat_tables(tables, promote_options="default")
+    except TypeError:
+        # pyarrow < 14 only has the promote flag
+        return pa.concat_tables(tables, promote=True)
@@ -0,0 +1,64 @@
+import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class RetryPolicy:
+    """Jittered exponential backoff policy that honors the Retry-After header."""
+
+    def __init__(self, retry_attempts: int = 0, backoff_base: float = 0.5, backoff_max: float = 30.0, retry_after_max: float = 300.0):
+        """Initialize the policy with the number of retries and the backoff bounds in seconds."""
+        if retry_attempts < 0:
+            raise ValueError(f"retry_attempts must be greater than or equal to 0. Found: {retry_attempts}")
+        self.retry_attempts = retry_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+
+    @classmethod
+    def from_config(cls, config) -> "RetryPolicy":
+        """Build a policy from the 'retry_attempts' config key, defaulting to no retries."""
+        return cls(retry_attempts=int(config.get("retry_attempts", 0) or 0))
+
+    def should_retry(self, attempt: int, error: Exception) -> bool:
+        """Return True if the request that raised error on the given zero-based attempt should be retried."""
+        import aiohttp
+
+        if attempt >= self.retry_attempts:
+            return False
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in RETRYABLE_STATUSES
+        return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError))
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        """Return the delay in seconds before the next attempt, preferring the server's Retry-After value."""
+        import aiohttp
+
+        backoff = random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+        retry_after = None
+        if isinstance(error, aiohttp.ClientResponseError) and error.headers:
+            retry_after = self.parse_retry_after(error.headers.get("Retry-After"))
+
+        if retry_after is None:
+            return backoff
+        return min(max(retry_after, backoff), self.retry_after_max)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given either as delay-seconds or as an HTTP date."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,116 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from ..config_loader import ConfigLoader
+from .concurrency import FairDomainLimiter
+from .export_job import ExportJob
+from .session_manager import SessionManager
+
+class ExportScheduler:
+    """Run the exports of many configs concurrently on one event loop and one connection pool.
+
+    Every config is loaded and validated before anything runs. Requests of all jobs then share
+    one SessionManager, and a FairDomainLimiter caps the concurrency and rate per qTest domain
+    across jobs, handing free slots to the jobs in turn. Each job keeps its own logger and
+    request timeouts; only the pool settings (keep-alive, DNS cache) come from the first config.
+    """
+
+    def __init__(self, config_paths: List[Union[str, Path]], max_concurrent_per_domain: int = 10, requests_per_second_per_domain: Optional[float] = None,
+                 rules_dir: Optional[Union[str, Path]] = None, connection_limit: int = 100):
+        """Initialize the scheduler with the config files, the per-domain limits and the shared pool size."""
+        self.config_paths = [Path(path) for path in config_paths]
+        self.rules_dir = rules_dir
+        self.limiter = FairDomainLimiter(max_concurrent_per_domain, requests_per_second_per_domain)
+        self.connection_limit = connection_limit
+        self.jobs: List[Tuple[Path, ExportJob]] = []
+        self.started_at: Optional[float] = None
+
+    def load(self) -> Dict[str, str]:
+        """Load and validate every config, create a job for each valid one and return the errors keyed by config path."""
+        errors = {}
+        names = set()
+        self.jobs = []
+        for path in self.config_paths:
+            # Configs in different directories may share a file name, and the name picks the output file and logger
+            name = path.stem
+            suffix = 2
+            while name in names:
+                name = f"{path.stem}_{suffix}"
+                suffix += 1
+
+            try:
+                # A logger per config, so each job logs to its own file with its own log settings
+                config = ConfigLoader(path, self.rules_dir, logger_name=f"{__name__}.{name}").config
+            except (FileNotFoundError, IsADirectoryError, ValueError) as e:
+                errors[str(path)] = str(e)
+                continue
+
+            names.add(name)
+            self.jobs.append((path, ExportJob(f"{len(self.jobs) + 1}-{name}", name, config)))
+        return errors
+
+    async def run(self) -> Dict[str, Any]:
+        """Run every loaded job concurrently and return the timing report."""
+        if not self.jobs:
+            return self.report(0.0, {})
+
+        # Pool settings come from the first config; every request sets its own config's timeouts, and the per-domain limit caps connections per host
+        first_config = self.jobs[0][1].config
+        session_manager = SessionManager.from_config({
+            **first_config,
+            "connection_limit": self.connection_limit,
+            "connection_limit_per_host": self.limiter.max_concurrent,
+            # Trace the shared session if any job collects metrics; each request feeds its own job's collector
+            "collect_metrics": any(job.config.get("collect_metrics", False) for _, job in self.jobs),
+        })
+
+        request_limiters = {}
+        started = time.monotonic()
+        self.started_at = time.time()
+        async with session_manager:
+            tasks = []
+            for _, job in self.jobs:
+                request_limiters[job.job_id] = self.limiter.for_job(domain_of(job.config), job.job_id)
+                job.task = asyncio.create_task(job.run(request_limiters[job.job_id], session_manager))
+                tasks.append(job.task)
+            # Job failures are recorded on each job, so one failing job does not stop the others
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return self.report(time.monotonic() - started, request_limiters)
+
+    def report(self, wall_seconds: float, request_limiters: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the per-job timing, throughput and outcome together with the overall totals."""
+        jobs = []
+        for path, job in self.jobs:
+            progress = job.progress()
+            request_limiter = request_limiters.get(job.job_id)
+            jobs.append({
+                "config": str(path),
+                "domain": domain_of(job.config),
+                "state": progress["state"],
+                "started_offset_seconds": round(job.started - self.started_at, 3) if job.started and self.started_at else None,
+                "duration_seconds": progress["elapsed_seconds"],
+                "requests": progress["requests_done"],
+                "requests_per_second": progress["requests_per_second"],
+                "limiter_wait_seconds_total": round(request_limiter.wait_seconds, 3) if request_limiter is not None else None,
+                "records_written": progress["records_written"],
+                "errors": progress["error_details"],
+                "output_path": progress["output_path"],
+            })
+
+        requests = sum(job["requests"] for job in jobs)
+        return {
+            "wall_seconds": round(wall_seconds, 3),
+            "jobs_total": len(jobs),
+            "jobs_succeeded": sum(1 for job in jobs if job["state"] == "succeeded"),
+            "requests": requests,
+            "requests_per_second": round(requests / wall_seconds, 2) if wall_seconds else 0.0,
+            "jobs": jobs,
+        }
+
+
+def domain_of(config) -> str:
+    """Return the host of the config's qTest domain, which the per-domain limits are keyed by."""
+    return urlsplit(config["qTest_domain"]).netloc.lower()
@@ -0,0 +1,106 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional, AsyncIterator, List, TYPE_CHECKING
+
+from .metrics import routed_trace_config
+
+if TYPE_CHECKING:
+    import aiohttp
+
+TIMEOUT_CONFIG_KEYS = ("request_timeout_total", "request_timeout_connect", "request_timeout_read")
+
+def request_timeout(config) -> Optional["aiohttp.ClientTimeout"]:
+    """Return the per-request timeout from the config's request_timeout_* keys, or None if it sets none of them."""
+    if not any(key in config for key in TIMEOUT_CONFIG_KEYS):
+        return None
+    import aiohttp
+
+    return aiohttp.ClientTimeout(
+        total=config.get("request_timeout_total"),
+        connect=config.get("request_timeout_connect", 30),
+        sock_read=config.get("request_timeout_read", 300),
+    )
+
+
+class SessionManager:
+    """Owns one long-lived aiohttp session and connection pool shared across request bundles."""
+
+    def __init__(self, connection_limit: int = 100, connection_limit_per_host: int = 0, keepalive_timeout: float = 30.0, dns_cache_ttl: int = 300, total_timeout: Optional[float] = None, connect_timeout: Optional[float] = 30.0, read_timeout: Optional[float] = 300.0, trace_configs: Optional[List["aiohttp.TraceConfig"]] = None):
+        """Initialize the manager with connector, timeout and tracing settings; the session is created lazily.
+
+        connection_limit_per_host 0 leaves connections per host unlimited, so only connection_limit
+        and the processor's concurrency limits bound them.
+        """
+        import aiohttp
+
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout, sock_read=read_timeout)
+        self.trace_configs = list(trace_configs or [])
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_config(cls, config, trace_configs: Optional[List["aiohttp.TraceConfig"]] = None) -> "SessionManager":
+        """Build a manager from the connection pool keys in the config, using defaults for missing keys.
+
+        With config["collect_metrics"] set and no trace_configs given, the session is traced for
+        the RequestMetrics of every processor that shares it.
+        """
+        if trace_configs is None and config.get("collect_metrics", False):
+            trace_configs = [routed_trace_config()]
+        return cls(
+            connection_limit=config.get("connection_limit", 100),
+            connection_limit_per_host=config.get("connection_limit_per_host", 0),
+            keepalive_timeout=config.get("keepalive_timeout", 30),
+            dns_cache_ttl=config.get("dns_cache_ttl", 300),
+            total_timeout=config.get("request_timeout_total"),
+            connect_timeout=config.get("request_timeout_connect", 30),
+            read_timeout=config.get("request_timeout_read", 300),
+            trace_configs=trace_configs,
+        )
+
+    async def get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared session, creating it and its connector on first use."""
+        import aiohttp
+
+        async with self._lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.connection_limit,
+                    limit_per_host=self.connection_limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                )
+                self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout, trace_configs=self.trace_configs or None)
+            return self._session
+
+    async def close(self) -> None:
+        """Close the shared session and release every pooled connection."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "SessionManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+@asynccontextmanager
+async def borrow_session(config, session_manager: Optional[SessionManager] = None, trace_configs: Optional[List["aiohttp.TraceConfig"]] = None) -> AsyncIterator["aiohttp.ClientSession"]:
+    """Yield the shared session when a manager is given, otherwise a session that is closed on exit.
+
+    trace_configs only apply to the temporary session; a shared manager keeps the ones it was
+    created with, see SessionManager.from_config.
+    """
+    if session_manager is not None:
+        yield await session_manager.get_session()
+        return
+
+    async with SessionManager.from_config(config, trace_configs) as temporary_manager:
+        yield await temporary_manager.get_session()
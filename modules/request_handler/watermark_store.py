@@ -0,0 +1,80 @@
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Union, Tuple
+
+class WatermarkStore:
+    """SQLite store of export runs and the highest modified date seen per project and endpoint.
+
+    Watermarks set during a run are staged and only written by finish_run(success=True), so a
+    failed run never advances them past data that was not exported.
+    """
+
+    def __init__(self, store_path: Union[str, Path]):
+        """Open (or create) the watermark database at store_path."""
+        self.store_path = Path(store_path)
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.store_path)
+        self._staged: Dict[Tuple[str, str], str] = {}
+        self._run_id: Optional[int] = None
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                "run_id INTEGER PRIMARY KEY AUTOINCREMENT, started_at TEXT, finished_at TEXT, status TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS watermarks ("
+                "project TEXT, endpoint TEXT, max_modified TEXT, updated_at TEXT, PRIMARY KEY (project, endpoint))"
+            )
+
+    def begin_run(self) -> int:
+        """Record the start of an export run and return its id."""
+        with self._connection:
+            cursor = self._connection.execute("INSERT INTO runs (started_at, status) VALUES (?, 'running')", (self._now(),))
+        self._run_id = cursor.lastrowid
+        self._staged = {}
+        return self._run_id
+
+    def get_watermark(self, project: Union[str, int], endpoint: str) -> Optional[str]:
+        """Return the highest modified date committed for the project and endpoint, or None before the first successful run."""
+        row = self._connection.execute(
+            "SELECT max_modified FROM watermarks WHERE project = ? AND endpoint = ?", (str(project), endpoint)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_staged_watermark(self, project: Union[str, int], endpoint: str) -> Optional[str]:
+        """Return the watermark staged for the project and endpoint in the current run, or None."""
+        return self._staged.get((str(project), endpoint))
+
+    def stage_watermark(self, project: Union[str, int], endpoint: str, max_modified: str) -> None:
+        """Stage a new watermark for the project and endpoint, to be committed when the run succeeds."""
+        self._staged[(str(project), endpoint)] = max_modified
+
+    def finish_run(self, success: bool) -> None:
+        """Mark the current run finished and commit its staged watermarks if it succeeded."""
+        now = self._now()
+        with self._connection:
+            if success:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO watermarks (project, endpoint, max_modified, updated_at) VALUES (?, ?, ?, ?)",
+                    [(project, endpoint, max_modified, now) for (project, endpoint), max_modified in self._staged.items()],
+                )
+            self._connection.execute(
+                "UPDATE runs SET finished_at = ?, status = ? WHERE run_id = ?",
+                (now, "success" if success else "failed", self._run_id),
+            )
+        self._staged = {}
+        self._run_id = None
+
+    def last_successful_run(self) -> Optional[str]:
+        """Return when the most recent successful run finished, or None if there has been none."""
+        row = self._connection.execute("SELECT MAX(finished_at) FROM runs WHERE status = 'success'").fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        """Close the watermark database."""
+        self._connection.close()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now(timezone.utc).isoformat()
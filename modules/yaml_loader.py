@@ -0,0 +1,129 @@
+import base64
+import hashlib
+import json
+import os
+import pickle
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# Set YAML_SNAPSHOT_DIR to keep JSON snapshots of parsed files so new processes skip parsing
+SNAPSHOT_DIR_ENV = "YAML_SNAPSHOT_DIR"
+# Marks values JSON cannot hold as such (dates, binary, sets, maps with non-string keys) in snapshots
+SNAPSHOT_TAG = "__yaml__"
+
+_cache: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+
+def safe_load(stream) -> Any:
+    """Parse YAML with the libyaml-backed safe loader when available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+def load_yaml_file(path: Union[str, Path], snapshot_dir: Optional[Union[str, Path]] = None) -> Any:
+    """Parse a YAML file, reusing the cached result while the file's mtime and size are unchanged.
+
+    Every call returns a fresh copy, so callers may modify the result. The parsed result is
+    kept pickled in memory and, when snapshot_dir (or YAML_SNAPSHOT_DIR) is set, as JSON on
+    disk as well. Snapshots are plain data, so a snapshot directory others can write to can at
+    worst hand back wrong data, never run code.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _cache.get(resolved)
+    if cached is not None and cached[0] == signature:
+        return pickle.loads(cached[1])
+
+    snapshot_dir = snapshot_dir if snapshot_dir is not None else os.environ.get(SNAPSHOT_DIR_ENV)
+    snapshot_path = _snapshot_path(resolved, snapshot_dir) if snapshot_dir else None
+
+    data = _read_snapshot(snapshot_path, signature) if snapshot_path else None
+    if data is None:
+        with resolved.open('r') as f:
+            data = safe_load(f)
+        if snapshot_path:
+            _write_snapshot(snapshot_path, signature, data)
+
+    # The in-memory copy is pickled by this process only; pickling is the fastest deep copy for fresh results
+    payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    _cache[resolved] = (signature, payload)
+    return pickle.loads(payload)
+
+def clear_cache() -> None:
+    """Forget every parsed file held in memory."""
+    _cache.clear()
+
+def _snapshot_path(resolved: Path, snapshot_dir: Union[str, Path]) -> Path:
+    """Return the snapshot file used for a source file."""
+    digest = hashlib.sha1(str(resolved).encode("utf-8")).hexdigest()
+    return Path(snapshot_dir) / f"{resolved.stem}_{digest[:16]}.json"
+
+def _to_snapshot(value: Any) -> Any:
+    """Convert parsed YAML into JSON-compatible data, tagging the types JSON does not have."""
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value) and SNAPSHOT_TAG not in value:
+            return {key: _to_snapshot(item) for key, item in value.items()}
+        return {SNAPSHOT_TAG: "map", "items": [[_to_snapshot(key), _to_snapshot(item)] for key, item in value.items()]}
+    if isinstance(value, list):
+        return [_to_snapshot(item) for item in value]
+    if isinstance(value, datetime):
+        return {SNAPSHOT_TAG: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {SNAPSHOT_TAG: "date", "value": value.isoformat()}
+    if isinstance(value, bytes):
+        return {SNAPSHOT_TAG: "binary", "value": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, (set, frozenset)):
+        return {SNAPSHOT_TAG: "set", "items": [_to_snapshot(item) for item in value]}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f"Cannot snapshot a value of type '{type(value).__name__}'")
+
+def _from_snapshot(value: Any) -> Any:
+    """Rebuild parsed YAML from snapshot data written by _to_snapshot."""
+    if isinstance(value, list):
+        return [_from_snapshot(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    tag = value.get(SNAPSHOT_TAG)
+    if tag is None:
+        return {key: _from_snapshot(item) for key, item in value.items()}
+    if tag == "map":
+        return {_from_snapshot(key): _from_snapshot(item) for key, item in value["items"]}
+    if tag == "datetime":
+        return datetime.fromisoformat(value["value"])
+    if tag == "date":
+        return date.fromisoformat(value["value"])
+    if tag == "binary":
+        return base64.b64decode(value["value"])
+    if tag == "set":
+        return {_from_snapshot(item) for item in value["items"]}
+    raise ValueError(f"Unknown snapshot tag '{tag}'")
+
+def _read_snapshot(snapshot_path: Path, signature: Tuple[int, int]) -> Optional[Any]:
+    """Return the parsed data from a snapshot if it was taken of the current file version."""
+    try:
+        with snapshot_path.open('r', encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if tuple(snapshot["signature"]) != tuple(signature):
+            return None
+        return _from_snapshot(snapshot["data"])
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+def _write_snapshot(snapshot_path: Path, signature: Tuple[int, int], data: Any) -> None:
+    """Atomically write a snapshot; failures are ignored since snapshots are only an optimization."""
+    try:
+        content = json.dumps({"signature": list(signature), "data": _to_snapshot(data)})
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(content, encoding="utf-8")
+        os.replace(temporary_path, snapshot_path)
+    except (OSError, TypeError, ValueError):
+        pass
@@ -1,5 +1,6 @@
-from fastapi import FastAPI
 import uvicorn
+import argparse
+import importlib.util
 import os
 import sys
 import webbrowser
@@ -11,27 +12,93 @@ current_file_path = os.path.abspath(__file__)
 project_root = os.path.dirname(os.path.dirname(current_file_path))
 sys.path.append(project_root)
 
-def open_browser():
+APP_IMPORT_STRING = "modules.UI.routes:app"
+UI_MODE_ENV = "QTEST_UI_MODE"
+JOB_REQUEST_BUDGET_ENV = "QTEST_UI_JOB_REQUEST_BUDGET"
+
+def open_browser(port: int = 8000):
     """Function to open the web browser to the menu page."""
-    webbrowser.open_new("http://localhost:8000/main_menu")
+    webbrowser.open_new(f"http://localhost:{port}/main_menu")
 
 def is_port_in_use(host: str, port: int) -> bool:
     """Check if a port is already in use on the given host."""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # A local connect either succeeds or is refused at once; the timeout only guards against a filtered port
+        s.settimeout(0.5)
         return s.connect_ex((host, port)) == 0
 
-def start_server():
-    """Function to start the FastAPI web server and open the browser."""
-    if is_port_in_use('localhost', 8000):
+def production_workers(requested: int = None) -> int:
+    """Return the production worker count, which is always 1: export jobs, their progress events
+    and the job request budget live in the server process, so a second worker would not see them."""
+    if requested is not None and requested > 1:
+        print(f"Warning: --workers {requested} ignored; export jobs and their progress are kept in one process, so the UI runs a single worker.")
+    return 1
+
+def server_implementations() -> dict:
+    """Return uvicorn's event loop and HTTP parser, using uvloop and httptools when they are installed."""
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+    }
+
+def start_server(host: str = "0.0.0.0", port: int = 8000, browser: bool = True):
+    """Function to start the FastAPI web server with reload and open the browser."""
+    if is_port_in_use('localhost', port):
         print("Server is already running. Opening browser...")
-        open_browser()
+        if browser:
+            open_browser(port)
     else:
         print("Starting new server...")
-        # Launch the browser after a short delay to ensure the server is up
-        Timer(1, open_browser).start()  # Wait 1 second before opening the browser
+        if browser:
+            # Launch the browser after a short delay to ensure the server is up
+            Timer(1, open_browser, args=(port,)).start()  # Wait 1 second before opening the browser
         # Pass the application as an import string to enable reload functionality
-        uvicorn.run("modules.UI.routes:app", host="0.0.0.0", port=8000, reload=True)
+        uvicorn.run(APP_IMPORT_STRING, host=host, port=port, reload=True)
+
+def start_production_server(host: str = "0.0.0.0", port: int = 8000, workers: int = None):
+    """Start the web server for shared use: one worker process, no reload and no browser."""
+    workers = production_workers(workers)
+    implementations = server_implementations()
+    # Worker processes import the app themselves, so the mode is passed through the environment
+    os.environ[UI_MODE_ENV] = "production"
+    print(f"Starting production server on '{host}:{port}' with {workers} worker(s), "
+          f"loop '{implementations['loop']}' and http '{implementations['http']}'...")
+    uvicorn.run(
+        APP_IMPORT_STRING,
+        host=host,
+        port=port,
+        workers=workers,
+        reload=False,
+        proxy_headers=True,
+        access_log=False,
+        **implementations,
+    )
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse the command line options; without any the development server is started."""
+    parser = argparse.ArgumentParser(description="Launch the qTest export config UI.")
+    parser.add_argument("--production", action="store_true", help="Run without reload or browser, with gzip and long-lived static caching")
+    parser.add_argument("--host", default="0.0.0.0", help="Interface to bind (default: 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind (default: 8000)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes in production mode; values above 1 are clamped to 1 since export jobs live in one process")
+    parser.add_argument("--no-browser", action="store_true", help="Do not open the browser in development mode")
+    parser.add_argument("--job-request-budget", type=int, default=None, help="Requests in flight across all export jobs started from the UI (default: 20)")
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers is not None and not args.production:
+        parser.error("--workers requires --production; the development server reloads a single process")
+    if args.job_request_budget is not None and args.job_request_budget < 1:
+        parser.error("--job-request-budget must be at least 1")
+    return args
 
 if __name__ == "__main__":
-    # Run the web server or open the browser if already running
-    start_server()
+    args = parse_args()
+    if args.job_request_budget is not None:
+        # Read by the app when it is imported, in this process or in the worker
+        os.environ[JOB_REQUEST_BUDGET_ENV] = str(args.job_request_budget)
+    if args.production:
+        start_production_server(args.host, args.port, args.workers)
+    else:
+        # Run the web server or open the browser if already running
+        start_server(args.host, args.port, browser=not args.no_browser)
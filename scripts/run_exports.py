@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+# Add the project root to sys.path to ensure 'modules' can be imported
+current_file_path = os.path.abspath(__file__)
+project_root = os.path.dirname(os.path.dirname(current_file_path))
+sys.path.append(project_root)
+
+from modules.request_handler.scheduler import ExportScheduler
+
+def main() -> int:
+    """Load and validate every config, run their exports together and print the per-job timing report as JSON."""
+    parser = argparse.ArgumentParser(description="Run the exports of several configs concurrently on one event loop and connection pool.")
+    parser.add_argument("configs", nargs="+", help="Config YAML files to export")
+    parser.add_argument("--rules-dir", default=None, help="Directory containing config_rules.yaml and auth_rules.yaml (default: configs/validation)")
+    parser.add_argument("--max-concurrent-per-domain", type=int, default=10, help="Requests in flight per qTest domain across all jobs (default: 10)")
+    parser.add_argument("--requests-per-second-per-domain", type=float, default=None, help="Request rate limit per qTest domain across all jobs (default: unlimited)")
+    parser.add_argument("--connection-limit", type=int, default=100, help="Connections in the shared pool (default: 100)")
+    parser.add_argument("--skip-invalid", action="store_true", help="Run the valid configs even if some fail validation")
+    parser.add_argument("--output", default=None, help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    scheduler = ExportScheduler(
+        args.configs,
+        max_concurrent_per_domain=args.max_concurrent_per_domain,
+        requests_per_second_per_domain=args.requests_per_second_per_domain,
+        rules_dir=args.rules_dir,
+        connection_limit=args.connection_limit,
+    )
+
+    errors = scheduler.load()
+    if errors and not args.skip_invalid:
+        print(json.dumps({"invalid_configs": errors}, indent=4))
+        return 1
+
+    report = asyncio.run(scheduler.run())
+    report["invalid_configs"] = errors
+
+    output = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    return 0 if not errors and report["jobs_succeeded"] == report["jobs_total"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+import argparse
+import json
+import os
+import sys
+
+# Add the project root to sys.path to ensure 'modules' can be imported
+current_file_path = os.path.abspath(__file__)
+project_root = os.path.dirname(os.path.dirname(current_file_path))
+sys.path.append(project_root)
+
+from modules.batch_validator import DEFAULT_RULES_DIR, validate_config_directory
+
+def main() -> int:
+    """Validate every config in a directory and print the per-file results as JSON."""
+    parser = argparse.ArgumentParser(description="Validate a directory of config files in parallel.")
+    parser.add_argument("config_dir", nargs="?", default="configs", help="Directory containing the config YAML files (default: configs)")
+    parser.add_argument("--rules-dir", default=str(DEFAULT_RULES_DIR), help="Directory containing config_rules.yaml and auth_rules.yaml")
+    parser.add_argument("--pattern", default="*.yaml", help="Glob pattern for config files (default: *.yaml)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--output", default=None, help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    results = validate_config_directory(args.config_dir, args.rules_dir, args.pattern, args.workers)
+    summary = {
+        "total": len(results),
+        "valid": sum(1 for result in results if result["valid"]),
+        "invalid": sum(1 for result in results if not result["valid"]),
+        "results": results,
+    }
+
+    output = json.dumps(summary, indent=4)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    return 0 if summary["invalid"] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
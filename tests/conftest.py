@@ -0,0 +1,44 @@
+import logging
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Dict
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@asynccontextmanager
+async def serve_routes(routes: Dict[str, Callable[..., Awaitable]]) -> AsyncIterator[str]:
+    """Serve aiohttp GET handlers keyed by path on a free localhost port and yield the base URL, ending in '/'."""
+    from aiohttp import web
+
+    app = web.Application()
+    for path, handler in routes.items():
+        app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    try:
+        yield f"http://{host}:{port}/"
+    finally:
+        await runner.cleanup()
+
+
+@pytest.fixture
+def local_server():
+    """Return serve_routes, an async context manager serving test handlers on localhost."""
+    return serve_routes
+
+
+@pytest.fixture
+def logger():
+    """Return a quiet logger for configs built by hand."""
+    test_logger = logging.getLogger("tests")
+    test_logger.addHandler(logging.NullHandler())
+    test_logger.propagate = False
+    return test_logger
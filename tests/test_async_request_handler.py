@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+
+from modules.request_handler.async_request_handler import HttpRequestProcessor
+
+
+def records(config, response):
+    return response
+
+
+def test_adaptive_limiter_latency_excludes_request_budget_wait(local_server, logger):
+    from aiohttp import web
+
+    async def items(request):
+        return web.json_response([{"id": 1}])
+
+    async def run():
+        config = {"logger": logger, "max_concurrent_requests": 2, "adaptive_concurrency": True}
+        request_budget = asyncio.Semaphore(1)
+        async with local_server({"/items": items}) as base_url:
+            processor = HttpRequestProcessor(config, [f"{base_url}items"], {}, records, request_budget=request_budget)
+            # Another job holds the only budget slot for a while before this request may start
+            await request_budget.acquire()
+            asyncio.get_running_loop().call_later(0.3, request_budget.release)
+            result = await processor.make_requests(config, result_format="records")
+            return result, processor.limiter.stats()
+
+    result, stats = asyncio.run(run())
+    assert result == [{"id": 1}]
+    assert stats["completed"] == 1
+    assert stats["latency_ewma"] < 0.2
+
+
+def test_transient_failure_is_retried(local_server, logger):
+    from aiohttp import web
+
+    calls = []
+
+    async def flaky(request):
+        calls.append(request.path)
+        if len(calls) == 1:
+            return web.json_response({"message": "unavailable"}, status=500)
+        return web.json_response([{"id": 1}])
+
+    async def run():
+        config = {"logger": logger, "max_concurrent_requests": 1, "retry_attempts": 2}
+        async with local_server({"/flaky": flaky}) as base_url:
+            processor = HttpRequestProcessor(config, [f"{base_url}flaky"], {}, records)
+            processor.retry_policy.backoff_base = 0.01
+            return await processor.make_requests(config, result_format="records")
+
+    assert asyncio.run(run()) == [{"id": 1}]
+    assert calls == ["/flaky", "/flaky"]
+
+
+def test_retry_after_wait_releases_the_concurrency_slot(local_server, logger):
+    from aiohttp import web
+
+    handled = []
+
+    async def throttled(request):
+        handled.append(("throttled", asyncio.get_running_loop().time()))
+        if len(handled) == 1:
+            return web.json_response({"message": "slow down"}, status=429, headers={"Retry-After": "1"})
+        return web.json_response([{"id": 1}])
+
+    async def other(request):
+        handled.append(("other", asyncio.get_running_loop().time()))
+        return web.json_response([{"id": 2}])
+
+    async def run():
+        config = {"logger": logger, "max_concurrent_requests": 1, "retry_attempts": 1}
+        async with local_server({"/throttled": throttled, "/other": other}) as base_url:
+            processor = HttpRequestProcessor(config, [f"{base_url}throttled", f"{base_url}other"], {}, records)
+            return await processor.make_requests(config, result_format="records")
+
+    assert asyncio.run(run()) == [{"id": 1}, {"id": 2}]
+    # The other request used the only slot while the throttled one waited out Retry-After
+    assert [name for name, _ in handled] == ["throttled", "other", "throttled"]
+    assert handled[2][1] - handled[0][1] >= 1.0
+
+
+def test_processing_pool_shutdown_does_not_block_the_event_loop(local_server, logger):
+    import time
+    from aiohttp import ClientResponseError, web
+
+    async def slow(request):
+        return web.json_response([{"id": 1}])
+
+    async def broken(request):
+        await asyncio.sleep(0.05)
+        return web.json_response({"message": "bad request"}, status=400)
+
+    def blocking_processor(config, response):
+        time.sleep(0.5)
+        return response
+
+    async def run():
+        config = {"logger": logger, "max_concurrent_requests": 2, "processing_mode": "thread"}
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        async with local_server({"/slow": slow, "/broken": broken}) as base_url:
+            processor = HttpRequestProcessor(config, [f"{base_url}slow", f"{base_url}broken"], {}, blocking_processor)
+            ticking = asyncio.create_task(ticker())
+            with pytest.raises(ClientResponseError):
+                await processor.make_requests(config, result_format="records")
+            ticking.cancel()
+        return ticks
+
+    # The failed request ends the run while the processor thread is still busy; waiting for it must not stall the loop
+    assert asyncio.run(run()) >= 20
+
+
+def test_stream_requests_yields_fixed_size_batches(local_server, logger):
+    from aiohttp import web
+
+    async def items(request):
+        page = int(request.match_info["page"])
+        return web.json_response([{"id": page * 10}, {"id": page * 10 + 1}])
+
+    async def run():
+        config = {"logger": logger, "max_concurrent_requests": 2}
+        async with local_server({"/items/{page}": items}) as base_url:
+            processor = HttpRequestProcessor(config, [f"{base_url}items/{page}" for page in range(4)], {}, records)
+            return [batch async for batch in processor.stream_requests(config, batch_size=3)]
+
+    batches = asyncio.run(run())
+    assert [len(batch) for batch in batches] == [3, 3, 2]
+    assert sorted(record["id"] for batch in batches for record in batch) == [0, 1, 10, 11, 20, 21, 30, 31]
+
+
+def test_requests_to_sink_collects_failures(local_server, logger):
+    from aiohttp import web
+
+    async def items(request):
+        return web.json_response([{"id": 1}])
+
+    async def missing(request):
+        return web.json_response({"message": "not found"}, status=404)
+
+    async def run():
+        config = {"logger": logger, "max_concurrent_requests": 2}
+        written = []
+        async with local_server({"/items": items, "/missing": missing}) as base_url:
+            processor = HttpRequestProcessor(config, [f"{base_url}items", f"{base_url}missing"], {}, records)
+            record_count = await processor.make_requests_to_sink(config, written.extend, collect_failures=True)
+        return record_count, written, processor.failed_requests
+
+    record_count, written, failed_requests = asyncio.run(run())
+    assert (record_count, written) == (1, [{"id": 1}])
+    assert [(failure["url"].rsplit("/", 1)[1], failure["status"]) for failure in failed_requests] == [("missing", 404)]
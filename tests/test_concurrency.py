@@ -0,0 +1,139 @@
+import asyncio
+from pathlib import Path
+
+from modules.config_loader import SensitiveDict
+from modules.request_handler import concurrency
+from modules.request_handler.concurrency import FairDomainLimiter
+from modules.request_handler.export_job import ExportJob
+from modules.request_handler.scheduler import ExportScheduler
+
+
+async def settle():
+    """Let every ready task run until it blocks."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_free_slots_go_to_waiting_jobs_in_turn():
+    async def run():
+        limiter = FairDomainLimiter(max_concurrent=1)
+        grants = []
+
+        async def request(job_id):
+            await limiter.acquire("qtest", job_id)
+            grants.append(job_id)
+            limiter.release("qtest")
+
+        await limiter.acquire("qtest", "setup")
+        tasks = [asyncio.create_task(request(job_id)) for job_id in ("a", "a", "a", "b", "c")]
+        await settle()
+        assert limiter.stats() == {"qtest": {"in_flight": 1, "waiting": 5}}
+        limiter.release("qtest")
+        await asyncio.gather(*tasks)
+        return grants, limiter.stats()
+
+    grants, stats = asyncio.run(run())
+    # Job a queued three requests first, but b and c each get a turn before its second one
+    assert grants == ["a", "b", "c", "a", "a"]
+    assert stats == {"qtest": {"in_flight": 0, "waiting": 0}}
+
+
+def test_domains_are_limited_independently():
+    async def run():
+        limiter = FairDomainLimiter(max_concurrent=1)
+        await limiter.acquire("first", "a")
+        await asyncio.wait_for(limiter.acquire("second", "a"), timeout=1)
+        return limiter.stats()
+
+    assert asyncio.run(run()) == {"first": {"in_flight": 1, "waiting": 0}, "second": {"in_flight": 1, "waiting": 0}}
+
+
+def test_cancelled_waiter_does_not_keep_a_slot():
+    async def run():
+        limiter = FairDomainLimiter(max_concurrent=1)
+        await limiter.acquire("qtest", "a")
+        granted_then_cancelled = asyncio.create_task(limiter.acquire("qtest", "b"))
+        cancelled_while_waiting = asyncio.create_task(limiter.acquire("qtest", "c"))
+        await settle()
+
+        cancelled_while_waiting.cancel()
+        # The slot is handed to b, which is cancelled before it gets to run
+        limiter.release("qtest")
+        granted_then_cancelled.cancel()
+        await asyncio.gather(granted_then_cancelled, cancelled_while_waiting, return_exceptions=True)
+        assert limiter.stats() == {"qtest": {"in_flight": 0, "waiting": 0}}
+
+        await asyncio.wait_for(limiter.acquire("qtest", "d"), timeout=1)
+        return limiter.stats()
+
+    assert asyncio.run(run()) == {"qtest": {"in_flight": 1, "waiting": 0}}
+
+
+def test_token_bucket_limits_the_request_rate(monkeypatch):
+    class Clock:
+        now = 100.0
+
+        @classmethod
+        def monotonic(cls):
+            return cls.now
+
+    monkeypatch.setattr(concurrency, "time", Clock)
+
+    async def run():
+        limiter = FairDomainLimiter(max_concurrent=10, requests_per_second=2, burst=2)
+        await limiter.acquire("qtest", "a")
+        await limiter.acquire("qtest", "a")
+        # The burst is used up, so the third request waits for a token
+        waiting = asyncio.create_task(limiter.acquire("qtest", "a"))
+        await settle()
+        assert not waiting.done()
+
+        limiter.release("qtest")
+        await settle()
+        assert not waiting.done()
+
+        Clock.now += 0.5
+        limiter.release("qtest")
+        await settle()
+        assert waiting.done()
+        return limiter.stats()
+
+    assert asyncio.run(run()) == {"qtest": {"in_flight": 1, "waiting": 0}}
+
+
+def test_scheduler_shares_the_domain_limit_between_jobs(tmp_path, local_server, logger):
+    from aiohttp import web
+
+    in_flight = 0
+    most_in_flight = 0
+
+    async def test_cases(request):
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        # One short page per project
+        return web.json_response([{"id": int(request.match_info["project"]), "name": "case"}])
+
+    async def run():
+        async with local_server({"/api/v3/projects/{project}/test-cases": test_cases}) as base_url:
+            scheduler = ExportScheduler([], max_concurrent_per_domain=1)
+            for index, projects in enumerate(([111111, 222222], [333333])):
+                config = {
+                    "logger": logger,
+                    "qTest_domain": base_url,
+                    "target_projects": projects,
+                    "max_concurrent_requests": 4,
+                    "output_filetype": "csv",
+                    "output_path": str(tmp_path),
+                    "auth": SensitiveDict({"qTest_bearer_token": "Bearer test"}),
+                }
+                scheduler.jobs.append((Path(f"job{index}.yaml"), ExportJob(f"{index + 1}-job{index}", f"job{index}", config)))
+            return await scheduler.run()
+
+    report = asyncio.run(run())
+    assert most_in_flight == 1
+    assert report["jobs_succeeded"] == 2
+    assert [job["records_written"] for job in report["jobs"]] == [2, 1]
+    assert report["requests"] == sum(job["requests"] for job in report["jobs"]) == 3
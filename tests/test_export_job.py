@@ -0,0 +1,73 @@
+import asyncio
+import csv
+
+from modules.config_loader import SensitiveDict
+from modules.request_handler.export_job import JobRunner
+
+# Each project's test cases bring a property column the other project does not have
+PROJECT_CASES = {
+    "111111": [{"id": 1, "name": "login", "properties": [{"field_name": "Priority", "field_value": "High"}]}],
+    "222222": [{"id": 2, "name": "logout", "properties": [{"field_name": "Status", "field_value": "Ready"}]}],
+}
+
+
+def job_config(base_url, output_path, projects, logger):
+    return {
+        "logger": logger,
+        "qTest_domain": base_url,
+        "target_projects": projects,
+        "max_concurrent_requests": 2,
+        "output_filetype": "csv",
+        "output_path": str(output_path),
+        "auth": SensitiveDict({"qTest_bearer_token": "Bearer test"}),
+    }
+
+
+async def project_test_cases(request):
+    from aiohttp import web
+
+    project = request.match_info["project"]
+    if project not in PROJECT_CASES:
+        return web.json_response({"message": "not found"}, status=404)
+    return web.json_response(PROJECT_CASES[project] if request.query["page"] == "1" else [])
+
+
+def run_job(local_server, config_for):
+    async def run():
+        async with local_server({"/api/v3/projects/{project}/test-cases": project_test_cases}) as base_url:
+            runner = JobRunner(max_concurrent_requests=4)
+            job = runner.submit(config_for(base_url), "export")
+            snapshots = [snapshot async for snapshot in runner.events(job.job_id, interval=0.05)]
+            return job, snapshots
+
+    return asyncio.run(run())
+
+
+def test_job_exports_projects_with_different_properties_to_csv(tmp_path, local_server, logger):
+    job, snapshots = run_job(local_server, lambda base_url: job_config(base_url, tmp_path, [111111, 222222], logger))
+
+    assert job.state == "succeeded"
+    assert snapshots[-1]["records_written"] == 2
+    assert snapshots[-1]["projects_done"] == 2
+    with open(job.output_path, newline="", encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert [(row["id"], row["Priority"], row["Status"]) for row in rows] == [("1", "High", ""), ("2", "", "Ready")]
+
+
+def test_job_records_failed_projects_and_keeps_going(tmp_path, local_server, logger):
+    job, snapshots = run_job(local_server, lambda base_url: job_config(base_url, tmp_path, [999999, 111111], logger))
+
+    assert job.state == "failed"
+    assert job.records_written == 1
+    assert [error["project"] for error in snapshots[-1]["error_details"]] == [999999]
+
+
+def test_runner_cancels_a_queued_job(tmp_path, logger):
+    async def run():
+        runner = JobRunner(max_concurrent_requests=1)
+        job = runner.submit(job_config("https://example.invalid/", tmp_path, [111111], logger), "export")
+        cancelled = runner.cancel(job.job_id)
+        await asyncio.gather(job.task, return_exceptions=True)
+        return cancelled, job.state
+
+    assert asyncio.run(run()) == (True, "cancelled")
@@ -0,0 +1,62 @@
+import asyncio
+import sqlite3
+
+from modules.output_writer.writer_factory import create_writer
+from modules.request_handler.incremental_export import IncrementalExporter
+
+PROJECTS = {
+    "1": [{"id": 1, "last_modified_date": "2024-01-01T00:00:00Z"}],
+    "2": [{"id": 2, "last_modified_date": "2024-01-02T00:00:00Z", "Priority": "High"}],
+}
+
+
+def test_incremental_export_runs_twice_on_the_same_file(tmp_path, local_server, logger):
+    from aiohttp import web
+
+    async def project(request):
+        since = request.query.get("lastModifiedDate")
+        records = PROJECTS[request.match_info["project"]]
+        return web.json_response([record for record in records if not since or record["last_modified_date"].replace("Z", "+00:00") >= since])
+
+    async def export_twice():
+        config = {"logger": logger, "max_concurrent_requests": 2, "output_filetype": "sqlite"}
+        async with local_server({"/projects/{project}": project}) as base_url:
+            counts = []
+            for _ in range(2):
+                # The second run starts from a table that already has the Priority column
+                with create_writer(config, "cases", output_dir=tmp_path, key_columns=["id"]) as writer:
+                    exporter = IncrementalExporter(config, writer)
+                    project_urls = {project: f"{base_url}projects/{project}" for project in PROJECTS}
+                    counts.append(await exporter.export("test-cases", project_urls, {}, lambda config, response: response))
+                    exporter.close()
+            return counts
+
+    assert asyncio.run(export_twice()) == [2, 2]
+    connection = sqlite3.connect(tmp_path / "cases.sqlite")
+    rows = connection.execute('SELECT id, Priority FROM "cases" ORDER BY id').fetchall()
+    connection.close()
+    assert rows == [(1, None), (2, "High")]
+
+
+def test_watermark_is_the_newest_date_across_pages(tmp_path, local_server, logger):
+    from aiohttp import web
+    from modules.request_handler.pagination import PageSizePagination
+
+    # Newest first, so the last page written holds the oldest record
+    records = [{"id": i, "last_modified_date": f"2024-01-0{9 - i}T00:00:00Z"} for i in range(1, 4)]
+
+    async def project(request):
+        page = int(request.query["page"])
+        return web.json_response(records[page - 1:page])
+
+    async def export():
+        config = {"logger": logger, "max_concurrent_requests": 1, "output_filetype": "sqlite"}
+        async with local_server({"/projects/1": project}) as base_url:
+            with create_writer(config, "cases", output_dir=tmp_path, key_columns=["id"]) as writer:
+                exporter = IncrementalExporter(config, writer, strategy=PageSizePagination(page_size=1))
+                count = await exporter.export("test-cases", {"1": f"{base_url}projects/1"}, {}, lambda config, response: response)
+                watermark = exporter.watermark_store.get_watermark("1", "test-cases")
+                exporter.close()
+        return count, watermark
+
+    assert asyncio.run(export()) == (3, "2024-01-08T00:00:00+00:00")
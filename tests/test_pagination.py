@@ -0,0 +1,69 @@
+import asyncio
+
+from modules.request_handler.async_request_handler import HttpRequestProcessor
+from modules.request_handler.pagination import PageSizePagination
+
+
+def page_items(config, response):
+    return response["items"] if isinstance(response, dict) else response
+
+
+def crawl(local_server, logger, item_count, report_total):
+    from aiohttp import web
+
+    requested_pages = []
+
+    async def items(request):
+        page, size = int(request.query["page"]), int(request.query["size"])
+        requested_pages.append(page)
+        # Slow enough that idle workers would speculate past the end if allowed to
+        await asyncio.sleep(0.05)
+        page_records = [{"id": i} for i in range((page - 1) * size, min(page * size, item_count))]
+        return web.json_response({"total": item_count, "items": page_records} if report_total else page_records)
+
+    async def run():
+        config = {"logger": logger, "max_concurrent_requests": 4}
+        async with local_server({"/items": items}) as base_url:
+            processor = HttpRequestProcessor(config, [f"{base_url}items"], {}, page_items)
+            return await processor.make_paginated_requests(config, PageSizePagination(page_size=10), result_format="records")
+
+    records = asyncio.run(run())
+    assert [record["id"] for record in records] == list(range(item_count))
+    return sorted(requested_pages)
+
+
+def test_crawl_stops_handing_out_pages_after_a_short_page(local_server, logger):
+    assert crawl(local_server, logger, 25, report_total=False) == [1, 2, 3]
+
+
+def test_crawl_fetches_only_the_pages_of_a_reported_total(local_server, logger):
+    assert crawl(local_server, logger, 45, report_total=True) == [1, 2, 3, 4, 5]
+
+
+def test_reported_last_page_respects_page_cap():
+    strategy = PageSizePagination(page_size=10, max_pages=3)
+    assert strategy.reported_last_page({"total": 45, "items": []}) == 3
+    assert strategy.reported_last_page({"total": 0, "items": []}) == 1
+    assert strategy.reported_last_page([{"id": 1}]) is None
+
+
+def test_paginated_sink_receives_each_page_in_order(local_server, logger):
+    from aiohttp import web
+
+    async def items(request):
+        page, size = int(request.query["page"]), int(request.query["size"])
+        # Later pages answer first, so pages come back out of order
+        await asyncio.sleep(0.05 / page)
+        return web.json_response([{"id": i} for i in range((page - 1) * size, min(page * size, 45))])
+
+    async def run():
+        config = {"logger": logger, "max_concurrent_requests": 4}
+        batches = []
+        async with local_server({"/items": items}) as base_url:
+            processor = HttpRequestProcessor(config, [f"{base_url}items"], {}, page_items)
+            record_count = await processor.make_paginated_requests_to_sink(config, batches.append, PageSizePagination(page_size=10))
+        return record_count, batches
+
+    record_count, batches = asyncio.run(run())
+    assert record_count == 45
+    assert [[record["id"] for record in batch] for batch in batches] == [list(range(start, min(start + 10, 45))) for start in range(0, 45, 10)]
@@ -0,0 +1,67 @@
+import asyncio
+import sqlite3
+
+from modules.request_handler.async_request_handler import HttpRequestProcessor
+from modules.request_handler.response_cache import ResponseCache
+
+
+def records(config, response):
+    return response
+
+
+def fetch_twice(local_server, logger, cache, handler):
+    async def run():
+        config = {"logger": logger, "max_concurrent_requests": 1}
+        results = []
+        async with local_server({"/items": handler}) as base_url:
+            for _ in range(2):
+                processor = HttpRequestProcessor(config, [f"{base_url}items"], {"Authorization": "Bearer test"}, records, response_cache=cache)
+                results.append(await processor.make_requests(config, result_format="records"))
+        return results
+
+    return asyncio.run(run())
+
+
+def test_fresh_entry_is_served_without_a_request(tmp_path, local_server, logger):
+    from aiohttp import web
+
+    calls = []
+
+    async def items(request):
+        calls.append(request.path)
+        return web.json_response([{"id": 1}])
+
+    with ResponseCache(tmp_path / "cache.sqlite", ttl=60) as cache:
+        assert fetch_twice(local_server, logger, cache, items) == [[{"id": 1}], [{"id": 1}]]
+    assert calls == ["/items"]
+
+
+def test_stale_entry_is_revalidated_with_its_etag(tmp_path, local_server, logger):
+    from aiohttp import web
+
+    validators = []
+
+    async def items(request):
+        validators.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response([{"id": 1}], headers={"ETag": '"v1"'})
+
+    with ResponseCache(tmp_path / "cache.sqlite", ttl=0) as cache:
+        assert fetch_twice(local_server, logger, cache, items) == [[{"id": 1}], [{"id": 1}]]
+    assert validators == [None, '"v1"']
+
+
+def test_eviction_keeps_the_running_total_in_step_with_the_table(tmp_path):
+    cache_path = tmp_path / "cache.sqlite"
+    with ResponseCache(cache_path, max_size_bytes=100) as cache:
+        for index in range(5):
+            cache.store(f"key-{index}", f"https://example.com/{index}", {"body": "x" * 20})
+        cache.store("key-4", "https://example.com/4", {"body": "y" * 20})
+        assert cache.get("key-0") is None
+        assert cache.get("key-4").load() == {"body": "y" * 20}
+
+        connection = sqlite3.connect(cache_path)
+        table_size = connection.execute("SELECT SUM(size) FROM responses").fetchone()[0]
+        connection.close()
+        assert cache._total_size == table_size <= 100
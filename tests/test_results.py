@@ -0,0 +1,44 @@
+import json
+import sqlite3
+
+from modules.output_writer.sqlite_writer import SqliteWriter
+from modules.request_handler.columnar_processor import ColumnarProcessor
+from modules.request_handler.results import as_records
+
+RESPONSE = [
+    {"id": 1, "links": [{"rel": "self", "href": "https://example.com/1"}], "properties": [{"field_name": "Priority", "field_value": "High"}]},
+    {"id": 2, "links": [], "properties": []},
+]
+
+
+def test_as_records_turns_dataframe_list_columns_into_lists():
+    records = as_records(ColumnarProcessor()({}, RESPONSE))
+
+    assert records == [
+        {"id": 1, "links": [{"rel": "self", "href": "https://example.com/1"}], "Priority": "High"},
+        {"id": 2, "links": [], "Priority": None},
+    ]
+    assert type(records[0]["links"]) is list
+
+
+def test_dataframe_list_columns_are_stored_as_json_in_sqlite(tmp_path):
+    output_path = tmp_path / "export.sqlite"
+    with SqliteWriter(output_path, table_name="export") as writer:
+        writer.write_batch(as_records(ColumnarProcessor()({}, RESPONSE)))
+
+    connection = sqlite3.connect(output_path)
+    rows = connection.execute('SELECT id, links FROM "export" ORDER BY id').fetchall()
+    connection.close()
+    assert [(row_id, json.loads(links)) for row_id, links in rows] == [(1, RESPONSE[0]["links"]), (2, [])]
+
+
+def test_numpy_values_are_normalized_by_writers(tmp_path):
+    import numpy as np
+
+    output_path = tmp_path / "export.sqlite"
+    with SqliteWriter(output_path, table_name="export") as writer:
+        writer.write_batch([{"id": np.int64(7), "tags": np.array([1, 2])}])
+
+    connection = sqlite3.connect(output_path)
+    assert connection.execute('SELECT id, tags FROM "export"').fetchone() == (7, "[1, 2]")
+    connection.close()
@@ -0,0 +1,54 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.config_loader import load_validation_plan
+
+RULES_PATH = PROJECT_ROOT / "configs" / "validation" / "config_rules.yaml"
+
+
+class JsonRequest:
+    """Minimal stand-in for a FastAPI Request carrying a JSON body."""
+
+    def __init__(self, body):
+        self.body = body
+
+    async def json(self):
+        return self.body
+
+
+@pytest.fixture
+def routes(monkeypatch):
+    """Import the UI routes from the project root, where their relative paths resolve."""
+    monkeypatch.chdir(PROJECT_ROOT)
+    from modules.UI import routes
+    return routes
+
+
+def test_errors_by_key_reports_wrongly_typed_value_under_its_key():
+    errors = load_validation_plan(RULES_PATH).errors_by_key({"max_concurrent_requests": "five"})
+
+    assert "max_concurrent_requests" in errors
+    assert "validate_int_range" in errors["max_concurrent_requests"][0]
+
+
+def test_run_returns_wrongly_typed_value_as_error():
+    errors = load_validation_plan(RULES_PATH).run({"max_concurrent_requests": "five"})
+
+    assert any("max_concurrent_requests" in error and "validate_int_range" in error for error in errors)
+
+
+def test_validate_form_reports_non_numeric_int_field(routes):
+    response = asyncio.run(routes.validate_form(JsonRequest({"values": {"max_concurrent_requests": "five", "output_filetype": "sqlite"}})))
+    body = json.loads(response.body)
+
+    assert response.status_code == 200
+    assert body["valid"] is False
+    assert "validate_int_range" in body["errors"]["max_concurrent_requests"][0]
+    assert "output_filetype" not in body["errors"]
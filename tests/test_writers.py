@@ -0,0 +1,62 @@
+import csv
+import sqlite3
+
+import pytest
+
+from modules.output_writer.csv_writer import CsvWriter
+from modules.output_writer.excel_writer import ExcelWriter
+from modules.output_writer.parquet_writer import ParquetWriter
+from modules.output_writer.sqlite_writer import SqliteWriter
+
+FIRST_BATCH = [{"id": 1, "name": "login"}, {"id": 2, "name": "logout"}]
+SECOND_BATCH = [{"id": 3, "name": "search", "Priority": "High"}]
+
+
+def write_two_batches(writer):
+    with writer:
+        writer.write_batch(FIRST_BATCH)
+        writer.write_batch(SECOND_BATCH)
+
+
+def test_csv_writer_adds_late_columns(tmp_path):
+    output_path = tmp_path / "export.csv"
+    write_two_batches(CsvWriter(output_path))
+
+    with open(output_path, newline="", encoding="utf-8") as file:
+        rows = list(csv.reader(file))
+    assert rows == [["id", "name", "Priority"], ["1", "login", ""], ["2", "logout", ""], ["3", "search", "High"]]
+
+
+def test_excel_writer_adds_late_columns(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    output_path = tmp_path / "export.xlsx"
+    write_two_batches(ExcelWriter(output_path))
+
+    workbook = openpyxl.load_workbook(output_path)
+    rows = list(workbook["export"].iter_rows(values_only=True))
+    workbook.close()
+    assert rows == [("id", "name", "Priority"), (1, "login", None), (2, "logout", None), (3, "search", "High")]
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+def test_parquet_writer_adds_late_columns(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output_path = tmp_path / "export.parquet"
+    write_two_batches(ParquetWriter(output_path))
+
+    assert pq.read_table(output_path).to_pylist() == [
+        {"id": 1, "name": "login", "Priority": None},
+        {"id": 2, "name": "logout", "Priority": None},
+        {"id": 3, "name": "search", "Priority": "High"},
+    ]
+    assert list(tmp_path.iterdir()) == [output_path]
+
+
+def test_sqlite_writer_adds_late_columns(tmp_path):
+    output_path = tmp_path / "export.sqlite"
+    write_two_batches(SqliteWriter(output_path, table_name="export"))
+
+    connection = sqlite3.connect(output_path)
+    rows = connection.execute('SELECT id, name, Priority FROM "export" ORDER BY id').fetchall()
+    connection.close()
+    assert rows == [(1, "login", None), (2, "logout", None), (3, "search", "High")]